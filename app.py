@@ -11,13 +11,34 @@ from datetime import datetime
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from collections import Counter
-from flask import Flask, render_template, request, jsonify, Response, send_file, session, redirect
+from flask import Flask, render_template, request, jsonify, Response, send_file, session, redirect, g
 import io
 import math
 import numpy as np
 import pandas as pd
 import anthropic
+import artifacts
+import attorney_delta
 import ats_db
+import bio_store
+import data_access
+import data_snapshot
+import dna_matrix
+import hot_reload
+import startup
+import hiring_dna
+import jd_matcher
+import filter_index
+import firm_index
+import keyword_index
+import parallel_scoring
+import practice_terms
+import precompute
+import top_k
+import result_cache
+import result_sets
+import request_timing
+from hiring_dna import compute_all_hiring_dna
 
 import matplotlib
 matplotlib.use("Agg")
@@ -140,6 +161,7 @@ def _sanitize_for_json(obj):
 ANTHROPIC_API_KEY = os.environ.get("ANTHROPIC_API_KEY", "")
 CLAUDE_MODEL = "claude-haiku-4-5-20251001"
 SHORTLIST_SIZE = 15  # send fewer candidates for speed
+MAX_RESULTS = 25  # Quick Match candidates per /api/search response (more via /api/search/<id>/page)
 BIO_MAX_CHARS = 400  # compact bios
 
 CLAUDE_SYSTEM_PROMPT = """You are an expert legal recruiting analyst. Given a job description, hiring patterns, and candidates, tier and rank them.
@@ -181,10 +203,10 @@ Rules:
 # ---------------------------------------------------------------------------
 # Data loading – runs once on startup
 # ---------------------------------------------------------------------------
+# Datasets are read through data_snapshot: a typed Feather snapshot under
+# data/snapshots/ when it is newer than the CSV export, else the CSV itself
+# (attorneys.csv, falling back to attorneys_slim.csv).
 DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
-_ATTORNEY_CSV_FULL = os.path.join(DATA_DIR, "attorneys.csv")
-_ATTORNEY_CSV_SLIM = os.path.join(DATA_DIR, "attorneys_slim.csv")
-_ATTORNEY_CSV_PATH = _ATTORNEY_CSV_FULL if os.path.exists(_ATTORNEY_CSV_FULL) else _ATTORNEY_CSV_SLIM
 
 # Columns to load from the attorneys CSV. Heavy unused columns (attorneyBio,
 # matters, fullbio_with_tags, matters_with_tags, prior_experience_with_tags,
@@ -200,156 +222,202 @@ ATTORNEY_COLUMNS = {
     'location_secondary',
 }
 
-# Bio cache: {str(attorney_id): bio+matters string}
-# Populated in background thread at startup — instant lookups once ready.
-_attorney_bio_cache: dict = {}
-_attorney_bio_cache_ready = False
+# JAIDE_PRELOAD says how importing app.py runs the startup stages:
+#   "1"       all of them, in the importing thread (scripts, artifact builds)
+#   "shared"  set by gunicorn.conf.py: app.py is imported once in the gunicorn
+#             master, which binds its port only afterwards, so it runs the
+#             stages only while they read fresh snapshots and artifacts
+#             (artifacts.load_only()) and each forked worker runs whatever is
+#             left in the background (start_background_tasks() from
+#             post_fork); threads do not survive fork
+#   unset     every stage in a background thread
+PRELOAD_MODE = os.environ.get("JAIDE_PRELOAD", "")
+PRELOADED = PRELOAD_MODE == "1"
+
+# Bio store: bio + matters for every attorney, memory-mapped from
+# data/snapshots/attorney_bios.bin (see bio_store.py). Pages are shared
+# between workers through the OS page cache instead of a per-process dict.
+# Opened (and rebuilt if stale) by the "bios" startup stage.
+_attorney_bio_store = None
+
+
+def _load_attorney_bio_store():
+    """Open the memory-mapped bio store, rebuilding it first if the data changed."""
+    if not bio_store.store_is_fresh():
+        bio_store.build_store()
+    store = bio_store.open_store()
+    if store is None:
+        print("Warning: no attorney data, bio store not built")
+        return None
+    print(f"Attorney bio store ready: {len(store)} entries")
+    return store
 
 
-def _build_attorney_bio_cache():
-    """Load bio + matters for all attorneys into an in-memory dict (background thread)."""
-    global _attorney_bio_cache, _attorney_bio_cache_ready
-    if not os.path.exists(_ATTORNEY_CSV_PATH):
-        return
-    try:
-        df = pd.read_csv(_ATTORNEY_CSV_PATH, usecols=['id', 'attorneyBio', 'matters'], dtype=str)
-        cache = {}
-        for _, row in df.iterrows():
-            aid = str(row.get('id', '') or '').strip()
-            bio = str(row.get('attorneyBio', '') or '').strip()
-            matters = str(row.get('matters', '') or '').strip()
-            cache[aid] = (bio + (" " + matters if matters else "")).strip()
-        _attorney_bio_cache = cache
-        _attorney_bio_cache_ready = True
-        print(f"Attorney bio cache ready: {len(_attorney_bio_cache)} entries")
-    except Exception as e:
-        print(f"Warning: could not build attorney bio cache: {e}")
+def _open_attorney_bio_store():
+    global _attorney_bio_store
+    store = _load_attorney_bio_store()
+    if store is not None and _attorney_bio_updates:
+        store = bio_store.patch_store(store, _attorney_bio_updates)
+    if store is not None:
+        _attorney_bio_store = store
 
 
 def get_attorney_full_bio(attorney_id) -> str:
-    """Return bio + matters for an attorney. Uses in-memory cache (built at startup)."""
-    return _attorney_bio_cache.get(str(attorney_id), "")
+    """Return bio + matters for an attorney. Reads from the mmap'd bio store."""
+    store = _attorney_bio_store
+    return store.get(attorney_id) if store is not None else ""
 
 
 def load_attorneys():
-    path = _ATTORNEY_CSV_PATH
-    if not os.path.exists(path):
+    source = "snapshot" if data_snapshot.snapshot_is_fresh("attorneys") else "CSV"
+    print(f"Loading attorneys {source} (filtered columns)...")
+    df = data_snapshot.read_dataset("attorneys", columns=ATTORNEY_COLUMNS, compact=True)
+    if df is None:
         return pd.DataFrame()
-    print("Loading attorneys CSV (filtered columns)...")
-    df = pd.read_csv(
-        path,
-        usecols=lambda c: c in ATTORNEY_COLUMNS,
-        dtype=str,
-        low_memory=False,
-    ).fillna("")
     mem_mb = df.memory_usage(deep=True).sum() / 1024 / 1024
     print(f"Attorneys DataFrame loaded: {len(df):,} rows, {len(df.columns)} columns, {mem_mb:.0f} MB")
     return df
 
-def load_hiring_history():
-    path = os.path.join(DATA_DIR, "hiring_history.csv")
-    if not os.path.exists(path):
-        return pd.DataFrame()
-    df = pd.read_csv(path, dtype=str).fillna("")
-    return df
 
-ATTORNEYS_DF = load_attorneys()
-threading.Thread(target=_build_attorney_bio_cache, daemon=True).start()
-HIRING_DF = load_hiring_history()
+def _apply_attorney_deltas(df, paths):
+    """Apply delta files (see attorney_delta.py) to a loaded attorney frame."""
+    delta = attorney_delta.read_delta(paths)
+    if delta.empty or df.empty:
+        return df, None
+    df, result = attorney_delta.apply_delta(df, delta)
+    print(f"Attorney deltas applied ({len(paths)} files): {attorney_delta.summary(result)}")
+    return df, result
 
-def load_jobs():
-    path = os.path.join(DATA_DIR, "jobs.csv")
-    if not os.path.exists(path):
-        return pd.DataFrame()
-    df = pd.read_csv(path, dtype=str, encoding="utf-8-sig").fillna("")
-    return df
+def load_hiring_history():
+    df = data_snapshot.read_dataset("hiring_history")
+    return df if df is not None else pd.DataFrame()
 
-JOBS_DF = load_jobs()
+def load_jobs():
+    df = data_snapshot.read_dataset("jobs")
+    return df if df is not None else pd.DataFrame()
 
 def load_firms():
-    path = os.path.join(DATA_DIR, "firms.csv")
-    if not os.path.exists(path):
-        return pd.DataFrame()
-    df = pd.read_csv(path, dtype=str, encoding="utf-8-sig").fillna("")
-    return df
+    df = data_snapshot.read_dataset("firms")
+    return df if df is not None else pd.DataFrame()
+
+# Datasets start empty and are filled by the startup stages below (see
+# startup.py); endpoints that need them answer 503 until they are loaded.
+ATTORNEYS_DF = pd.DataFrame()
+HIRING_DF = pd.DataFrame()
+JOBS_DF = pd.DataFrame()
+FIRMS_DF = pd.DataFrame()
+
+
+@startup.stage("firms", shared=True)
+def _load_firms_stage():
+    global FIRMS_DF
+    FIRMS_DF = load_firms()
+    data_access.init(firms_df=FIRMS_DF)
+
+
+@startup.stage("jobs", shared=True)
+def _load_jobs_stage():
+    global JOBS_DF
+    JOBS_DF = load_jobs()
+    data_access.init(jobs_df=JOBS_DF)
+
+
+# Bio text of attorneys changed by delta files, overlaid on the bio store
+_attorney_bio_updates = {}
+
+
+@startup.stage("attorneys", shared=True)
+def _load_attorneys_stage():
+    global ATTORNEYS_DF, _attorney_bio_updates
+    df, result = _apply_attorney_deltas(load_attorneys(), attorney_delta.delta_files())
+    _attorney_bio_updates = result["bios"] if result else {}
+    ATTORNEYS_DF = df
+    data_access.init(attorneys_df=ATTORNEYS_DF)
 
-FIRMS_DF = load_firms()
+
+startup.stage("bios", shared=True)(_open_attorney_bio_store)
+
+
+def _load_firm_index(hiring_df):
+    key = artifacts.fingerprint(hiring_df.get("Firm"), sorted(_FIRM_NOISE))
+    return firm_index.FirmIndex(artifacts.load_or_build("firm_index", key, lambda: _build_firm_index(hiring_df)))
+
+
+@startup.stage("hiring", shared=True)
+def _load_hiring_stage():
+    global HIRING_DF, FIRM_INDEX
+    df = load_hiring_history()
+    FIRM_INDEX = _load_firm_index(df)
+    HIRING_DF = df
 
 # ---------------------------------------------------------------------------
 # Hiring DNA — pre-computed hiring pattern profiles for every firm
 # ---------------------------------------------------------------------------
 
-def compute_all_hiring_dna(hiring_df, min_hires=5):
-    """Compute a Hiring DNA profile for every firm with enough hiring data."""
-    if hiring_df.empty:
-        return {}
-    firm_counts = hiring_df["Firm"].value_counts()
-    eligible = firm_counts[firm_counts >= min_hires].index.tolist()
-    dna = {}
-    for firm_name in eligible:
-        fh = hiring_df[hiring_df["Firm"] == firm_name]
-        total = len(fh)
-
-        # Feeder schools
-        schools = fh["Law School"].value_counts().head(15)
-        feeder_schools = [{"school": s, "hires": int(c), "pct": round(c / total, 3)}
-                          for s, c in schools.items() if s]
-
-        # Feeder firms (law firm laterals only)
-        lf_hires = fh[fh["Previous Entity Type"] == "Law Firm"]
-        firms_from = lf_hires["Moved From"].value_counts().head(15)
-        feeder_firms = [{"firm": f, "hires": int(c), "pct": round(c / len(lf_hires) if len(lf_hires) else 0, 3)}
-                        for f, c in firms_from.items() if f]
-
-        # Practice areas (comma-separated, explode)
-        pa_series = fh["Practice Areas New"].str.split(",").explode().str.strip()
-        pa_series = pa_series[pa_series != ""]
-        pa_counts = pa_series.value_counts()
-        practice_areas = [{"area": a, "hires": int(c), "pct": round(c / total, 3)}
-                          for a, c in pa_counts.items()]
-
-        # Specialties (comma-separated, explode)
-        sp_series = fh["Specialties New"].str.split(",").explode().str.strip()
-        sp_series = sp_series[sp_series != ""]
-        sp_counts = sp_series.value_counts()
-        specialties = [{"specialty": s, "hires": int(c)} for s, c in sp_counts.head(20).items()]
-
-        # Class year range
-        cy = pd.to_numeric(fh["Class Year"], errors="coerce").dropna()
-        if len(cy) >= 3:
-            cy_range = {"min": int(cy.quantile(0.1)), "max": int(cy.quantile(0.9)),
-                        "median": int(cy.median())}
-        elif len(cy) > 0:
-            cy_range = {"min": int(cy.min()), "max": int(cy.max()), "median": int(cy.median())}
-        else:
-            cy_range = {"min": 2010, "max": 2024, "median": 2018}
+# compute_all_hiring_dna() lives in hiring_dna.py (single grouped pass)
+HIRING_DNA = {}
 
-        # Hiring locations
-        loc_groups = fh.groupby(["City", "State"]).size().sort_values(ascending=False)
-        hiring_locations = [{"location": city, "state": state, "hires": int(cnt)}
-                            for (city, state), cnt in loc_groups.head(15).items() if city]
 
-        # Title distribution
-        title_dist = fh["Title"].value_counts().to_dict()
-        title_distribution = {k: int(v) for k, v in title_dist.items() if k}
+def _load_hiring_dna(hiring_df):
+    inputs = hiring_df[[c for c in hiring_dna.DNA_COLUMNS if c in hiring_df.columns]]
+    key = artifacts.fingerprint(inputs, hiring_dna.DNA_VERSION)
+    return artifacts.load_or_build("hiring_dna", key, lambda: compute_all_hiring_dna(hiring_df))
 
-        dna[firm_name] = {
-            "firm_name": firm_name,
-            "total_hires": total,
-            "feeder_schools": feeder_schools,
-            "feeder_firms": feeder_firms,
-            "practice_areas": practice_areas,
-            "specialties": specialties,
-            "class_year_range": cy_range,
-            "hiring_locations": hiring_locations,
-            "title_distribution": title_distribution,
-        }
-    return dna
 
-HIRING_DNA = compute_all_hiring_dna(HIRING_DF)
+@startup.stage("hiring_dna", shared=True)
+def _load_hiring_dna_stage():
+    global HIRING_DNA
+    HIRING_DNA = _load_hiring_dna(HIRING_DF)
+
+
+# Attorney columns encoded for scoring many firms' Hiring DNA at once, over
+# ATTORNEYS_DF row positions (dna_matrix.py). Built by the "dna_matrix"
+# stage; firm scoring runs the pandas path until then.
+ATTORNEY_DNA_MATRIX = None
+
+_DNA_MATRIX_INPUTS = ("lawSchool", "firm_name", "location", "graduationYear",
+                      "prior_experience", "practice_areas", "specialty")
+
+
+def _dna_patterns(hiring_dna):
+    """Every substring a firm's Hiring DNA searches the text columns for (see _firm_dna_weights)."""
+    prior, areas, specialties = set(), set(), set()
+    for firm_name, dna in hiring_dna.items():
+        weights = _firm_dna_weights(dna, firm_name)
+        prior.update(weights["prior"])
+        prior.add(weights["firm"])
+        areas.update(weights["practice_areas"])
+        specialties.update(weights["specialty"])
+    return {"prior": sorted(prior), "practice_areas": sorted(areas), "specialty": sorted(specialties)}
+
+
+def _load_dna_matrix(attorneys_df, hiring_dna):
+    inputs = attorneys_df[[c for c in _DNA_MATRIX_INPUTS if c in attorneys_df.columns]]
+    patterns = _dna_patterns(hiring_dna)
+    matrix = artifacts.load_or_build(
+        "dna_matrix", artifacts.fingerprint(inputs, sorted(patterns.items()), "v1"),
+        lambda: dna_matrix.build(_dna_feature_columns(attorneys_df), patterns))
+    matrix.frame = attorneys_df
+    return matrix
+
+
+def _dna_matrix_for(frame):
+    """The DNA matrix if it was built for this frame, else None."""
+    matrix = ATTORNEY_DNA_MATRIX
+    if matrix is None or matrix.frame is not frame or not frame.index.equals(pd.RangeIndex(len(frame))):
+        return None
+    return matrix
+
+
+@startup.stage("dna_matrix", shared=True)
+def _load_dna_matrix_stage():
+    global ATTORNEY_DNA_MATRIX
+    ATTORNEY_DNA_MATRIX = _load_dna_matrix(ATTORNEYS_DF, HIRING_DNA)
+
 
 # Cache for top-candidate results (firm_name → list of candidate dicts)
 _top_candidates_cache = {}
+TOP_CANDIDATES_LIMIT = 50
 
 
 def _rank_points(rank, tiers):
@@ -360,73 +428,100 @@ def _rank_points(rank, tiers):
     return 0
 
 
-def score_candidates_for_firm(firm_name):
-    """Score all attorneys against a firm's Hiring DNA using vectorized pandas.
-    Returns a list of top 50 candidate dicts sorted by score descending."""
-    dna = HIRING_DNA.get(firm_name)
-    if not dna or ATTORNEYS_DF.empty:
-        return []
-
-    df = ATTORNEYS_DF.copy()
-
-    # Pre-compute sets/lists from DNA for fast lookup
+def _dna_ranks(dna):
+    """Rank lookups from a firm's DNA: (school → rank, lower-cased feeder firm → rank)."""
     school_list = [s["school"] for s in dna["feeder_schools"]]
-    school_set = set(school_list)
-    school_rank = {s: i for i, s in enumerate(school_list)}
-
     firm_list = [f["firm"] for f in dna["feeder_firms"]]
-    firm_set = set(f.lower() for f in firm_list)
-    firm_rank = {f.lower(): i for i, f in enumerate(firm_list)}
+    return ({s: i for i, s in enumerate(school_list)},
+            {f.lower(): i for i, f in enumerate(firm_list)})
 
-    pa_list = [p["area"] for p in dna["practice_areas"]]
-    pa_set = set(a.lower() for a in pa_list)
-    pa_rank = {a.lower(): i for i, a in enumerate(pa_list)}
 
-    spec_set = set(s["specialty"].lower() for s in dna["specialties"])
+# Points by rank in the DNA lists: [(max rank, points), ...]
+_SCHOOL_TIERS = [(0, 30), (2, 22), (4, 15), (9, 10), (14, 5)]
+_CURRENT_FIRM_TIERS = [(0, 25), (2, 18), (4, 12), (9, 8), (14, 4)]
+_PRIOR_FIRM_TIERS = [(0, 12), (2, 9), (4, 6), (9, 4), (14, 2)]
+_PRACTICE_AREA_TIERS = [(0, 20), (2, 15), (4, 10), (99, 5)]
 
+
+def _firm_dna_weights(dna, firm_name):
+    """A firm's DNA as points per attorney value / pattern (see score_candidates_for_firm).
+
+    school and current_firm are matched exactly against the normalized
+    columns (_dna_feature_columns); prior, practice_areas, specialty and
+    location are substrings searched for in them.
+    """
+    school_rank, firm_rank = _dna_ranks(dna)
+    pa_rank = {p["area"].lower(): i for i, p in enumerate(dna["practice_areas"])}
     cy_range = dna["class_year_range"]
-    cy_min, cy_max, cy_med = cy_range["min"], cy_range["max"], cy_range["median"]
 
-    loc_cities = set(l["location"].lower() for l in dna["hiring_locations"])
-    loc_states = set(l["state"].lower() for l in dna["hiring_locations"])
+    def points(ranks, tiers):
+        return {value: pts for value, rank in ranks.items() if (pts := _rank_points(rank, tiers))}
+
+    return {
+        "school": points(school_rank, _SCHOOL_TIERS),
+        "current_firm": points(firm_rank, _CURRENT_FIRM_TIERS),
+        "prior": points(firm_rank, _PRIOR_FIRM_TIERS),
+        "practice_areas": points(pa_rank, _PRACTICE_AREA_TIERS),
+        "specialty": sorted(set(s["specialty"].lower() for s in dna["specialties"])),
+        "class_year": (cy_range["min"], cy_range["max"], cy_range["median"]),
+        "location": sorted(set(l["location"].lower() for l in dna["hiring_locations"])),
+        "firm": firm_name.lower(),
+    }
+
+
+def _dna_feature_columns(df):
+    """The normalized attorney columns the Hiring DNA components compare against."""
+    blank = pd.Series("", index=df.index)
+    return {
+        "school": df["lawSchool"].fillna("").str.strip(),
+        "current_firm": df["firm_name"].fillna("").str.lower().str.strip(),
+        "location": df["location"].fillna("").str.lower(),
+        "class_year": data_snapshot.to_numeric(df["graduationYear"]),
+        "prior": df.get("prior_experience", blank).fillna("").str.lower(),
+        "practice_areas": df["practice_areas"].fillna("").str.lower(),
+        "specialty": df.get("specialty", blank).fillna("").str.lower(),
+    }
+
+
+def _firm_dna_components(dna, firm_name, df):
+    """Per-row DNA score components of df as int arrays (see score_candidates_for_firm).
+
+    "total" is their sum, zeroed for the firm's current attorneys;
+    "current_firm" is the current-firm part of "firm". ATTORNEY_DNA_MATRIX
+    computes the same components for many firms at once (dna_matrix.py).
+    """
+    weights = _firm_dna_weights(dna, firm_name)
+    cols = _dna_feature_columns(df)
+    cy_min, cy_max, cy_med = weights["class_year"]
 
     # --- 1. FEEDER SCHOOL (max 30) ---
-    school_col = df["lawSchool"].fillna("").str.strip()
-    school_pts = school_col.map(
-        lambda s: _rank_points(school_rank.get(s, 999),
-                               [(0, 30), (2, 22), (4, 15), (9, 10), (14, 5)])
-    ).fillna(0).astype(int)
+    school_pts = cols["school"].map(lambda s: weights["school"].get(s, 0)).fillna(0).astype(int)
 
     # --- 2. FEEDER FIRM — current (max 25) + prior (max 12) ---
-    current_firm_col = df["firm_name"].fillna("").str.lower().str.strip()
-    current_firm_pts = current_firm_col.map(
-        lambda f: _rank_points(firm_rank.get(f, 999),
-                               [(0, 25), (2, 18), (4, 12), (9, 8), (14, 4)])
-    ).fillna(0).astype(int)
+    current_firm_col = cols["current_firm"]
+    current_firm_pts = current_firm_col.map(lambda f: weights["current_firm"].get(f, 0)).fillna(0).astype(int)
 
-    prior_col = df.get("prior_experience", pd.Series("", index=df.index)).fillna("").str.lower()
+    prior_col = cols["prior"]
     prior_firm_pts = pd.Series(0, index=df.index)
-    for feeder_lower, rank in firm_rank.items():
+    for feeder_lower, pts in weights["prior"].items():
         mask = prior_col.str.contains(feeder_lower, regex=False, na=False)
-        pts = int(_rank_points(rank, [(0, 12), (2, 9), (4, 6), (9, 4), (14, 2)]))
         candidate_pts = mask.astype(int) * pts
         prior_firm_pts = prior_firm_pts.where(prior_firm_pts >= candidate_pts, candidate_pts)
 
     firm_pts = (current_firm_pts + prior_firm_pts).clip(upper=25)
 
     # --- 3. PRACTICE AREA (max 20) ---
-    pa_col = df["practice_areas"].fillna("").str.lower()
+    pa_col = cols["practice_areas"]
     pa_pts = pd.Series(0, index=df.index)
-    for area_lower, rank in pa_rank.items():
+    for area_lower, pts in weights["practice_areas"].items():
         mask = pa_col.str.contains(area_lower, regex=False, na=False)
-        pts = _rank_points(rank, [(0, 20), (2, 15), (4, 10), (99, 5)])
-        pa_pts += mask.astype(int) * int(pts)
+        pa_pts += mask.astype(int) * pts
     pa_pts = pa_pts.clip(upper=20)
 
     # --- 4. SPECIALTY MATCH (max 15) ---
-    spec_col = df.get("specialty", pd.Series("", index=df.index)).fillna("").str.lower()
+    spec_col = cols["specialty"]
     spec_count = pd.Series(0, index=df.index)
-    for spec in spec_set:
+    for spec in weights["specialty"]:
         spec_count += spec_col.str.contains(spec, regex=False, na=False).astype(int)
     spec_pts = pd.Series(0, index=df.index)
     spec_pts[spec_count >= 3] = 15
@@ -434,21 +529,21 @@ def score_candidates_for_firm(firm_name):
     spec_pts[(spec_count == 1) & (spec_pts == 0)] = 5
 
     # --- 5. CLASS YEAR FIT (max 5) ---
-    grad_yr = pd.to_numeric(df["graduationYear"], errors="coerce")
+    grad_yr = cols["class_year"]
     cy_pts = pd.Series(0, index=df.index)
     cy_pts[(grad_yr >= cy_min) & (grad_yr <= cy_max)] = 5
     cy_pts[(cy_pts == 0) & ((grad_yr - cy_med).abs() <= 2)] = 3
 
     # --- 6. LOCATION MATCH (max 5) ---
-    location_col = df["location"].fillna("").str.lower()
+    location_col = cols["location"]
     loc_pts = pd.Series(0, index=df.index)
-    for city in loc_cities:
+    for city in weights["location"]:
         loc_pts |= location_col.str.contains(city, regex=False, na=False).astype(int) * 5
     loc_pts = loc_pts.clip(upper=5)
 
     # --- 7. BOOMERANG (max 10) ---
     boom_pts = pd.Series(0, index=df.index)
-    fn_lower = firm_name.lower()
+    fn_lower = weights["firm"]
     boom_pts[prior_col.str.contains(fn_lower, regex=False, na=False)] = 10
 
     # Exclude attorneys currently at this firm
@@ -459,43 +554,46 @@ def score_candidates_for_firm(firm_name):
     total = (school_pts + firm_pts + pa_pts + spec_pts + cy_pts + loc_pts + boom_pts)
     total[at_firm_mask] = 0  # zero out current employees
 
-    # Build match reasons for top candidates
-    df["_dna_score"] = total
-    df["_school_pts"] = school_pts
-    df["_firm_pts"] = firm_pts
-    df["_pa_pts"] = pa_pts
-    df["_spec_pts"] = spec_pts
-    df["_cy_pts"] = cy_pts
-    df["_loc_pts"] = loc_pts
-    df["_boom_pts"] = boom_pts
+    parts = {"total": total, "school": school_pts, "firm": firm_pts, "current_firm": current_firm_pts,
+             "pa": pa_pts, "spec": spec_pts, "cy": cy_pts, "loc": loc_pts, "boom": boom_pts}
+    return {name: series.to_numpy(dtype=np.int64) for name, series in parts.items()}
 
-    # Filter to score > 0 and take top 50
-    result = df[total > 0].nlargest(50, "_dna_score")
 
-    candidates = []
-    for _, row in result.iterrows():
-        reasons = []
-        school = row.get("lawSchool", "").strip()
-        if school in school_set:
-            r = school_rank[school]
-            reasons.append(f"#{r+1} Feeder School" if r < 3 else "Feeder School")
-        cur_f = row.get("firm_name", "").lower().strip()
-        if cur_f in firm_set:
-            r = firm_rank[cur_f]
-            reasons.append(f"#{r+1} Feeder Firm" if r < 3 else "Feeder Firm")
-        elif row["_boom_pts"] > 0:
-            reasons.append("Boomerang")
-        elif row["_firm_pts"] > 0 and row["_firm_pts"] != current_firm_pts.get(row.name, 0):
-            reasons.append("Ex-Feeder Firm")
-        if row["_pa_pts"] > 0:
-            reasons.append("Practice Area Match")
-        if row["_spec_pts"] > 0:
-            reasons.append("Specialty Match")
-        if row["_loc_pts"] > 0:
-            reasons.append("Location Match")
-        if row["_cy_pts"] > 0:
-            reasons.append("Class Year Fit")
+def _firm_top_rows(components, limit):
+    """Row positions and components of the `limit` best rows with a positive total (ties in row order)."""
+    total = components["total"]
+    top = top_k.select(total, limit, np.flatnonzero(total > 0))
+    return top, {name: values[top] for name, values in components.items()}
 
+
+def score_candidates_for_firm(firm_name, attorneys_df=None, limit=TOP_CANDIDATES_LIMIT):
+    """Score all attorneys (or attorneys_df) against a firm's Hiring DNA using vectorized pandas.
+    Returns a list of the top `limit` candidate dicts sorted by score descending.
+
+    Scoring all of ATTORNEYS_DF uses ATTORNEY_DNA_MATRIX when it covers the
+    firm's DNA, else runs on SCORING_ENGINE's workers when it is enabled."""
+    dna = HIRING_DNA.get(firm_name)
+    if attorneys_df is None:
+        attorneys_df = ATTORNEYS_DF
+    if not dna or attorneys_df.empty:
+        return []
+
+    matrix = _dna_matrix_for(attorneys_df)
+    weights = _firm_dna_weights(dna, firm_name)
+    if matrix is not None and matrix.covers(weights):
+        [(positions, parts)] = matrix.top_rows([weights], limit)
+    elif attorneys_df is ATTORNEYS_DF and _parallel_scoring_for(attorneys_df, len(attorneys_df)):
+        positions, parts = _firm_top_rows_parallel(dna, firm_name, attorneys_df, limit)
+    else:
+        positions, parts = _firm_top_rows(_firm_dna_components(dna, firm_name, attorneys_df), limit)
+    return _firm_candidates(dna, attorneys_df, positions, parts)
+
+
+def _firm_candidates(dna, attorneys_df, positions, parts):
+    """Candidate dicts (with match reasons) for the rows at positions and their DNA components."""
+    ranks = _dna_ranks(dna)
+    candidates = []
+    for i, row in enumerate(attorneys_df.iloc[positions].to_dict("records")):
         candidates.append({
             "id": row.get("id", ""),
             "name": f"{row.get('first_name', '')} {row.get('last_name', '')}".strip(),
@@ -508,21 +606,52 @@ def score_candidates_for_firm(firm_name):
             "practice_areas": row.get("practice_areas", ""),
             "specialty": row.get("specialty", ""),
             "location": row.get("location", ""),
-            "match_score": int(row["_dna_score"]),
-            "match_reasons": reasons[:4],
-            "score_breakdown": {
-                "school": int(row["_school_pts"]),
-                "firm": int(row["_firm_pts"]),
-                "practice_area": int(row["_pa_pts"]),
-                "specialty": int(row["_spec_pts"]),
-                "class_year": int(row["_cy_pts"]),
-                "location": int(row["_loc_pts"]),
-                "boomerang": int(row["_boom_pts"]),
-            },
+            "match_score": int(parts["total"][i]),
+            "match_reasons": _dna_match_reasons(row, ranks, parts, i),
+            "score_breakdown": _dna_score_breakdown(parts, i),
         })
     return candidates
 
 
+def _dna_match_reasons(row, ranks, parts, i):
+    """Up to 4 match-reason labels for an attorney row scored with DNA components parts[...][i]."""
+    school_rank, firm_rank = ranks
+    reasons = []
+    school = row.get("lawSchool", "").strip()
+    if school in school_rank:
+        r = school_rank[school]
+        reasons.append(f"#{r+1} Feeder School" if r < 3 else "Feeder School")
+    cur_f = row.get("firm_name", "").lower().strip()
+    if cur_f in firm_rank:
+        r = firm_rank[cur_f]
+        reasons.append(f"#{r+1} Feeder Firm" if r < 3 else "Feeder Firm")
+    elif parts["boom"][i] > 0:
+        reasons.append("Boomerang")
+    elif parts["firm"][i] > 0 and parts["firm"][i] != parts["current_firm"][i]:
+        reasons.append("Ex-Feeder Firm")
+    if parts["pa"][i] > 0:
+        reasons.append("Practice Area Match")
+    if parts["spec"][i] > 0:
+        reasons.append("Specialty Match")
+    if parts["loc"][i] > 0:
+        reasons.append("Location Match")
+    if parts["cy"][i] > 0:
+        reasons.append("Class Year Fit")
+    return reasons[:4]
+
+
+def _dna_score_breakdown(parts, i):
+    return {
+        "school": int(parts["school"][i]),
+        "firm": int(parts["firm"][i]),
+        "practice_area": int(parts["pa"][i]),
+        "specialty": int(parts["spec"][i]),
+        "class_year": int(parts["cy"][i]),
+        "location": int(parts["loc"][i]),
+        "boomerang": int(parts["boom"][i]),
+    }
+
+
 def _resolve_dna_firm_name(name):
     """Resolve a firm name to its HIRING_DNA key (exact, then case-insensitive, then partial)."""
     if name in HIRING_DNA:
@@ -539,13 +668,101 @@ def _resolve_dna_firm_name(name):
 
 def get_top_candidates(firm_name):
     """Return cached top candidates for a firm, or compute and cache."""
+    # A reload swaps in a fresh cache; results computed against the old
+    # dataset land in the old (discarded) dict.
+    cache = _top_candidates_cache
     resolved = _resolve_dna_firm_name(firm_name)
     if not resolved:
         return []
-    if resolved in _top_candidates_cache:
-        return _top_candidates_cache[resolved]
+    if resolved in cache:
+        return cache[resolved]
     results = score_candidates_for_firm(resolved)
-    _top_candidates_cache[resolved] = results
+    cache[resolved] = results
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Best-fit firms — one attorney against every firm's Hiring DNA
+# ---------------------------------------------------------------------------
+BEST_FIT_FIRMS_LIMIT = 25
+_firm_tables_lock = threading.Lock()
+
+
+def _firm_dna_tables(matrix, hiring_dna):
+    """(firms, tables): every hiring_dna firm's weights as one set of matrix tables.
+
+    Built once per matrix and Hiring DNA (so once per dataset version and
+    delta) and kept on the matrix; firms the matrix does not cover are left
+    out.
+    """
+    with _firm_tables_lock:
+        cached = matrix.firm_tables
+        if cached is None or cached[0] is not hiring_dna:
+            weights = {f: _firm_dna_weights(dna, f) for f, dna in hiring_dna.items()}
+            firms = [f for f, w in weights.items() if matrix.covers(w)]
+            cached = matrix.firm_tables = (hiring_dna, firms, matrix.tables([weights[f] for f in firms]))
+        return cached[1:]
+
+
+def _attorney_dna_components(frame, hiring_dna, position):
+    """(firms, parts): the attorney at frame row position scored against every hiring_dna firm.
+
+    parts holds one int array per component, aligned with firms, as
+    _firm_dna_components() returns them for rows.
+    """
+    firms, parts = [], {name: [] for name in dna_matrix.PARTS}
+    remaining = list(hiring_dna)
+    matrix = _dna_matrix_for(frame)
+    if matrix is not None:
+        firms, tables = _firm_dna_tables(matrix, hiring_dna)
+        if firms:
+            scored = matrix.components(tables, np.array([position]))
+            parts = {name: [values[0].astype(np.int64)] for name, values in scored.items()}
+            covered = set(firms)
+            remaining = [f for f in remaining if f not in covered]
+    if remaining:
+        row = frame.iloc[[position]].reset_index(drop=True)
+        for firm_name in remaining:
+            for name, values in _firm_dna_components(hiring_dna[firm_name], firm_name, row).items():
+                parts[name].append(values)
+        firms = list(firms) + remaining
+    return firms, {name: np.concatenate(values) if values else np.zeros(0, dtype=np.int64)
+                   for name, values in parts.items()}
+
+
+def best_fit_firms(frame, hiring_dna, position, limit=BEST_FIT_FIRMS_LIMIT):
+    """The `limit` hiring_dna firms the attorney at frame row position fits best (score descending).
+
+    frame and hiring_dna are the caller's captured ATTORNEYS_DF and
+    HIRING_DNA, so a swap in between cannot pair the position with another
+    frame. Same seven components and scores as score_candidates_for_firm(),
+    so an attorney's score for a firm here is their match_score in that
+    firm's top candidates; the attorney's current firm scores 0 and is left
+    out.
+    """
+    firms, parts = _attorney_dna_components(frame, hiring_dna, position)
+    total = parts["total"]
+    order = top_k.select(total, limit, np.flatnonzero(total > 0))
+    row = frame.iloc[position].to_dict()
+    wanted = {firms[i].lower() for i in order}
+    fp_ids = {}
+    firms_df = FIRMS_DF
+    if not firms_df.empty:
+        for fp_id, name in zip(firms_df["FP ID"].astype(str), firms_df["Name"].fillna("").str.lower()):
+            if name in wanted:
+                fp_ids.setdefault(name, fp_id)
+    results = []
+    for i in order:
+        firm_name = firms[i]
+        dna = hiring_dna[firm_name]
+        results.append({
+            "firm_name": firm_name,
+            "fp_id": fp_ids.get(firm_name.lower()),
+            "total_hires": dna.get("total_hires", 0),
+            "match_score": int(total[i]),
+            "match_reasons": _dna_match_reasons(row, _dna_ranks(dna), parts, i),
+            "score_breakdown": _dna_score_breakdown(parts, i),
+        })
     return results
 
 
@@ -561,11 +778,16 @@ def _firm_words(name):
     tokens = re.split(r"[\s,&.]+", name.lower())
     return {t for t in tokens if t and t not in _FIRM_NOISE}
 
-# Build index: {canonical_name: word_set}
-FIRM_INDEX = {}
-if not HIRING_DF.empty:
-    for firm in HIRING_DF["Firm"].dropna().unique():
-        FIRM_INDEX[firm] = _firm_words(firm)
+def _build_firm_index(hiring_df):
+    """Build {canonical_name: word_set} for every firm in the hiring data."""
+    index = {}
+    if not hiring_df.empty:
+        for firm in hiring_df["Firm"].dropna().unique():
+            index[firm] = _firm_words(firm)
+    return index
+
+# Filled by the "hiring" startup stage (word → firm postings, see firm_index.py)
+FIRM_INDEX = firm_index.FirmIndex({})
 
 def fuzzy_match_firm(query):
     """Match a user-provided firm name against the hiring history firms.
@@ -574,35 +796,38 @@ def fuzzy_match_firm(query):
 
     Scoring: fraction of query words found in the candidate firm name,
     plus a bonus when candidate words appear in the query (bidirectional).
-    Picks the best match above a threshold.
+    Picks the best match above a threshold (0.6 forward / 0.4 backward,
+    at least 0.5); only firms sharing a word with the query are scored.
     """
     if not query or not FIRM_INDEX:
         return None, 0
+    return FIRM_INDEX.match(_firm_words(query))
 
-    query_words = _firm_words(query)
-    if not query_words:
-        return None, 0
 
-    best_firm = None
-    best_score = 0
+def _firm_window_fallback(text):
+    """Best fuzzy firm match among the 1–4 word windows of text, or "".
 
-    for firm, firm_words in FIRM_INDEX.items():
-        if not firm_words:
-            continue
-        # What fraction of the query words appear in the firm name?
-        forward = len(query_words & firm_words) / len(query_words)
-        # What fraction of the firm words appear in the query?
-        backward = len(query_words & firm_words) / len(firm_words)
-        # Combined score – weight forward higher (user typed it)
-        score = 0.6 * forward + 0.4 * backward
-        if score > best_score:
-            best_score = score
-            best_firm = firm
-
-    # Require at least 50% overlap to accept
-    if best_score >= 0.5:
-        return best_firm, best_score
-    return None, 0
+    Prioritizes matches near the start of the text (more likely to be the
+    hiring firm). A window joins its words with spaces, a delimiter, so its
+    significant words are the union of its words' — each word is tokenized
+    once instead of once per window.
+    """
+    index = FIRM_INDEX
+    words = text.split()
+    word_sets = [frozenset(_firm_words(w)) for w in words]
+    best_match = None
+    best_score = 0
+    best_pos = len(words)
+    for size in range(1, 5):
+        for i in range(len(words) - size + 1):
+            firm, score = index.match(frozenset().union(*word_sets[i:i + size]))
+            if firm and (score > best_score or (score == best_score and i < best_pos)):
+                best_score = score
+                best_match = " ".join(words[i:i + size])
+                best_pos = i
+    if best_match and best_score >= 0.5:
+        return best_match
+    return ""
 
 # ---------------------------------------------------------------------------
 # JD parsing helpers
@@ -643,39 +868,58 @@ def extract_firm_name(text):
             return m.group(1).strip()
 
     # 3. Fallback: slide a window over the text and fuzzy-match against known firms
-    #    Prioritize matches near the start of the text (more likely to be the hiring firm)
-    words = text.split()
-    best_match = None
-    best_score = 0
-    best_pos = len(words)
-    for size in range(1, 5):
-        for i in range(len(words) - size + 1):
-            window = " ".join(words[i:i + size])
-            firm, score = fuzzy_match_firm(window)
-            if firm and (score > best_score or (score == best_score and i < best_pos)):
-                best_score = score
-                best_match = window
-                best_pos = i
-    if best_match and best_score >= 0.5:
-        return best_match
-    return ""
+    return _firm_window_fallback(text)
+
+_LOCATION_CITIES = ["Boston", "New York", "San Francisco", "Chicago", "Los Angeles", "Washington",
+                     "Houston", "Dallas", "Austin", "Seattle", "Miami", "Atlanta", "Denver",
+                     "Philadelphia"]
+_LOCATION_STATES = ["Massachusetts", "MA", "New York", "NY", "California", "CA", "Illinois", "IL",
+                    "Texas", "TX", "Washington", "DC", "Florida", "FL", "Georgia", "GA",
+                    "Colorado", "CO", "Pennsylvania", "PA"]
+_STATE_MAP = {"MA": "Massachusetts", "NY": "New York", "CA": "California",
+              "IL": "Illinois", "TX": "Texas", "DC": "District of Columbia",
+              "FL": "Florida", "GA": "Georgia", "CO": "Colorado", "PA": "Pennsylvania"}
+_CITY_STATE_RE = re.compile(r"(" + "|".join(_LOCATION_CITIES) + r"),?\s*(" + "|".join(_LOCATION_STATES) + r")?",
+                            re.IGNORECASE)
+_STATE_AFTER_CITY_RE = re.compile(r",?\s*(" + "|".join(_LOCATION_STATES) + r")?", re.IGNORECASE)
+
+
+def _add_location(locations, seen, city, state):
+    city = city.strip()
+    state = state.strip() if state else ""
+    state = _STATE_MAP.get(state.upper(), state) if state else ""
+    key = city.lower()
+    if key not in seen:
+        seen.add(key)
+        locations.append((city, state))
+
+
+def _extract_location_regex(text):
+    seen = set()
+    locations = []
+    for city, state in _CITY_STATE_RE.findall(text):
+        _add_location(locations, seen, city, state)
+    return locations
+
 
 def extract_location(text):
-    """Extract all cities/states from JD. Returns a list of (city, state) tuples."""
-    state_map = {"MA": "Massachusetts", "NY": "New York", "CA": "California",
-                 "IL": "Illinois", "TX": "Texas", "DC": "District of Columbia",
-                 "FL": "Florida", "GA": "Georgia", "CO": "Colorado", "PA": "Pennsylvania"}
-    city_state = re.findall(r"(Boston|New York|San Francisco|Chicago|Los Angeles|Washington|Houston|Dallas|Austin|Seattle|Miami|Atlanta|Denver|Philadelphia),?\s*(Massachusetts|MA|New York|NY|California|CA|Illinois|IL|Texas|TX|Washington|DC|Florida|FL|Georgia|GA|Colorado|CO|Pennsylvania|PA)?", text, re.IGNORECASE)
+    """Extract all cities/states from JD. Returns a list of (city, state) tuples.
+
+    City hits come from the JD matcher; each is then extended by the state
+    pattern exactly as _CITY_STATE_RE.findall would, skipping hits inside
+    an earlier match.
+    """
+    if len(text.lower()) != len(text):
+        return _extract_location_regex(text)  # lower() moved the offsets
     seen = set()
     locations = []
-    for match in city_state:
-        city = match[0].strip()
-        state = match[1].strip() if match[1] else ""
-        state = state_map.get(state.upper(), state) if state else ""
-        key = city.lower()
-        if key not in seen:
-            seen.add(key)
-            locations.append((city, state))
+    pos = 0
+    for start, end in _JD_MATCHER.scan(text).cities:
+        if start < pos:
+            continue
+        m = _STATE_AFTER_CITY_RE.match(text, end)
+        _add_location(locations, seen, text[start:end], m.group(1))
+        pos = m.end()
     return locations
 
 CURRENT_YEAR = 2026
@@ -818,42 +1062,35 @@ def extract_title_level(text):
 
     return []  # no clear signal — don't filter
 
+_PRACTICE_AREA_KEYWORDS = {
+    "Fund Formation": ["fund formation", "fund structuring"],
+    "Private Equity": ["private equity"],
+    "Venture Capital": ["venture capital"],
+    "M&A": ["m&a", "mergers and acquisitions", "merger"],
+    "Corporate": ["corporate"],
+    "Tax": ["tax"],
+    "Litigation": ["litigation"],
+    "Investment Management": ["investment management", "investment adviser"],
+    "Real Estate": ["real estate"],
+    "IP": ["intellectual property", "patent", "trademark"],
+}
+
+_BAR_KEYWORDS = {
+    "Massachusetts": ["massachusetts bar", "admitted in massachusetts", "massachusetts"],
+    "New York": ["new york bar", "admitted in new york", "new york"],
+    "California": ["california bar", "admitted in california", "california"],
+}
+
+
 def extract_practice_area(text):
-    areas = {
-        "Fund Formation": ["fund formation", "fund structuring"],
-        "Private Equity": ["private equity"],
-        "Venture Capital": ["venture capital"],
-        "M&A": ["m&a", "mergers and acquisitions", "merger"],
-        "Corporate": ["corporate"],
-        "Tax": ["tax"],
-        "Litigation": ["litigation"],
-        "Investment Management": ["investment management", "investment adviser"],
-        "Real Estate": ["real estate"],
-        "IP": ["intellectual property", "patent", "trademark"],
-    }
-    text_lower = text.lower()
-    found = []
-    for area, keywords in areas.items():
-        for kw in keywords:
-            if kw in text_lower:
-                found.append(area)
-                break
-    return found
+    found = _JD_MATCHER.scan(text).found
+    return [area for area, keywords in _PRACTICE_AREA_KEYWORDS.items()
+            if any(kw in found for kw in keywords)]
 
 def extract_bar(text):
-    bars = {
-        "Massachusetts": ["massachusetts bar", "admitted in massachusetts", "massachusetts"],
-        "New York": ["new york bar", "admitted in new york", "new york"],
-        "California": ["california bar", "admitted in california", "california"],
-    }
-    text_lower = text.lower()
-    found = []
-    for state, keywords in bars.items():
-        for kw in keywords:
-            if kw in text_lower:
-                found.append(state)
-                break
-    return found
+    found = _JD_MATCHER.scan(text).found
+    return [state for state, keywords in _BAR_KEYWORDS.items()
+            if any(kw in found for kw in keywords)]
 
 # ---------------------------------------------------------------------------
 # Law school alias map — auto-generated from data + manual abbreviations
@@ -1007,9 +1244,26 @@ def _build_school_alias_map(attorneys_df):
     return alias_map
 
 
-_LAW_SCHOOL_ALIASES = _build_school_alias_map(ATTORNEYS_DF)
-# Pre-sort keys longest-first for matching priority
-_LAW_SCHOOL_SORTED_KEYS = sorted(_LAW_SCHOOL_ALIASES.keys(), key=len, reverse=True)
+_LAW_SCHOOL_ALIASES = {}
+_LAW_SCHOOL_SORTED_KEYS = []
+
+
+def _load_school_aliases(attorneys_df):
+    """Return (alias map, keys sorted longest-first for matching priority)."""
+    key = artifacts.fingerprint(attorneys_df.get("lawSchool"), sorted(_SCHOOL_STOPWORDS),
+                                sorted(_MANUAL_SCHOOL_ABBREVS.items()))
+    aliases = artifacts.load_or_build("school_aliases", key, lambda: _build_school_alias_map(attorneys_df))
+    return aliases, sorted(aliases.keys(), key=len, reverse=True)
+
+
+@startup.stage("school_aliases", shared=True)
+def _load_school_aliases_stage():
+    global _LAW_SCHOOL_ALIASES, _LAW_SCHOOL_SORTED_KEYS, _JD_MATCHER
+    aliases, sorted_keys = _load_school_aliases(ATTORNEYS_DF)
+    matcher = _build_jd_matcher(aliases, sorted_keys)
+    _LAW_SCHOOL_SORTED_KEYS = sorted_keys
+    _LAW_SCHOOL_ALIASES = aliases
+    _JD_MATCHER = matcher
 
 
 def extract_law_school(text):
@@ -1017,111 +1271,222 @@ def extract_law_school(text):
 
     Tries longest alias first so 'boston college' matches before 'boston'.
     Normalizes '&' / 'and' so 'washington and lee' matches 'washington & lee'.
+    Aliases match on word boundaries (the JD matcher's school hits).
     """
-    text_lower = text.lower()
-    # Normalize: also try with & ↔ and swap so user can type either form
-    text_and = text_lower.replace("&", "and")
-    text_amp = re.sub(r'\band\b', '&', text_lower)
-    for alias in _LAW_SCHOOL_SORTED_KEYS:
-        pattern = r'\b' + re.escape(alias) + r'\b'
-        if re.search(pattern, text_lower) or re.search(pattern, text_and) or re.search(pattern, text_amp):
-            return _LAW_SCHOOL_ALIASES[alias]
-    return ""
+    return _JD_MATCHER.scan(text).school or ""
+
+
+# JD keyword vocabulary: extract_keywords() picks these out of a JD and
+# keyword_index.py pre-indexes them over the attorney text.
+JD_KEYWORD_PHRASES = [
+    # Fund Formation / PE / VC
+    "fund formation", "private equity", "venture capital", "growth equity",
+    "hedge fund", "credit fund", "real estate fund",
+    "partnership agreement", "limited partnership", "LPA",
+    "side letter", "subscription agreement", "offering document",
+    "investor negotiation", "institutional investor",
+    "carried interest", "GP commitment", "management fee", "GP economics",
+    "co-investment", "secondary transaction",
+    "emerging manager", "first-time fund",
+    "fund structuring", "fund sponsor", "fund manager",
+    "investment management", "portfolio company",
+    "private investment fund", "registered investment adviser",
+    # M&A / Corporate
+    "M&A", "mergers and acquisitions", "leveraged buyout",
+    "securities offering", "capital markets",
+    "corporate governance", "joint venture", "due diligence",
+    "stock purchase", "asset purchase", "tender offer",
+    "proxy statement", "board advisory", "shareholder",
+    "purchase agreement", "merger agreement", "reorganization",
+    # Securities / Regulatory
+    "Investment Advisers Act", "Investment Company Act", "Securities Act",
+    "SEC compliance", "SEC examination", "regulatory compliance",
+    "securities regulation", "broker-dealer", "public offering", "IPO",
+    # Real Estate
+    "real estate", "commercial real estate", "real property",
+    "lease", "leasing", "commercial lease",
+    "mortgage", "CMBS", "real estate finance",
+    "zoning", "land use", "development", "construction",
+    "acquisition and disposition", "title", "easement",
+    "condominium", "cooperative", "mixed-use",
+    "real estate joint venture", "REIT",
+    "landlord", "tenant", "property management",
+    # Litigation
+    "litigation", "trial", "arbitration", "mediation",
+    "class action", "securities litigation", "commercial litigation",
+    "antitrust litigation", "product liability", "tort",
+    "discovery", "deposition", "motion practice",
+    "appellate", "white collar", "government investigation",
+    "insurance coverage", "employment litigation",
+    # Banking / Finance
+    "banking", "lending", "credit facility", "loan",
+    "leveraged finance", "syndicated loan", "asset-based lending",
+    "project finance", "structured finance", "securitization",
+    "debt financing", "mezzanine", "revolving credit",
+    # IP
+    "intellectual property", "patent", "trademark", "copyright",
+    "trade secret", "licensing", "IP litigation",
+    "patent prosecution", "patent litigation",
+    # Labor / Employment
+    "labor", "employment", "ERISA", "employee benefits",
+    "wage and hour", "discrimination", "workplace",
+    "NLRB", "collective bargaining", "OSHA",
+    # Tax
+    "tax", "tax planning", "tax controversy", "transfer pricing",
+    "state and local tax", "SALT", "international tax",
+    "tax-exempt", "partnership tax",
+    # Bankruptcy / Restructuring
+    "bankruptcy", "restructuring", "insolvency",
+    "chapter 11", "creditor", "debtor",
+    "distressed debt", "workout",
+    # Energy / Environmental
+    "energy", "environmental", "renewable energy",
+    "oil and gas", "power", "utilities", "clean energy",
+    "climate", "ESG", "sustainability",
+    # Healthcare
+    "healthcare", "health care", "FDA", "life sciences",
+    "pharmaceutical", "HIPAA", "medical device",
+    # Antitrust
+    "antitrust", "competition", "FTC", "DOJ",
+    "Hart-Scott-Rodino", "merger clearance",
+    # General
+    "regulatory", "compliance", "government contracts",
+    "international trade", "sanctions", "CFIUS",
+    "data privacy", "cybersecurity", "GDPR", "CCPA",
+    "executive compensation", "equity incentive",
+    "technology transactions", "SaaS", "cloud",
+    "pro bono",
+]
 
 
 def extract_keywords(text):
     """Pull substantive keywords from JD for scoring."""
-    keyword_phrases = [
-        # Fund Formation / PE / VC
-        "fund formation", "private equity", "venture capital", "growth equity",
-        "hedge fund", "credit fund", "real estate fund",
-        "partnership agreement", "limited partnership", "LPA",
-        "side letter", "subscription agreement", "offering document",
-        "investor negotiation", "institutional investor",
-        "carried interest", "GP commitment", "management fee", "GP economics",
-        "co-investment", "secondary transaction",
-        "emerging manager", "first-time fund",
-        "fund structuring", "fund sponsor", "fund manager",
-        "investment management", "portfolio company",
-        "private investment fund", "registered investment adviser",
-        # M&A / Corporate
-        "M&A", "mergers and acquisitions", "leveraged buyout",
-        "securities offering", "capital markets",
-        "corporate governance", "joint venture", "due diligence",
-        "stock purchase", "asset purchase", "tender offer",
-        "proxy statement", "board advisory", "shareholder",
-        "purchase agreement", "merger agreement", "reorganization",
-        # Securities / Regulatory
-        "Investment Advisers Act", "Investment Company Act", "Securities Act",
-        "SEC compliance", "SEC examination", "regulatory compliance",
-        "securities regulation", "broker-dealer", "public offering", "IPO",
-        # Real Estate
-        "real estate", "commercial real estate", "real property",
-        "lease", "leasing", "commercial lease",
-        "mortgage", "CMBS", "real estate finance",
-        "zoning", "land use", "development", "construction",
-        "acquisition and disposition", "title", "easement",
-        "condominium", "cooperative", "mixed-use",
-        "real estate joint venture", "REIT",
-        "landlord", "tenant", "property management",
-        # Litigation
-        "litigation", "trial", "arbitration", "mediation",
-        "class action", "securities litigation", "commercial litigation",
-        "antitrust litigation", "product liability", "tort",
-        "discovery", "deposition", "motion practice",
-        "appellate", "white collar", "government investigation",
-        "insurance coverage", "employment litigation",
-        # Banking / Finance
-        "banking", "lending", "credit facility", "loan",
-        "leveraged finance", "syndicated loan", "asset-based lending",
-        "project finance", "structured finance", "securitization",
-        "debt financing", "mezzanine", "revolving credit",
-        # IP
-        "intellectual property", "patent", "trademark", "copyright",
-        "trade secret", "licensing", "IP litigation",
-        "patent prosecution", "patent litigation",
-        # Labor / Employment
-        "labor", "employment", "ERISA", "employee benefits",
-        "wage and hour", "discrimination", "workplace",
-        "NLRB", "collective bargaining", "OSHA",
-        # Tax
-        "tax", "tax planning", "tax controversy", "transfer pricing",
-        "state and local tax", "SALT", "international tax",
-        "tax-exempt", "partnership tax",
-        # Bankruptcy / Restructuring
-        "bankruptcy", "restructuring", "insolvency",
-        "chapter 11", "creditor", "debtor",
-        "distressed debt", "workout",
-        # Energy / Environmental
-        "energy", "environmental", "renewable energy",
-        "oil and gas", "power", "utilities", "clean energy",
-        "climate", "ESG", "sustainability",
-        # Healthcare
-        "healthcare", "health care", "FDA", "life sciences",
-        "pharmaceutical", "HIPAA", "medical device",
-        # Antitrust
-        "antitrust", "competition", "FTC", "DOJ",
-        "Hart-Scott-Rodino", "merger clearance",
-        # General
-        "regulatory", "compliance", "government contracts",
-        "international trade", "sanctions", "CFIUS",
-        "data privacy", "cybersecurity", "GDPR", "CCPA",
-        "executive compensation", "equity incentive",
-        "technology transactions", "SaaS", "cloud",
-        "pro bono",
-    ]
-    text_lower = text.lower()
-    return [kw for kw in keyword_phrases if kw.lower() in text_lower]
+    found = _JD_MATCHER.scan(text).found
+    return [kw for kw in JD_KEYWORD_PHRASES if kw.lower() in found]
+
+
+def _build_jd_matcher(aliases, sorted_keys):
+    """JD matcher over the fixed vocabularies plus the school aliases (longest first)."""
+    substrings = [*JD_KEYWORD_PHRASES, *(kw for kws in _PRACTICE_AREA_KEYWORDS.values() for kw in kws),
+                  *(kw for kws in _BAR_KEYWORDS.values() for kw in kws)]
+    schools = [(alias, aliases[alias]) for alias in sorted_keys]
+    return jd_matcher.JDMatcher(substrings, _LOCATION_CITIES, schools)
+
+
+# Rebuilt with the school aliases by the "school_aliases" stage
+_JD_MATCHER = _build_jd_matcher({}, [])
 
 # ---------------------------------------------------------------------------
 # Scoring & tiering
 # ---------------------------------------------------------------------------
 
-def score_attorneys_vectorized(df, keywords, firm_patterns):
-    """Score all attorneys in df at once using vectorized pandas operations.
+def _flag_true(series):
+    """Boolean mask for a TRUE/FALSE flag column (bool dtype when compacted)."""
+    if pd.api.types.is_bool_dtype(series):
+        return series
+    return series.fillna("").astype(str).str.upper() == "TRUE"
+
+
+def _attorney_bio_text(df):
+    """Lower-cased bio/summary/matters/keywords text the keyword score searches."""
+    return (
+        df.get("attorneyBio", pd.Series("", index=df.index)).fillna("") + " " +
+        df.get("summary", pd.Series("", index=df.index)).fillna("") + " " +
+        df.get("matters", pd.Series("", index=df.index)).fillna("") + " " +
+        df.get("added_keywords", pd.Series("", index=df.index)).fillna("") + " " +
+        df.get("nlp_specialties", pd.Series("", index=df.index)).fillna("")
+    ).str.lower()
+
+
+def _attorney_spec_text(df):
+    """Lower-cased practice areas + specialty text."""
+    return (
+        df.get("practice_areas", pd.Series("", index=df.index)).fillna("") + " " +
+        df.get("specialty", pd.Series("", index=df.index)).fillna("")
+    ).str.lower()
+
+
+def _attorney_keyword_text(df):
+    """The combined text JD keywords are matched against (see keyword_index.py)."""
+    return _attorney_bio_text(df) + " " + _attorney_spec_text(df)
+
+
+# Inverted JD-keyword index over ATTORNEYS_DF row positions (keyword_index.py).
+# Built by the "keyword_index" startup stage; searches scan text until then.
+ATTORNEY_KEYWORD_INDEX = None
+
+
+def _load_keyword_index(attorneys_df):
+    text_cols = ["attorneyBio", "summary", "matters", "added_keywords", "nlp_specialties",
+                 "practice_areas", "specialty"]
+    inputs = attorneys_df[[c for c in text_cols if c in attorneys_df.columns]]
+    key = artifacts.fingerprint(inputs, JD_KEYWORD_PHRASES)
+    index = artifacts.load_or_build(
+        "keyword_index", key,
+        lambda: keyword_index.build(_attorney_keyword_text(attorneys_df), JD_KEYWORD_PHRASES))
+    index.frame = attorneys_df
+    return index
+
+
+def _keyword_index_for(frame):
+    """The keyword index if it was built for this frame (positions = frame rows), else None."""
+    index = ATTORNEY_KEYWORD_INDEX
+    if index is None or index.frame is not frame or not frame.index.equals(pd.RangeIndex(len(frame))):
+        return None
+    return index
+
+
+# Attorney × practice-area token matrix over ATTORNEYS_DF row positions
+# (practice_terms.py). Built by the "practice_terms" stage; searches run the
+# practice-area regex until then.
+ATTORNEY_PRACTICE_TERMS = None
+
+
+def _load_practice_terms(attorneys_df):
+    inputs = attorneys_df[[c for c in ("practice_areas", "specialty") if c in attorneys_df.columns]]
+    matrix = artifacts.load_or_build("practice_terms", artifacts.fingerprint(inputs, "v1"),
+                                     lambda: practice_terms.build(_attorney_spec_text(attorneys_df)))
+    matrix.frame = attorneys_df
+    return matrix
+
+
+def _practice_terms_for(frame):
+    """The practice-term matrix if it was built for this frame, else None."""
+    matrix = ATTORNEY_PRACTICE_TERMS
+    if matrix is None or matrix.frame is not frame or not frame.index.equals(pd.RangeIndex(len(frame))):
+        return None
+    return matrix
+
 
-    Returns a new DataFrame with only rows that meet the tier threshold (score >= 20),
-    sorted by match_score descending, with scoring columns added.
+@startup.stage("practice_terms", shared=True)
+def _load_practice_terms_stage():
+    global ATTORNEY_PRACTICE_TERMS
+    ATTORNEY_PRACTICE_TERMS = _load_practice_terms(ATTORNEYS_DF)
+
+
+@startup.stage("keyword_index", shared=True)
+def _load_keyword_index_stage():
+    global ATTORNEY_KEYWORD_INDEX
+    ATTORNEY_KEYWORD_INDEX = _load_keyword_index(ATTORNEYS_DF)
+
+
+# Columns score_attorneys_vectorized() reads; only these are gathered for the
+# rows being scored, the rest of a row is materialized for the top K alone
+_SCORING_COLUMNS = ["attorneyBio", "summary", "matters", "added_keywords", "nlp_specialties",
+                    "practice_areas", "specialty", "prior_experience", "firm_name", "lawSchool",
+                    "top_200", "vault_50", "clerkships", "raw_acknowledgements"]
+
+
+def score_attorneys_vectorized(df, keywords, firm_patterns, keyword_index=None, positions=None, limit=None,
+                               term_matrix=None):
+    """Score attorneys at once using vectorized operations.
+
+    Scores the rows of df at positions (every row when None) and returns
+    (result, total_matched): total_matched rows meet the tier threshold
+    (score >= 20), result holds the best `limit` of them (all when None),
+    sorted by match_score descending — equal scores in row order — with
+    scoring columns added. Scores are computed as NumPy arrays over the
+    scoring columns only; full rows are gathered for the result alone.
 
     With firm (100 pts total):
       - Contextual match   (50 pts) — JD keywords found in bio/summary/matters
@@ -1136,40 +1501,51 @@ def score_attorneys_vectorized(df, keywords, firm_patterns):
       - Practice area      (22 pts)
       - Credential bonus   (14 pts)
       - Patterns            (0 pts)
+
+    keyword_index (from _keyword_index_for) must index df — positions are
+    its row positions; keyword counts then come from its bitmaps instead of
+    scanning the text. Likewise term_matrix (from _practice_terms_for)
+    answers the practice-area term matches.
     """
-    if df.empty:
-        return df.iloc[0:0].copy()
+    matched, scores = _score_components(df, keywords, firm_patterns, keyword_index, positions, term_matrix)
+    top = top_k.select(scores["match_score"], limit)
+    result = _scored_frame(df, matched[top], {col: v[top] for col, v in scores.items()},
+                           bool(firm_patterns.get("matched_firm")))
+    return result, len(matched)
 
-    has_firm = bool(firm_patterns.get("matched_firm"))
 
-    # --- Build combined text columns once (vectorized string concat) ---
-    bio_col = (
-        df.get("attorneyBio", pd.Series("", index=df.index)).fillna("") + " " +
-        df.get("summary", pd.Series("", index=df.index)).fillna("") + " " +
-        df.get("matters", pd.Series("", index=df.index)).fillna("") + " " +
-        df.get("added_keywords", pd.Series("", index=df.index)).fillna("") + " " +
-        df.get("nlp_specialties", pd.Series("", index=df.index)).fillna("")
-    ).str.lower()
+def _score_components(df, keywords, firm_patterns, keyword_index=None, positions=None, term_matrix=None):
+    """The rows of score_attorneys_vectorized() that meet the threshold, unsorted.
 
-    spec_col = (
-        df.get("practice_areas", pd.Series("", index=df.index)).fillna("") + " " +
-        df.get("specialty", pd.Series("", index=df.index)).fillna("")
-    ).str.lower()
+    Returns (positions, scores): the matching row positions of df in
+    ascending order and {score column: int array aligned with them}.
+    """
+    positions = np.arange(len(df)) if positions is None else np.asarray(positions, dtype=np.int64)
+
+    has_firm = bool(firm_patterns.get("matched_firm"))
+    n = len(positions)
+    rows = df.iloc[positions, [df.columns.get_loc(c) for c in _SCORING_COLUMNS if c in df.columns]]
 
-    combined_col = bio_col + " " + spec_col
+    # --- Build combined text columns once (vectorized string concat) ---
+    spec_col = _attorney_spec_text(rows)
 
     # --- 1. Keyword match (0-50) ---
-    kw_count = pd.Series(0, index=df.index)
-    kw_matched_lists = pd.Series([[] for _ in range(len(df))], index=df.index)
-    for kw in keywords:
-        kw_lower = kw.lower()
-        mask = combined_col.str.contains(kw_lower, regex=False, na=False)
-        kw_count += mask.astype(int)
-        # Track which keywords matched for rationale (only for top candidates later)
+    kw_lowers = [kw.lower() for kw in keywords]
+    if keyword_index is not None:
+        kw_count, kw_lowers = keyword_index.count(kw_lowers, positions)
+        kw_count = np.asarray(kw_count, dtype=np.int64)
+    else:
+        kw_count = np.zeros(n, dtype=np.int64)
+    if kw_lowers and n:
+        # Keywords outside the index (or no index): scan the text. Not for an
+        # empty pool: Arrow cannot join its empty stand-in bio columns.
+        combined_col = _attorney_bio_text(rows) + " " + spec_col
+        for kw_lower in kw_lowers:
+            kw_count += combined_col.str.contains(kw_lower, regex=False, na=False).to_numpy(dtype=bool)
 
     kw_ratio = kw_count / max(len(keywords), 1)
     kw_max = 50 if has_firm else 64
-    kw_pts = (kw_ratio.clip(upper=1.0) * kw_max).round().astype(int)
+    kw_pts = np.round(np.minimum(kw_ratio, 1.0) * kw_max).astype(np.int64)
 
     # --- 2. Practice area overlap ---
     # Build PA terms from both keywords AND extracted practice areas
@@ -1181,83 +1557,166 @@ def score_attorneys_vectorized(df, keywords, firm_patterns):
         jd_pa_terms.update(pa.lower().split())
     num_jd_terms = max(len(jd_pa_terms), 1)
 
-    pa_count = pd.Series(0, index=df.index)
+    if term_matrix is not None:
+        pa_count, jd_pa_terms = term_matrix.count(jd_pa_terms, positions)
+    else:
+        pa_count = np.zeros(n, dtype=np.int64)
     for term in jd_pa_terms:
-        pa_count += spec_col.str.contains(r'(?:^|[\s,;/])' + re.escape(term) + r'(?:$|[\s,;/])',
-                                           regex=True, na=False).astype(int)
+        # Terms outside the matrix (or no matrix): whole-token regex over the text
+        pa_count += spec_col.str.contains(practice_terms.term_pattern(term),
+                                          regex=True, na=False).to_numpy(dtype=bool)
     pa_max = 14 if has_firm else 22
-    pa_pts = ((pa_count / num_jd_terms).clip(upper=1.0) * pa_max).round().astype(int)
+    pa_pts = np.round(np.minimum(pa_count / num_jd_terms, 1.0) * pa_max).astype(np.int64)
 
     # --- 3. Hiring pattern signals (0-28: firm 14 + school 10 + spec 4) ---
-    pattern_pts = pd.Series(0, index=df.index)
+    pattern_pts = np.zeros(n, dtype=np.int64)
 
     feeder_firms = firm_patterns.get("feeder_firms", [])
     if feeder_firms:
-        prior_col = df.get("prior_experience", pd.Series("", index=df.index)).fillna("").str.lower()
-        firm_col = df.get("firm_name", pd.Series("", index=df.index)).fillna("").str.lower()
-        feeder_mask = pd.Series(False, index=df.index)
+        prior_col = rows.get("prior_experience", pd.Series("", index=rows.index)).fillna("").str.lower()
+        firm_col = rows.get("firm_name", pd.Series("", index=rows.index)).fillna("").str.lower()
+        feeder_mask = np.zeros(n, dtype=bool)
         for feeder in feeder_firms:
             fl = feeder.lower()
-            feeder_mask |= prior_col.str.contains(fl, regex=False, na=False)
-            feeder_mask |= firm_col.str.contains(fl, regex=False, na=False)
-        pattern_pts += feeder_mask.astype(int) * 14
+            feeder_mask |= prior_col.str.contains(fl, regex=False, na=False).to_numpy(dtype=bool)
+            feeder_mask |= firm_col.str.contains(fl, regex=False, na=False).to_numpy(dtype=bool)
+        pattern_pts += feeder_mask * 14
 
     feeder_schools = set(firm_patterns.get("feeder_schools", []))
     if feeder_schools:
-        school_col = df.get("lawSchool", pd.Series("", index=df.index)).fillna("").str.strip()
-        pattern_pts += school_col.isin(feeder_schools).astype(int) * 10
+        school_col = rows.get("lawSchool", pd.Series("", index=rows.index)).fillna("").str.strip()
+        pattern_pts += school_col.isin(feeder_schools).to_numpy(dtype=bool) * 10
 
     top_specialties = firm_patterns.get("top_specialties", [])
     if top_specialties:
-        spec_mask = pd.Series(False, index=df.index)
+        spec_mask = np.zeros(n, dtype=bool)
         for spec in top_specialties:
-            spec_mask |= spec_col.str.contains(spec.lower(), regex=False, na=False)
-        pattern_pts += spec_mask.astype(int) * 4
+            spec_mask |= spec_col.str.contains(spec.lower(), regex=False, na=False).to_numpy(dtype=bool)
+        pattern_pts += spec_mask * 4
 
-    pattern_pts = pattern_pts.clip(upper=28)
+    pattern_pts = np.minimum(pattern_pts, 28)
 
     # --- 4. Credential bonus (0-8) ---
-    cred_pts = pd.Series(0, index=df.index)
-    if "top_200" in df.columns:
-        cred_pts += (df["top_200"].fillna("").str.upper() == "TRUE").astype(int) * 3
-    if "vault_50" in df.columns:
-        cred_pts += (df["vault_50"].fillna("").str.upper() == "TRUE").astype(int) * 2
-    if "clerkships" in df.columns:
-        cred_pts += (df["clerkships"].fillna("").str.strip() != "").astype(int) * 2
-    if "raw_acknowledgements" in df.columns:
-        cred_pts += (df["raw_acknowledgements"].fillna("").str.strip() != "").astype(int) * 1
+    cred_pts = np.zeros(n, dtype=np.int64)
+    if "top_200" in rows.columns:
+        cred_pts += _flag_true(rows["top_200"]).to_numpy(dtype=bool) * 3
+    if "vault_50" in rows.columns:
+        cred_pts += _flag_true(rows["vault_50"]).to_numpy(dtype=bool) * 2
+    if "clerkships" in rows.columns:
+        cred_pts += (rows["clerkships"].fillna("").str.strip() != "").to_numpy(dtype=bool) * 2
+    if "raw_acknowledgements" in rows.columns:
+        cred_pts += (rows["raw_acknowledgements"].fillna("").str.strip() != "").to_numpy(dtype=bool) * 1
     cred_max = 8 if has_firm else 14
-    cred_pts = cred_pts.clip(upper=cred_max)
+    cred_pts = np.minimum(cred_pts, cred_max)
 
     # --- Total & tier ---
     if not has_firm:
-        pattern_pts = pd.Series(0, index=df.index)
+        pattern_pts = np.zeros(n, dtype=np.int64)
     total_score = kw_pts + pa_pts + pattern_pts + cred_pts
 
     # Filter: score threshold depends on how many keywords we had to score on
     # With many keywords, require higher match; with few/none, lower threshold
     # since the pre-filtering (location, practice area, grad year) already ensured relevance
     min_score = 20 if len(keywords) >= 3 else (10 if len(keywords) >= 1 else 2)
-    mask = total_score >= min_score
-    result = df[mask].copy()
-    result["match_score"] = total_score[mask]
-    result["keyword_score"] = kw_pts[mask]
-    result["practice_score"] = pa_pts[mask]
-    result["pattern_score"] = pattern_pts[mask]
-    result["credential_score"] = cred_pts[mask]
-    result["kw_count"] = kw_count[mask]
+    matched = np.flatnonzero(total_score >= min_score)
+    scores = {"match_score": total_score, "keyword_score": kw_pts, "practice_score": pa_pts,
+              "pattern_score": pattern_pts, "credential_score": cred_pts, "kw_count": kw_count}
+    return positions[matched], {col: values[matched] for col, values in scores.items()}
+
+
+def _scored_frame(df, positions, scores, has_firm):
+    """Rows of df at positions with the score columns (from _score_components) and tier added."""
+    result = df.iloc[positions].copy()
+    for col, values in scores.items():
+        result[col] = values
 
     # Tier assignment — thresholds adjust when no firm (scores are spread differently)
     tier2_thresh = 40 if has_firm else 35
     tier1_thresh = 65 if has_firm else 55
-    result["tier"] = "3"
-    result.loc[result["match_score"] >= tier2_thresh, "tier"] = "2"
-    result.loc[result["match_score"] >= tier1_thresh, "tier"] = "1"
+    tier = np.full(len(positions), "3", dtype=object)
+    tier[scores["match_score"] >= tier2_thresh] = "2"
+    tier[scores["match_score"] >= tier1_thresh] = "1"
+    result["tier"] = tier
+    return result
 
-    # Sort by score descending
-    result = result.sort_values("match_score", ascending=False)
 
-    return result
+# ---------------------------------------------------------------------------
+# Multi-process scoring (parallel_scoring.py) — off unless JAIDE_SCORING_WORKERS > 1
+# ---------------------------------------------------------------------------
+
+SCORING_ENGINE = parallel_scoring.from_env()
+
+# Attorney columns the scoring kernels read, copied to shared memory for the workers
+_SHARED_SCORING_COLUMNS = ["practice_areas", "specialty", "prior_experience", "firm_name", "lawSchool",
+                           "top_200", "vault_50", "clerkships", "raw_acknowledgements", "graduationYear",
+                           "location"]
+
+
+def _parallel_scoring_for(frame, n_rows, keywords=()):
+    """Whether to score n_rows of frame on SCORING_ENGINE's workers.
+
+    The workers count keywords from the keyword index only (the bio text is
+    not shared), so the index must be built and hold every keyword.
+    """
+    if not SCORING_ENGINE.use_for(n_rows):
+        return False
+    index = _keyword_index_for(frame)
+    return index is not None and all(kw.lower() in index.bitmaps for kw in keywords)
+
+
+def _publish_scoring_table(frame):
+    index = _keyword_index_for(frame)
+    phrases = list(index.bitmaps)
+    arrays = {"keyword_bitmaps": np.stack([index.bitmaps[p] for p in phrases])}
+    meta = {"phrases": phrases, "terms": None}
+    matrix = _practice_terms_for(frame)
+    if matrix is not None:
+        arrays.update(term_indptr=matrix.indptr, term_rows=matrix.rows)
+        meta["terms"] = matrix.vocabulary
+    return parallel_scoring.SharedTable.publish(
+        frame, [c for c in _SHARED_SCORING_COLUMNS if c in frame.columns], arrays=arrays, meta=meta)
+
+
+def _score_shard(table, keywords, firm_patterns, positions):
+    """Worker kernel: _score_components() for positions of the shared table (compact arrays back)."""
+    if "keyword_index" not in table.cache:
+        bitmaps = dict(zip(table.meta["phrases"], table.arrays["keyword_bitmaps"]))
+        table.cache["keyword_index"] = keyword_index.KeywordIndex(bitmaps, len(table.frame))
+        table.cache["term_matrix"] = None if table.meta["terms"] is None else practice_terms.TermMatrix(
+            table.meta["terms"], table.arrays["term_indptr"], table.arrays["term_rows"], len(table.frame))
+    matched, scores = _score_components(table.frame, keywords, firm_patterns, table.cache["keyword_index"],
+                                        positions, table.cache["term_matrix"])
+    return matched.astype(np.int32), {name: values.astype(np.int16) for name, values in scores.items()}
+
+
+def _score_components_parallel(frame, keywords, firm_patterns, positions):
+    """_score_components() with the positions sharded over the workers; same result."""
+    table = SCORING_ENGINE.publish(frame, _publish_scoring_table)
+    shards = parallel_scoring.shards(len(positions), SCORING_ENGINE.workers)
+    pieces = SCORING_ENGINE.map("search", table, [(keywords, firm_patterns, positions[a:b]) for a, b in shards])
+    matched = np.concatenate([m for m, _ in pieces]).astype(np.int64)
+    return matched, {name: np.concatenate([s[name] for _, s in pieces]).astype(np.int64) for name in pieces[0][1]}
+
+
+def _firm_dna_shard(table, dna, firm_name, start, stop, limit):
+    """Worker kernel: the top rows of one contiguous shard of the shared table."""
+    top, parts = _firm_top_rows(_firm_dna_components(dna, firm_name, table.frame.iloc[start:stop]), limit)
+    return top + start, parts
+
+
+def _firm_top_rows_parallel(dna, firm_name, frame, limit):
+    """_firm_top_rows() over all of frame: each worker's shard top rows, merged."""
+    table = SCORING_ENGINE.publish(frame, _publish_scoring_table)
+    shards = parallel_scoring.shards(len(frame), SCORING_ENGINE.workers)
+    pieces = SCORING_ENGINE.map("firm_dna", table, [(dna, firm_name, a, b, limit) for a, b in shards])
+    positions = np.concatenate([p for p, _ in pieces])
+    # Shards are contiguous and in order, so equal totals stay in row order
+    top, parts = _firm_top_rows({name: np.concatenate([c[name] for _, c in pieces]) for name in pieces[0][1]}, limit)
+    return positions[top], parts
+
+
+parallel_scoring.register_kernel("search", _score_shard)
+parallel_scoring.register_kernel("firm_dna", _firm_dna_shard)
 
 
 def build_rationale_for_row(row, keywords, firm_patterns):
@@ -1324,6 +1783,23 @@ def build_rationale_for_row(row, keywords, firm_patterns):
         "rationale": rationale,
     }
 
+
+def _shortlist_entries(frame, positions, scores, keywords, patterns, hiring_firm):
+    """Candidate entries (row fields, scores, tier, rationale) for scored frame positions, in order."""
+    scored_df = _scored_frame(frame, positions, scores, bool(patterns.get("matched_firm")))
+    entries = []
+    for entry in scored_df.to_dict("records"):
+        extras = build_rationale_for_row(entry, keywords, patterns)
+        entry.update(extras)
+        # Flag boomerang candidates (previously at the hiring firm, now elsewhere)
+        if hiring_firm:
+            prior = str(entry.get("prior_experience", "")).lower()
+            if hiring_firm.lower() in prior:
+                entry["is_boomerang"] = True
+        entries.append(entry)
+    return entries
+
+
 # ---------------------------------------------------------------------------
 # Hiring pattern analysis
 # ---------------------------------------------------------------------------
@@ -1611,11 +2087,11 @@ def _compute_firm_pitch_data(firm_name, office=None, practice_group=None, candid
                     practice_group.lower(), regex=False)]
         result["team_size"] = len(team_df)
         if "title" in team_df.columns:
-            t2_s = team_df["title"].value_counts()
+            t2_s = team_df["title"].astype(object).value_counts()
             result["team_by_title"] = {t: int(c) for t, c in t2_s.head(8).items()}
         school_col = "lawSchool" if "lawSchool" in team_df.columns else "law_school"
         if school_col in team_df.columns:
-            sc2_s = team_df[school_col].dropna().value_counts()
+            sc2_s = team_df[school_col].dropna().astype(object).value_counts()
             result["team_schools"] = [{"name": n, "count": int(c)} for n, c in sc2_s.head(10).items()]
 
     # 7. Candidate fit (optional)
@@ -1806,6 +2282,7 @@ def stream_claude_api(jd_text, patterns, candidate_rows, meta):
 # ---------------------------------------------------------------------------
 
 @app.route("/api/search/preflight", methods=["POST"])
+@startup.requires("hiring")
 def search_preflight():
     data = request.get_json()
     jd_text = data.get("jd", "")
@@ -1815,6 +2292,46 @@ def search_preflight():
     return jsonify({"firm_name": firm_name, "firm_detected": bool(firm_name)})
 
 
+# ---------------------------------------------------------------------------
+# Health / readiness (public, outside /api/)
+# ---------------------------------------------------------------------------
+
+@app.route("/healthz")
+def healthz():
+    """Liveness: the process is up and serving requests."""
+    return jsonify({"status": "ok"})
+
+
+@app.route("/readyz")
+def readyz():
+    """Readiness: per-stage load state and timings; 503 until every stage is ready."""
+    state = startup.readiness()
+    return jsonify(state), (200 if state["ready"] else 503)
+
+
+# ---------------------------------------------------------------------------
+# Request load — in-flight requests, so background precompute backs off
+# ---------------------------------------------------------------------------
+
+def _counts_as_load():
+    """Whether this request counts toward PRECOMPUTE's load: authenticated API
+    calls only, not health checks, static assets, pages or rejected requests."""
+    return request.path.startswith("/api/") and "user_id" in session
+
+
+@app.before_request
+def _track_request_load():
+    if _counts_as_load():
+        g.request_load_counted = True
+        PRECOMPUTE.request_started()
+
+
+@app.teardown_request
+def _untrack_request_load(exc):
+    if g.pop("request_load_counted", False):
+        PRECOMPUTE.request_finished()
+
+
 # ---------------------------------------------------------------------------
 # Auth
 # ---------------------------------------------------------------------------
@@ -3077,6 +3594,8 @@ def upload_pitch_logo():
 
 
 @app.route("/api/pitch/generate", methods=["POST"])
+@startup.requires("attorneys", "hiring", "hiring_dna", "jobs", "firms")
+@request_timing.timed("pitch")
 def generate_pitch_pdf():
     """Generate a candidate pitch PDF."""
     try:
@@ -3137,35 +3656,40 @@ def generate_pitch_pdf():
         dna = HIRING_DNA.get(firm_name, {})
 
         # 4. Compute scores
-        scores = _compute_pitch_scores(attorney_row, firm_name, job_data)
+        with request_timing.span("pitch_scores"):
+            scores = _compute_pitch_scores(attorney_row, firm_name, job_data)
 
         # 5. Generate narratives
         if not ANTHROPIC_API_KEY:
             return jsonify({"error": "AI not configured (no API key)"}), 500
-        narratives = _generate_pitch_narratives(attorney_data, job_data, firm_name, dna, scores, focus_angle, anonymize)
+        with request_timing.span("claude"):
+            narratives = _generate_pitch_narratives(attorney_data, job_data, firm_name, dna, scores,
+                                                    focus_angle, anonymize)
 
         # 6. Generate charts
-        chart_buffers = {}
-        chart_buffers["radar"] = _generate_radar_chart(scores)
+        with request_timing.span("charts"):
+            chart_buffers = {}
+            chart_buffers["radar"] = _generate_radar_chart(scores)
 
-        cand_school = str(attorney_row.get("lawSchool") or attorney_row.get("law_school", ""))
-        if dna.get("feeder_schools"):
-            items = [{"name": s["school"], "count": s["hires"]} for s in dna["feeder_schools"][:8]]
-            chart_buffers["feeder_schools"] = _generate_feeder_bar_chart(items, cand_school, "Feeder Schools")
+            cand_school = str(attorney_row.get("lawSchool") or attorney_row.get("law_school", ""))
+            if dna.get("feeder_schools"):
+                items = [{"name": s["school"], "count": s["hires"]} for s in dna["feeder_schools"][:8]]
+                chart_buffers["feeder_schools"] = _generate_feeder_bar_chart(items, cand_school, "Feeder Schools")
 
-        cand_firm_name = str(attorney_row.get("firm_name") or attorney_row.get("current_firm", ""))
-        if dna.get("feeder_firms"):
-            items = [{"name": f["firm"], "count": f["hires"]} for f in dna["feeder_firms"][:8]]
-            chart_buffers["feeder_firms"] = _generate_feeder_bar_chart(items, cand_firm_name, "Feeder Firms")
+            cand_firm_name = str(attorney_row.get("firm_name") or attorney_row.get("current_firm", ""))
+            if dna.get("feeder_firms"):
+                items = [{"name": f["firm"], "count": f["hires"]} for f in dna["feeder_firms"][:8]]
+                chart_buffers["feeder_firms"] = _generate_feeder_bar_chart(items, cand_firm_name, "Feeder Firms")
 
-        if cand_firm_name:
-            traj = _generate_career_trajectory_chart(cand_firm_name)
-            if traj:
-                chart_buffers["career_trajectory"] = traj
+            if cand_firm_name:
+                traj = _generate_career_trajectory_chart(cand_firm_name)
+                if traj:
+                    chart_buffers["career_trajectory"] = traj
 
         # 7. Assemble PDF
-        pdf_buf = _assemble_pitch_pdf(narratives, scores, chart_buffers, attorney_data,
-                                       job_data, firm_data, dna, sections, anonymize, recruiter_info)
+        with request_timing.span("pdf"):
+            pdf_buf = _assemble_pitch_pdf(narratives, scores, chart_buffers, attorney_data,
+                                           job_data, firm_data, dna, sections, anonymize, recruiter_info)
 
         # 8. Log to pipeline history if applicable
         if pipeline_id:
@@ -3194,6 +3718,409 @@ def generate_pitch_pdf():
         return jsonify({"error": str(e)}), 500
 
 
+# ---------------------------------------------------------------------------
+# Search query plan — shared by /api/search and /api/search/stream
+# ---------------------------------------------------------------------------
+
+# Explicitly excluded from associate searches even when the title list matches
+_COUNSEL_PARTNER_BLOCKLIST = ["counsel", "partner", "of counsel", "senior counsel",
+    "special counsel", "shareholder", "member", "principal", "director",
+    "chair", "co-chair", "vice chair", "head", "co-head"]
+
+PLAN_SAMPLE_ROWS = 2000  # rows used to estimate filter selectivity
+
+# Per attorney frame: numeric graduation years, the selectivity sample and
+# the estimates already made on it ({(filter, params): fraction kept})
+_plan_frame_stats = {"frame": None}
+
+
+def _search_frame_stats(frame):
+    global _plan_frame_stats
+    stats = _plan_frame_stats
+    if stats["frame"] is not frame:
+        n = len(frame)
+        sample = np.sort(np.random.default_rng(0).choice(n, min(n, PLAN_SAMPLE_ROWS), replace=False))
+        grad = data_snapshot.to_numeric(frame["graduationYear"]).to_numpy()
+        stats = {"frame": frame, "sample": sample, "grad": grad, "estimates": {}}
+        _plan_frame_stats = stats
+    return stats
+
+
+# Filter predicates over column values — applied to the rows by the scan path
+# and to each distinct value by the filter index, so both select the same rows
+
+def _contains_mask(values, term):
+    return values.str.lower().str.contains(term, na=False).to_numpy(dtype=bool)
+
+
+def _title_value_mask(values, title_filter):
+    title_col = values.str.lower().str.strip()
+    mask = title_col.isin(title_filter).to_numpy(dtype=bool)
+    if "associate" in title_filter:
+        for blocked in _COUNSEL_PARTNER_BLOCKLIST:
+            mask &= ~title_col.str.contains(blocked, regex=False, na=False).to_numpy(dtype=bool)
+    return mask
+
+
+def _school_key(values):
+    return values.fillna("").str.strip().str.lower()
+
+
+def _same_firm_value_mask(values, hf_lower):
+    current_firm_col = values.fillna("").str.lower().str.strip()
+    same_firm_mask = current_firm_col.str.contains(hf_lower, regex=False, na=False)
+    # Also check reverse containment for short names (e.g. "Kirkland" in "Kirkland & Ellis LLP")
+    same_firm_mask |= current_firm_col.apply(lambda f: bool(f) and f in hf_lower)
+    return same_firm_mask.to_numpy(dtype=bool)
+
+
+def _city_mask_parts(city):
+    predicate = lambda values: _contains_mask(values, city)
+    return [("location", predicate), ("location_secondary", predicate)]
+
+
+def _practice_area_mask_parts(pa):
+    predicate = lambda values: _contains_mask(values, pa)
+    return [("practice_areas", predicate), ("specialty", predicate)]
+
+
+def _title_mask_parts(title_filter):
+    return [("title", lambda values: _title_value_mask(values, title_filter))]
+
+
+ATTORNEY_FILTER_INDEX = None
+
+
+_FILTER_COLUMNS = ["location", "location_secondary", "practice_areas", "specialty", "title", "lawSchool",
+                   "firm_name"]
+
+
+def _load_filter_index(attorneys_df):
+    inputs = attorneys_df[[c for c in _FILTER_COLUMNS + ["graduationYear"] if c in attorneys_df.columns]]
+    key = artifacts.fingerprint(inputs, _LOCATION_CITIES, sorted(_PRACTICE_AREA_KEYWORDS),
+                                _ASSOCIATE_TITLES, _PARTNER_COUNSEL_TITLES, _COUNSEL_PARTNER_BLOCKLIST, "v1")
+    index = artifacts.load_or_build("filter_index", key, lambda: _build_filter_index(attorneys_df))
+    index.frame = attorneys_df
+    return index
+
+
+def _build_filter_index(attorneys_df):
+    """Filter index over attorneys_df, with the parsers' vocabularies prebuilt."""
+    index = filter_index.FilterIndex(
+        attorneys_df, _FILTER_COLUMNS,
+        years=data_snapshot.to_numeric(attorneys_df["graduationYear"]).to_numpy(),
+        groups={"lawSchool": _school_key})
+    for city in _LOCATION_CITIES:
+        index.mask(("city", city.lower()), _city_mask_parts(city.lower()), pin=True)
+    for pa in _PRACTICE_AREA_KEYWORDS:
+        index.mask(("practice_area", pa.lower()), _practice_area_mask_parts(pa.lower()), pin=True)
+    for titles in (_ASSOCIATE_TITLES, _PARTNER_COUNSEL_TITLES):
+        index.mask(("title", tuple(titles)), _title_mask_parts(list(titles)), pin=True)
+    return index
+
+
+def _filter_index_for(frame):
+    """The filter index if it was built for this frame, else None."""
+    index = ATTORNEY_FILTER_INDEX
+    if index is None or index.frame is not frame or not frame.index.equals(pd.RangeIndex(len(frame))):
+        return None
+    return index
+
+
+@startup.stage("filter_index", shared=True)
+def _load_filter_index_stage():
+    global ATTORNEY_FILTER_INDEX
+    ATTORNEY_FILTER_INDEX = _load_filter_index(ATTORNEYS_DF)
+
+
+class SearchPlan:
+    """One search: parsed JD → ordered filter steps → scorer → shortlist.
+
+    Filters narrow an array of row positions into the attorney frame
+    captured at construction instead of copying the frame; only the rows
+    left are gathered for scoring. With a filter index for the frame each
+    filter is a precomputed row mask and the masks are ANDed, smallest
+    first; without one the filters scan the rows, most selective first
+    (estimated on a fixed sample of rows). Each keeps or drops a row on that
+    row alone, so the order never changes the result. The hiring-firm
+    exclusion runs last, so excluded_count is what it removed from the
+    filtered rows. self.steps records rows in/out and time for every stage.
+
+    run() performs every stage; the Quick Match stream calls the stages one
+    by one (hiring_patterns, filter, score, entries) to report each as it
+    completes.
+    """
+
+    def __init__(self, jd_text, exact_firm="", skip_patterns=False, law_school_filter=True):
+        self.frame = ATTORNEYS_DF
+        self.keyword_index = _keyword_index_for(self.frame)
+        self.term_matrix = _practice_terms_for(self.frame)
+        self.steps = []
+        self._exact_firm, self._skip_patterns = exact_firm, skip_patterns
+        self.patterns = None
+        self._top = None
+
+        t0 = time.perf_counter()
+        with request_timing.span("extract_firm_name"):
+            self.firm_name = exact_firm if exact_firm else extract_firm_name(jd_text)
+        with request_timing.span("parse_jd"):
+            locations = extract_location(jd_text)
+            self.cities = [loc[0] for loc in locations]
+            self.state = locations[0][1] if locations else ""
+            self.yr_min, self.yr_max = extract_grad_years(jd_text)
+            self.practice_areas = extract_practice_area(jd_text)
+            self.required_bars = extract_bar(jd_text)
+            self.keywords = extract_keywords(jd_text)
+            self.title_filter = extract_title_level(jd_text)
+            self.law_school = extract_law_school(jd_text) if law_school_filter else ""
+        self._record("parse", t0)
+
+    def parsed(self):
+        """What the JD parsers extracted."""
+        return {
+            "firm_name": self.firm_name,
+            "city": " / ".join(self.cities) if self.cities else "",
+            "state": self.state,
+            "grad_year_min": self.yr_min,
+            "grad_year_max": self.yr_max,
+            "practice_areas": self.practice_areas,
+            "required_bars": self.required_bars,
+            "title_filter": self.title_filter,
+            "keywords": self.keywords,
+        }
+
+    def hiring_patterns(self):
+        """Analyze the hiring firm's lateral history (once); sets self.patterns and self.hiring_firm."""
+        if self.patterns is not None:
+            return self.patterns
+        t0 = time.perf_counter()
+        if self._skip_patterns:
+            self.patterns = {"firm_name": "", "matched_firm": None, "cards": [],
+                             "feeder_schools": [], "feeder_firms": [], "top_specialties": []}
+            self.firm_name = ""
+        else:
+            with request_timing.span("hiring_patterns"):
+                self.patterns = analyze_hiring_patterns(self.firm_name, self.cities, self.state,
+                                                        exact_firm=bool(self._exact_firm))
+        self.hiring_firm = self.patterns.get("matched_firm", "") or self.firm_name
+        self._record("hiring_patterns", t0)
+        return self.patterns
+
+    def _record(self, step, t0, rows_in=None, rows_out=None, **extra):
+        entry = {"step": step, "ms": round((time.perf_counter() - t0) * 1000, 2)}
+        if rows_in is not None:
+            entry.update(rows_in=rows_in, rows_out=rows_out)
+        entry.update(extra)
+        self.steps.append(entry)
+
+    # --- Filter steps: (frame, positions) → bool array over positions ---
+
+    def _grad_year_mask(self, frame, positions):
+        grad = _search_frame_stats(frame)["grad"][positions]
+        return (grad >= self.yr_min) & (grad <= self.yr_max)
+
+    def _location_mask(self, frame, positions):
+        location = frame["location"].iloc[positions]
+        secondary = frame["location_secondary"].iloc[positions]
+        mask = np.zeros(len(positions), dtype=bool)
+        for c in self.cities:
+            mask |= _contains_mask(location, c.lower()) | _contains_mask(secondary, c.lower())
+        return mask
+
+    def _practice_area_mask(self, frame, positions):
+        areas = frame["practice_areas"].iloc[positions]
+        specialty = frame["specialty"].iloc[positions]
+        mask = np.zeros(len(positions), dtype=bool)
+        for pa in self.practice_areas:
+            mask |= _contains_mask(areas, pa.lower()) | _contains_mask(specialty, pa.lower())
+        return mask
+
+    def _law_school_mask(self, frame, positions):
+        return (_school_key(frame["lawSchool"].iloc[positions]) == self.law_school.lower()).to_numpy(dtype=bool)
+
+    def _title_mask(self, frame, positions):
+        return _title_value_mask(frame["title"].iloc[positions], self.title_filter)
+
+    # --- The same filters from the filter index: index → bool array over all rows ---
+
+    def _grad_year_rows(self, index):
+        return index.year_range(self.yr_min, self.yr_max)
+
+    def _location_rows(self, index):
+        mask = np.zeros(index.n_rows, dtype=bool)
+        for c in self.cities:
+            mask |= index.mask(("city", c.lower()), _city_mask_parts(c.lower()))
+        return mask
+
+    def _practice_area_rows(self, index):
+        mask = np.zeros(index.n_rows, dtype=bool)
+        for pa in self.practice_areas:
+            mask |= index.mask(("practice_area", pa.lower()), _practice_area_mask_parts(pa.lower()))
+        return mask
+
+    def _law_school_rows(self, index):
+        return index.group_mask("lawSchool", self.law_school.lower())
+
+    def _title_rows(self, index):
+        return index.mask(("title", tuple(self.title_filter)), _title_mask_parts(self.title_filter))
+
+    def filters(self):
+        """[(name, params, scan mask function, index mask function)] for the filters this JD asks for."""
+        filters = []
+        if self.yr_min and self.yr_max:
+            filters.append(("grad_year", (self.yr_min, self.yr_max), self._grad_year_mask, self._grad_year_rows))
+        if self.cities:
+            filters.append(("location", tuple(self.cities), self._location_mask, self._location_rows))
+        if self.practice_areas:
+            filters.append(("practice_area", tuple(self.practice_areas), self._practice_area_mask,
+                            self._practice_area_rows))
+        if self.law_school:
+            filters.append(("law_school", self.law_school, self._law_school_mask, self._law_school_rows))
+        if self.title_filter:
+            filters.append(("title", tuple(self.title_filter), self._title_mask, self._title_rows))
+        return filters
+
+    def _filter_scan(self, frame, filters):
+        """Row positions passing filters, narrowing the positions step by step."""
+        positions = np.arange(len(frame))
+        t0 = time.perf_counter()
+        estimates = {}
+        if len(filters) > 1:
+            stats = _search_frame_stats(frame)
+            sample, known = stats["sample"], stats["estimates"]
+            for name, params, mask_fn, _rows_fn in filters:
+                if (name, params) not in known:
+                    known[(name, params)] = float(mask_fn(frame, sample).mean()) if len(sample) else 1.0
+                estimates[name] = known[(name, params)]
+            filters = sorted(filters, key=lambda f: estimates[f[0]])
+            self._record("estimate_selectivity", t0)
+
+        for name, _params, mask_fn, _rows_fn in filters:
+            t0 = time.perf_counter()
+            rows_in = len(positions)
+            positions = positions[mask_fn(frame, positions)]
+            extra = {"est_selectivity": round(estimates[name], 4)} if name in estimates else {}
+            self._record(name, t0, rows_in, len(positions), **extra)
+        return positions
+
+    def _filter_indexed(self, index, filters):
+        """Row positions passing filters, as an AND of the index's row masks (smallest first)."""
+        t0 = time.perf_counter()
+        masks = [(name, rows_fn(index)) for name, _params, _mask_fn, rows_fn in filters]
+        counts = {name: int(np.count_nonzero(mask)) for name, mask in masks}
+        masks.sort(key=lambda m: counts[m[0]])
+        self._record("index_lookup", t0)
+
+        keep, rows_in = None, index.n_rows
+        for name, mask in masks:
+            t0 = time.perf_counter()
+            keep = mask if keep is None else keep & mask
+            rows_out = int(np.count_nonzero(keep))
+            self._record(name, t0, rows_in, rows_out,
+                         est_selectivity=round(counts[name] / max(index.n_rows, 1), 4))
+            rows_in = rows_out
+        return np.arange(index.n_rows) if keep is None else np.flatnonzero(keep)
+
+    def filter(self):
+        """Apply the filters and the hiring-firm exclusion; sets self.positions."""
+        self.hiring_patterns()
+        with request_timing.span("filter"):
+            return self._filter()
+
+    def _filter(self):
+        frame = self.frame
+        index = _filter_index_for(frame)
+        if index is not None:
+            positions = self._filter_indexed(index, self.filters())
+        else:
+            positions = self._filter_scan(frame, self.filters())
+
+        self.excluded_count = 0
+        if self.hiring_firm:
+            t0 = time.perf_counter()
+            rows_in = len(positions)
+            hf_lower = self.hiring_firm.lower()
+            if index is not None:
+                same_firm = index.value_mask("firm_name", lambda v: _same_firm_value_mask(v, hf_lower), positions)
+            else:
+                same_firm = _same_firm_value_mask(frame["firm_name"].iloc[positions], hf_lower)
+            positions = positions[~same_firm]
+            self.excluded_count = rows_in - len(positions)
+            self._record("exclude_hiring_firm", t0, rows_in, len(positions))
+        self.positions = positions
+        self.filtered_count = len(positions)
+        return positions
+
+    def score(self):
+        """Score the filtered rows; sets self.matched and self.match_scores (unsorted)."""
+        t0 = time.perf_counter()
+        self.patterns["_practice_areas"] = self.practice_areas  # Pass to scorer for PA overlap
+        extra = {}
+        with request_timing.span("score"):
+            if _parallel_scoring_for(self.frame, len(self.positions), self.keywords):
+                self.matched, self.match_scores = _score_components_parallel(self.frame, self.keywords,
+                                                                             self.patterns, self.positions)
+                extra["workers"] = SCORING_ENGINE.workers
+            else:
+                self.matched, self.match_scores = _score_components(self.frame, self.keywords, self.patterns,
+                                                                    self.keyword_index, self.positions,
+                                                                    self.term_matrix)
+        self.total_matched = len(self.matched)
+        self._top = None
+        self._record("score", t0, len(self.positions), self.total_matched, **extra)
+        return self.total_matched
+
+    def entries(self, start, stop):
+        """Shortlist entries for ranks start .. stop - 1 of the scored rows."""
+        if self._top is None or len(self._top) < min(stop, self.total_matched):
+            self._top = top_k.select(self.match_scores["match_score"], stop)
+        top = self._top[start:stop]
+        with request_timing.span("rationale"):
+            return _shortlist_entries(self.frame, self.matched[top],
+                                      {col: v[top] for col, v in self.match_scores.items()},
+                                      self.keywords, self.patterns, self.hiring_firm)
+
+    def run(self, shortlist_size):
+        """Filter, score and build the shortlist; sets self.meta and returns the shortlist entries."""
+        self.filter()
+        self.score()
+
+        # Build rationale only for the top candidates we'll actually use
+        t0 = time.perf_counter()
+        scored = self.entries(0, shortlist_size)
+        self._record("shortlist", t0, self.total_matched, len(scored))
+        self.set_meta()
+        return scored
+
+    def set_meta(self):
+        parsed = self.parsed()
+        self.meta = {
+            "firm_name": parsed.pop("firm_name"),
+            "matched_firm": self.patterns.get("matched_firm", ""),
+            **parsed,
+            "total_attorneys": len(self.frame),
+            "filtered_count": self.filtered_count,
+            "total_matched": self.total_matched,
+            "excluded_hiring_firm": self.excluded_count,
+            "query_plan": self.steps,
+        }
+        return self.meta
+
+    def result_set(self):
+        """Store every match in SEARCH_RESULT_SETS for /api/search/<id>/page; returns its id."""
+        return SEARCH_RESULT_SETS.add(result_sets.ResultSet(self.matched, self.match_scores, {
+            "frame": self.frame, "keywords": self.keywords, "patterns": self.patterns,
+            "hiring_firm": self.hiring_firm, "dataset_version": DATASET_VERSION,
+        }))
+
+
+# Repeated /api/search runs (see result_cache.py); cleared on every dataset swap
+SEARCH_SHORTLIST_CACHE = result_cache.from_env("shortlist", "JAIDE_SEARCH_CACHE", 600, 256)
+AI_RESULT_CACHE = result_cache.from_env("ai", "JAIDE_AI_CACHE", 1800, 256)
+# Every match of a search, for /api/search/<id>/page (see result_sets.py); emptied on every dataset swap
+SEARCH_RESULT_SETS = result_sets.from_env()
+
+
 def _custom_attorney_to_candidate(ca, keywords=None, practice_areas=None):
     """Convert a custom_attorney dict to the same shape as _serialize_candidate."""
     name = f"{ca.get('first_name', '')} {ca.get('last_name', '')}".strip()
@@ -3253,10 +4180,129 @@ def _custom_attorney_to_candidate(ca, keywords=None, practice_areas=None):
     }
 
 
+def _serialize_fp_candidate(r):
+    """_serialize_candidate() for a scored FP attorney entry."""
+    cand = _serialize_candidate(r)
+    cand["source"] = "fp"
+    cand["attorney_source"] = "fp"
+    return cand
+
+
+def _custom_candidates(meta, cities, source_filter):
+    """Custom attorneys for a search's practice area, city and class years, as candidates."""
+    if source_filter == "fp":
+        return []
+    practice_areas = meta["practice_areas"]
+    with request_timing.span("custom_attorneys"):
+        custom_atts = ats_db.list_custom_attorneys(
+            search="",
+            practice_area=practice_areas[0] if practice_areas else "",
+            location=cities[0] if cities else "",
+            grad_year_min=meta["grad_year_min"],
+            grad_year_max=meta["grad_year_max"],
+        )
+        return [_custom_attorney_to_candidate(ca, meta["keywords"], practice_areas) for ca in custom_atts]
+
+
+def _merge_custom_candidates(candidates, custom_candidates):
+    """Quick Match candidates and custom ones in one list, by score, re-ranked."""
+    all_candidates = candidates + custom_candidates
+    all_candidates.sort(key=lambda c: -(c.get("match_score") or 0))
+    # Re-number ranks
+    for i, c in enumerate(all_candidates):
+        c["rank"] = i + 1
+    return all_candidates
+
+
+def _quick_match_summary(results, patterns, meta, firm_name, hiring_firm, ai_error=None):
+    """(chat_response, tier_summaries) describing Quick Match results (ranked entries)."""
+    city = meta["city"]
+    total_attorneys, filtered_count, total_matched = meta["total_attorneys"], meta["filtered_count"], meta["total_matched"]
+    excluded_count = meta["excluded_hiring_firm"]
+
+    # Build tier summaries
+    tier_summaries = {}
+    for r in results:
+        t = r["tier"]
+        if t not in tier_summaries:
+            tier_summaries[t] = {"count": 0, "names": []}
+        tier_summaries[t]["count"] += 1
+        tier_summaries[t]["names"].append(f"{r['first_name']} {r['last_name']}")
+
+    # Build conversational summary
+    matched_firm = patterns.get("matched_firm", "")
+    summary_parts = []
+
+    if ai_error:
+        summary_parts.append(
+            "**Note:** AI analysis unavailable — showing keyword-based ranking."
+        )
+
+    if firm_name:
+        display_firm = matched_firm if matched_firm else firm_name
+        summary_parts.append(f"I analyzed your job description for **{display_firm}**")
+        if matched_firm and matched_firm.lower() != firm_name.lower():
+            summary_parts[-1] += f' (matched from "{firm_name}")'
+        if city:
+            summary_parts[-1] += f" in **{city}**"
+        summary_parts[-1] += "."
+    else:
+        summary_parts.append("I analyzed your job description.")
+
+    filter_note = (
+        f"From **{total_attorneys:,}** attorneys, **{filtered_count}** passed "
+        f"initial filters and **{total_matched}** scored above the match threshold."
+    )
+    if excluded_count:
+        filter_note += f" ({excluded_count} current {hiring_firm} attorney{'s' if excluded_count != 1 else ''} excluded.)"
+    summary_parts.append(filter_note)
+
+    if results:
+        shown = len(results)
+        if total_matched > shown:
+            summary_parts.append(f"Showing the top **{shown}** candidates (of {total_matched} matches).")
+
+        tier_labels = {"1": "Tier 1 — Strong Fit", "2": "Tier 2 — Good Fit", "3": "Tier 3 — Possible Fit"}
+        for t in ["1", "2", "3"]:
+            info = tier_summaries.get(t)
+            if not info:
+                continue
+            names_preview = ", ".join(info["names"][:4])
+            if info["count"] > 4:
+                names_preview += f" + {info['count'] - 4} more"
+            summary_parts.append(f"\n**{tier_labels[t]}** ({info['count']}): {names_preview}")
+
+        if patterns.get("cards"):
+            summary_parts.append(
+                f"\nI also identified **{len(patterns['cards'])} hiring patterns** "
+                f"from the firm's lateral history — see the right panel for details."
+            )
+        elif not matched_firm and excluded_count == 0:
+            summary_parts.append(
+                "\nScoring is based on practice area relevance and credentials "
+                "(no firm-specific hiring patterns applied)."
+            )
+    else:
+        summary_parts.append(
+            "No candidates matched with sufficient relevance. "
+            "Try broadening the graduation year range or practice area."
+        )
+
+    chat_response = "\n\n".join(summary_parts)
+    return chat_response, [
+        {"tier": f"Tier {t}", "title": lbl, "names": ", ".join(tier_summaries[t]["names"]),
+         "description": f"{tier_summaries[t]['count']} candidates matched at this level."}
+        for t, lbl in [("1", "Strong Fit"), ("2", "Good Fit"), ("3", "Possible Fit")]
+        if t in tier_summaries
+    ]
+
+
 @app.route("/api/search", methods=["POST"])
+@startup.requires("attorneys", "hiring", "school_aliases")
+@request_timing.timed("search")
 def search():
     data = request.get_json()
-    jd_text = data.get("jd", "")
+    jd_text = result_cache.normalize_jd(data.get("jd", ""))
     use_ai = data.get("use_ai", True)
     exact_firm = data.get("firm_name", "")  # When provided, skip fuzzy extraction
     skip_patterns = data.get("skip_patterns", False)
@@ -3264,112 +4310,31 @@ def search():
     if not jd_text.strip():
         return jsonify({"error": "Please provide a job description."}), 400
 
-    # 1. Parse JD
-    firm_name = exact_firm if exact_firm else extract_firm_name(jd_text)
-    locations = extract_location(jd_text)
-    cities = [loc[0] for loc in locations]
-    state = locations[0][1] if locations else ""
-    yr_min, yr_max = extract_grad_years(jd_text)
-    practice_areas = extract_practice_area(jd_text)
-    required_bars = extract_bar(jd_text)
-    keywords = extract_keywords(jd_text)
-    title_filter = extract_title_level(jd_text)
-    law_school_filter = extract_law_school(jd_text)
-
-    # 2. Hiring pattern analysis
-    if skip_patterns:
-        patterns = {"firm_name": "", "matched_firm": None, "cards": [],
-                    "feeder_schools": [], "feeder_firms": [], "top_specialties": []}
-        firm_name = ""
-    else:
-        patterns = analyze_hiring_patterns(firm_name, cities, state, exact_firm=bool(exact_firm))
-
-    # 3. Filter attorneys
-    df = ATTORNEYS_DF.copy()
-    total_attorneys = len(df)
-
-    if yr_min and yr_max:
-        df["_grad"] = pd.to_numeric(df["graduationYear"], errors="coerce")
-        df = df[(df["_grad"] >= yr_min) & (df["_grad"] <= yr_max)]
-        df = df.drop(columns=["_grad"])
-
-    if cities:
-        location_mask = pd.Series(False, index=df.index)
-        for c in cities:
-            location_mask |= df["location"].str.lower().str.contains(c.lower(), na=False)
-            location_mask |= df["location_secondary"].str.lower().str.contains(c.lower(), na=False)
-        df = df[location_mask]
-
-    if practice_areas:
-        pa_mask = pd.Series(False, index=df.index)
-        for pa in practice_areas:
-            pa_mask |= df["practice_areas"].str.lower().str.contains(pa.lower(), na=False)
-            pa_mask |= df["specialty"].str.lower().str.contains(pa.lower(), na=False)
-        df = df[pa_mask]
-
-    if law_school_filter:
-        school_col = df["lawSchool"].fillna("").str.strip()
-        df = df[school_col.str.lower() == law_school_filter.lower()]
-
-    if title_filter:
-        title_col = df["title"].str.lower().str.strip()
-        title_mask = title_col.isin(title_filter)
-        # Secondary blocklist: explicitly exclude counsel/partner titles for associate searches
-        _COUNSEL_PARTNER_BLOCKLIST = ["counsel", "partner", "of counsel", "senior counsel",
-            "special counsel", "shareholder", "member", "principal", "director",
-            "chair", "co-chair", "vice chair", "head", "co-head"]
-        if "associate" in title_filter:
-            for blocked in _COUNSEL_PARTNER_BLOCKLIST:
-                title_mask &= ~title_col.str.contains(blocked, regex=False, na=False)
-        df = df[title_mask]
-
-    # Exclude attorneys currently at the hiring firm
-    hiring_firm = patterns.get("matched_firm", "") or firm_name
-    excluded_count = 0
-    if hiring_firm:
-        hf_lower = hiring_firm.lower()
-        current_firm_col = df["firm_name"].fillna("").str.lower().str.strip()
-        same_firm_mask = current_firm_col.str.contains(hf_lower, regex=False, na=False)
-        # Also check reverse containment for short names (e.g. "Kirkland" in "Kirkland & Ellis LLP")
-        same_firm_mask |= current_firm_col.apply(lambda f: bool(f) and f in hf_lower)
-        excluded_count = int(same_firm_mask.sum())
-        df = df[~same_firm_mask]
-
-    filtered_count = len(df)
-
-    # 4. Vectorized scoring of all filtered attorneys
-    patterns["_practice_areas"] = practice_areas  # Pass to scorer for PA overlap
-    scored_df = score_attorneys_vectorized(df, keywords, patterns)
-    total_matched = len(scored_df)
-
-    # Build rationale only for the top candidates we'll actually use
-    shortlist_limit = max(SHORTLIST_SIZE, 25)  # enough for both AI and Quick paths
-    top_df = scored_df.head(shortlist_limit)
-    scored = []
-    for _, row in top_df.iterrows():
-        entry = row.to_dict()
-        extras = build_rationale_for_row(entry, keywords, patterns)
-        entry.update(extras)
-        # Flag boomerang candidates (previously at the hiring firm, now elsewhere)
-        if hiring_firm:
-            prior = str(entry.get("prior_experience", "")).lower()
-            if hiring_firm.lower() in prior:
-                entry["is_boomerang"] = True
-        scored.append(entry)
+    # 1-4. Parse JD, hiring patterns, filter and score (shared query plan),
+    # or reuse the result of the same search on this dataset version
+    cache_key = result_cache.make_key(jd_text, exact_firm, bool(skip_patterns), DATASET_VERSION)
+    cached = SEARCH_SHORTLIST_CACHE.get(cache_key)
+    if cached is not None and SEARCH_RESULT_SETS.get(cached["result_set"]) is None:
+        cached = None  # its result set is gone: search again so the pages stay available
+    cache_meta = {"shortlist": "hit" if cached else "miss"}
+    if cached is None:
+        plan = SearchPlan(jd_text, exact_firm=exact_firm, skip_patterns=skip_patterns)
+        cached = {
+            "scored": plan.run(max(SHORTLIST_SIZE, MAX_RESULTS)),  # enough for both AI and Quick paths
+            "firm_name": plan.firm_name, "patterns": plan.patterns, "meta": plan.meta,
+            "cities": plan.cities, "hiring_firm": plan.hiring_firm,
+            "result_set": plan.result_set(),
+        }
+        SEARCH_SHORTLIST_CACHE.put(cache_key, cached)
+    scored, firm_name, patterns, meta = cached["scored"], cached["firm_name"], cached["patterns"], cached["meta"]
+    cities, hiring_firm = cached["cities"], cached["hiring_firm"]
+    total_matched = meta["total_matched"]
+    meta["cache"] = cache_meta
+    meta["result_set"] = {"id": cached["result_set"], "total": total_matched,
+                          "next_cursor": str(MAX_RESULTS) if total_matched > MAX_RESULTS else None}
 
     # Build custom attorneys and merge (if source_filter allows)
-    if source_filter != "fp":
-        city_str = " / ".join(cities) if cities else ""
-        custom_atts = ats_db.list_custom_attorneys(
-            search="",
-            practice_area=practice_areas[0] if practice_areas else "",
-            location=cities[0] if cities else "",
-            grad_year_min=yr_min,
-            grad_year_max=yr_max,
-        )
-        custom_candidates = [_custom_attorney_to_candidate(ca, keywords, practice_areas) for ca in custom_atts]
-    else:
-        custom_candidates = []
+    custom_candidates = _custom_candidates(meta, cities, source_filter)
 
     # Mark FP candidates with source
     for s in scored:
@@ -3384,24 +4349,6 @@ def search():
     # else "all" — keep scored as-is, will merge below
 
     # 5. Determine analysis mode
-    city = " / ".join(cities) if cities else ""
-    meta = {
-        "firm_name": firm_name,
-        "matched_firm": patterns.get("matched_firm", ""),
-        "city": city,
-        "state": state,
-        "grad_year_min": yr_min,
-        "grad_year_max": yr_max,
-        "practice_areas": practice_areas,
-        "required_bars": required_bars,
-        "title_filter": title_filter,
-        "keywords": keywords,
-        "total_attorneys": total_attorneys,
-        "filtered_count": filtered_count,
-        "total_matched": total_matched,
-        "excluded_hiring_firm": excluded_count,
-    }
-
     ai_used = False
     ai_error = None
 
@@ -3413,7 +4360,14 @@ def search():
             sname = f"{s.get('first_name', '')} {s.get('last_name', '')}".strip().lower()
             shortlist_by_name[sname] = s
         try:
-            claude_result = call_claude_api(jd_text, patterns, shortlist, meta)
+            ai_key = result_cache.make_key("ai", cache_key)
+            claude_result = AI_RESULT_CACHE.get(ai_key)
+            cache_meta["ai"] = "hit" if claude_result else "miss"
+            if claude_result is None:
+                with request_timing.span("claude"):
+                    claude_result = call_claude_api(jd_text, patterns, shortlist, meta)
+                if claude_result:
+                    AI_RESULT_CACHE.put(ai_key, claude_result)
             if claude_result:
                 ai_used = True
                 raw_ai = claude_result.get("candidates", [])
@@ -3423,10 +4377,7 @@ def search():
                     ac_name = (ac.get("name") or "").strip().lower()
                     original = shortlist_by_name.get(ac_name, {})
                     merged = {**original, **ac}  # Claude fields override
-                    cand = _serialize_candidate(merged)
-                    cand["source"] = "fp"
-                    cand["attorney_source"] = "fp"
-                    ai_candidates.append(cand)
+                    ai_candidates.append(_serialize_fp_candidate(merged))
                 # Merge custom candidates
                 if source_filter != "fp":
                     all_candidates = ai_candidates + custom_candidates
@@ -3443,7 +4394,8 @@ def search():
                     "chat_response": claude_result.get("chat_summary", ""),
                     "candidates": all_candidates,
                     "hiring_patterns": _sanitize_for_json(patterns),
-                    "meta": _sanitize_for_json({**meta, "result_count": len(all_candidates), "ai_used": True}),
+                    "meta": _sanitize_for_json({**meta, "result_count": len(all_candidates), "ai_used": True,
+                                                "timings": request_timing.current().as_dict()}),
                 })
         except Exception:
             ai_error = traceback.format_exc()
@@ -3452,96 +4404,17 @@ def search():
     # -----------------------------------------------------------------------
     # Fallback: keyword-based analysis (Quick Match mode)
     # -----------------------------------------------------------------------
-    MAX_RESULTS = 25
     results = scored[:MAX_RESULTS]
     for i, r in enumerate(results):
         r["rank"] = i + 1
-
-    # Build tier summaries
-    tier_summaries = {}
-    for r in results:
-        t = r["tier"]
-        if t not in tier_summaries:
-            tier_summaries[t] = {"count": 0, "names": []}
-        tier_summaries[t]["count"] += 1
-        tier_summaries[t]["names"].append(f"{r['first_name']} {r['last_name']}")
-
-    # Build conversational summary
-    matched_firm = patterns.get("matched_firm", "")
-    summary_parts = []
-
-    if ai_error:
-        summary_parts.append(
-            "**Note:** AI analysis unavailable — showing keyword-based ranking."
-        )
-
-    if firm_name:
-        display_firm = matched_firm if matched_firm else firm_name
-        summary_parts.append(f"I analyzed your job description for **{display_firm}**")
-        if matched_firm and matched_firm.lower() != firm_name.lower():
-            summary_parts[-1] += f' (matched from "{firm_name}")'
-        if city:
-            summary_parts[-1] += f" in **{city}**"
-        summary_parts[-1] += "."
-    else:
-        summary_parts.append("I analyzed your job description.")
-
-    filter_note = (
-        f"From **{total_attorneys:,}** attorneys, **{filtered_count}** passed "
-        f"initial filters and **{total_matched}** scored above the match threshold."
-    )
-    if excluded_count:
-        filter_note += f" ({excluded_count} current {hiring_firm} attorney{'s' if excluded_count != 1 else ''} excluded.)"
-    summary_parts.append(filter_note)
-
-    if results:
-        shown = len(results)
-        if total_matched > shown:
-            summary_parts.append(f"Showing the top **{shown}** candidates (of {total_matched} matches).")
-
-        tier_labels = {"1": "Tier 1 — Strong Fit", "2": "Tier 2 — Good Fit", "3": "Tier 3 — Possible Fit"}
-        for t in ["1", "2", "3"]:
-            info = tier_summaries.get(t)
-            if not info:
-                continue
-            names_preview = ", ".join(info["names"][:4])
-            if info["count"] > 4:
-                names_preview += f" + {info['count'] - 4} more"
-            summary_parts.append(f"\n**{tier_labels[t]}** ({info['count']}): {names_preview}")
-
-        if patterns.get("cards"):
-            summary_parts.append(
-                f"\nI also identified **{len(patterns['cards'])} hiring patterns** "
-                f"from the firm's lateral history — see the right panel for details."
-            )
-        elif not matched_firm and excluded_count == 0:
-            summary_parts.append(
-                "\nScoring is based on practice area relevance and credentials "
-                "(no firm-specific hiring patterns applied)."
-            )
-    else:
-        summary_parts.append(
-            "No candidates matched with sufficient relevance. "
-            "Try broadening the graduation year range or practice area."
-        )
-
-    chat_response = "\n\n".join(summary_parts)
+    chat_response, tier_summaries = _quick_match_summary(results, patterns, meta, firm_name, hiring_firm, ai_error)
 
     # Serialize candidates for Quick Match (include all profile fields)
-    candidates = []
-    for r in results:
-        cand = _serialize_candidate(r)
-        cand["source"] = "fp"
-        cand["attorney_source"] = "fp"
-        candidates.append(cand)
+    candidates = [_serialize_fp_candidate(r) for r in results]
 
     # Merge custom candidates into quick-match results
     if source_filter != "fp":
-        all_candidates = candidates + custom_candidates
-        all_candidates.sort(key=lambda c: -(c.get("match_score") or 0))
-        # Re-number ranks
-        for i, c in enumerate(all_candidates):
-            c["rank"] = i + 1
+        all_candidates = _merge_custom_candidates(candidates, custom_candidates)
     else:
         all_candidates = candidates
 
@@ -3556,14 +4429,49 @@ def search():
         "mode": "quick",
         "chat_response": chat_response,
         "candidates": all_candidates,
-        "tier_summaries": [
-            {"tier": f"Tier {t}", "title": lbl, "names": ", ".join(tier_summaries[t]["names"]),
-             "description": f"{tier_summaries[t]['count']} candidates matched at this level."}
-            for t, lbl in [("1", "Strong Fit"), ("2", "Good Fit"), ("3", "Possible Fit")]
-            if t in tier_summaries
-        ],
+        "tier_summaries": tier_summaries,
         "hiring_patterns": _sanitize_for_json(patterns),
-        "meta": _sanitize_for_json({**meta, "result_count": len(all_candidates), "ai_used": False}),
+        "meta": _sanitize_for_json({**meta, "result_count": len(all_candidates), "ai_used": False,
+                                    "timings": request_timing.current().as_dict()}),
+    })
+
+
+@app.route("/api/search/<set_id>/page", methods=["GET"])
+@startup.requires("attorneys")
+def search_page(set_id):
+    """Further Quick Match candidates of an /api/search result set, without re-scoring.
+
+    ?cursor= is the next_cursor of the previous page (meta.result_set for the
+    first one); ?limit= candidates per page (default 25, at most 100).
+    Custom attorneys are merged into the first page only.
+    """
+    rs = SEARCH_RESULT_SETS.get(set_id)
+    if rs is None or rs.context["dataset_version"] != DATASET_VERSION:
+        return jsonify({"error": "This result set has expired. Please run the search again."}), 404
+    try:
+        cursor = int(request.args.get("cursor", MAX_RESULTS))
+        limit = int(request.args.get("limit", MAX_RESULTS))
+    except ValueError:
+        return jsonify({"error": "cursor and limit must be integers"}), 400
+    if cursor < 0:
+        return jsonify({"error": "cursor must not be negative"}), 400
+    limit = min(max(limit, 1), 100)
+
+    ctx = rs.context
+    positions, scores = rs.page(cursor, limit)
+    entries = _shortlist_entries(ctx["frame"], positions, scores, ctx["keywords"], ctx["patterns"],
+                                 ctx["hiring_firm"])
+    candidates = []
+    for i, entry in enumerate(entries):
+        entry["rank"] = cursor + i + 1
+        candidates.append(_serialize_fp_candidate(entry))
+    end = cursor + len(candidates)
+    return jsonify({
+        "result_set": set_id,
+        "candidates": candidates,
+        "cursor": str(cursor),
+        "next_cursor": str(end) if end < len(rs) else None,
+        "total": len(rs),
     })
 
 
@@ -3571,9 +4479,86 @@ def search():
 # Streaming search endpoint (AI mode)
 # ---------------------------------------------------------------------------
 
+QUICK_STREAM_FIRST_BATCH = 5  # candidates in the first Quick Match "candidates" event
+
+
+def _sse(payload):
+    return f"data: {json.dumps(_sanitize_for_json(payload))}\n\n"
+
+
+def _quick_match_stream(jd_text, exact_firm, skip_patterns, source_filter):
+    """SSE events of a Quick Match search, each sent as soon as its stage completes.
+
+      parsed      what the JD parsers extracted
+      patterns    the hiring firm's patterns
+      filtered    attorneys before and after the filters and the hiring-firm exclusion
+      candidates  a ranked batch: the first QUICK_STREAM_FIRST_BATCH, then the rest up to MAX_RESULTS
+      custom      the final list, with custom attorneys merged in and re-ranked
+      meta        the /api/search meta, plus time_to_first_candidate_ms, total_ms and timings
+      done        chat response and tier summaries
+
+    Results are those of /api/search with use_ai=false (same plan and
+    merge), so the client can page on with meta.result_set.
+    """
+    t_start = time.perf_counter()
+    plan = SearchPlan(jd_text, exact_firm=exact_firm, skip_patterns=skip_patterns)
+    yield _sse({"type": "parsed", "parsed": plan.parsed()})
+    patterns = plan.hiring_patterns()
+    yield _sse({"type": "patterns", "hiring_patterns": patterns})
+    plan.filter()
+    yield _sse({"type": "filtered", "total_attorneys": len(plan.frame), "filtered_count": plan.filtered_count,
+                "excluded_hiring_firm": plan.excluded_count})
+
+    plan.score()
+    results, first_candidate_ms = [], None
+    if source_filter != "custom":
+        for step, start, stop in (("first_batch", 0, QUICK_STREAM_FIRST_BATCH),
+                                  ("shortlist", QUICK_STREAM_FIRST_BATCH, MAX_RESULTS)):
+            if start >= plan.total_matched:
+                break
+            t0 = time.perf_counter()
+            batch = plan.entries(start, stop)
+            for i, r in enumerate(batch):
+                r["rank"] = start + i + 1
+            plan._record(step, t0, plan.total_matched, len(batch))
+            results += batch
+            if first_candidate_ms is None:
+                first_candidate_ms = round((time.perf_counter() - t_start) * 1000, 1)
+            yield _sse({"type": "candidates", "start": start, "total_matched": plan.total_matched,
+                        "candidates": [_serialize_fp_candidate(r) for r in batch]})
+
+    meta = plan.set_meta()
+    meta["result_set"] = {"id": plan.result_set(), "total": plan.total_matched,
+                          "next_cursor": str(MAX_RESULTS) if plan.total_matched > MAX_RESULTS else None}
+    candidates = [_serialize_fp_candidate(r) for r in results]
+    custom_candidates = _custom_candidates(meta, plan.cities, source_filter)
+    all_candidates = _merge_custom_candidates(candidates, custom_candidates) if source_filter != "fp" else candidates
+    yield _sse({"type": "custom", "custom_count": len(custom_candidates), "candidates": all_candidates})
+
+    chat_response, tier_summaries = _quick_match_summary(results, patterns, meta, plan.firm_name, plan.hiring_firm)
+    meta.update(result_count=len(all_candidates), ai_used=False, time_to_first_candidate_ms=first_candidate_ms,
+                total_ms=round((time.perf_counter() - t_start) * 1000, 1))
+    if request_timing.current() is not None:
+        meta["timings"] = request_timing.current().as_dict()
+    yield _sse({"type": "meta", "meta": meta})
+
+    _session["jd"] = jd_text
+    _session["candidates"] = all_candidates
+    _session["patterns"] = patterns
+    _session["meta"] = meta
+    _session["history"] = []
+    yield _sse({"type": "done", "mode": "quick", "chat_response": chat_response, "tier_summaries": tier_summaries})
+
+
 @app.route("/api/search/stream", methods=["POST"])
+@startup.requires("attorneys", "hiring", "school_aliases")
+@request_timing.timed("search_stream")
 def search_stream():
-    """SSE endpoint — streams AI analysis progress, then final JSON result."""
+    """SSE endpoint — streams AI analysis progress, then final JSON result.
+
+    With use_ai=false, streams a Quick Match search stage by stage instead
+    (see _quick_match_stream).
+    """
     data = request.get_json()
     jd_text = data.get("jd", "")
     exact_firm = data.get("firm_name", "")  # When provided, skip fuzzy extraction
@@ -3581,95 +4566,17 @@ def search_stream():
     if not jd_text.strip():
         return jsonify({"error": "Please provide a job description."}), 400
 
-    # Parse & filter (same as /api/search)
-    firm_name = exact_firm if exact_firm else extract_firm_name(jd_text)
-    locations = extract_location(jd_text)
-    cities = [loc[0] for loc in locations]
-    state = locations[0][1] if locations else ""
-    yr_min, yr_max = extract_grad_years(jd_text)
-    practice_areas = extract_practice_area(jd_text)
-    required_bars = extract_bar(jd_text)
-    keywords = extract_keywords(jd_text)
-    title_filter = extract_title_level(jd_text)
-    if skip_patterns:
-        patterns = {"firm_name": "", "matched_firm": None, "cards": [],
-                    "feeder_schools": [], "feeder_firms": [], "top_specialties": []}
-        firm_name = ""
-    else:
-        patterns = analyze_hiring_patterns(firm_name, cities, state, exact_firm=bool(exact_firm))
-
-    df = ATTORNEYS_DF.copy()
-    total_attorneys = len(df)
-    if yr_min and yr_max:
-        df["_grad"] = pd.to_numeric(df["graduationYear"], errors="coerce")
-        df = df[(df["_grad"] >= yr_min) & (df["_grad"] <= yr_max)]
-        df = df.drop(columns=["_grad"])
-    if cities:
-        loc_mask = pd.Series(False, index=df.index)
-        for c in cities:
-            loc_mask |= df["location"].str.lower().str.contains(c.lower(), na=False)
-            loc_mask |= df["location_secondary"].str.lower().str.contains(c.lower(), na=False)
-        df = df[loc_mask]
-    if practice_areas:
-        pa_mask = pd.Series(False, index=df.index)
-        for pa in practice_areas:
-            pa_mask |= df["practice_areas"].str.lower().str.contains(pa.lower(), na=False)
-            pa_mask |= df["specialty"].str.lower().str.contains(pa.lower(), na=False)
-        df = df[pa_mask]
-    if title_filter:
-        title_col = df["title"].str.lower().str.strip()
-        title_mask = title_col.isin(title_filter)
-        _COUNSEL_PARTNER_BLOCKLIST = ["counsel", "partner", "of counsel", "senior counsel",
-            "special counsel", "shareholder", "member", "principal", "director",
-            "chair", "co-chair", "vice chair", "head", "co-head"]
-        if "associate" in title_filter:
-            for blocked in _COUNSEL_PARTNER_BLOCKLIST:
-                title_mask &= ~title_col.str.contains(blocked, regex=False, na=False)
-        df = df[title_mask]
-
-    # Exclude attorneys currently at the hiring firm
-    hiring_firm = patterns.get("matched_firm", "") or firm_name
-    excluded_count = 0
-    if hiring_firm:
-        hf_lower = hiring_firm.lower()
-        current_firm_col = df["firm_name"].fillna("").str.lower().str.strip()
-        same_firm_mask = current_firm_col.str.contains(hf_lower, regex=False, na=False)
-        same_firm_mask |= current_firm_col.apply(lambda f: bool(f) and f in hf_lower)
-        excluded_count = int(same_firm_mask.sum())
-        df = df[~same_firm_mask]
-
-    filtered_count = len(df)
-    patterns["_practice_areas"] = practice_areas  # Pass to scorer for PA overlap
-    scored_df = score_attorneys_vectorized(df, keywords, patterns)
-    total_matched = len(scored_df)
-
-    top_df = scored_df.head(SHORTLIST_SIZE)
-    scored = []
-    for _, row in top_df.iterrows():
-        entry = row.to_dict()
-        extras = build_rationale_for_row(entry, keywords, patterns)
-        entry.update(extras)
-        # Flag boomerang candidates
-        if hiring_firm:
-            prior = str(entry.get("prior_experience", "")).lower()
-            if hiring_firm.lower() in prior:
-                entry["is_boomerang"] = True
-        scored.append(entry)
+    if not data.get("use_ai", True):
+        jd_text = result_cache.normalize_jd(jd_text)
+        events = _quick_match_stream(jd_text, exact_firm, skip_patterns, data.get("source", "all"))
+        return Response(request_timing.stream(events, request_timing.streaming()),
+                        mimetype="text/event-stream",
+                        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
 
-    city = " / ".join(cities) if cities else ""
-    meta = {
-        "firm_name": firm_name,
-        "matched_firm": patterns.get("matched_firm", ""),
-        "city": city, "state": state,
-        "grad_year_min": yr_min, "grad_year_max": yr_max,
-        "practice_areas": practice_areas,
-        "required_bars": required_bars,
-        "keywords": keywords,
-        "total_attorneys": total_attorneys,
-        "filtered_count": filtered_count,
-        "total_matched": total_matched,
-        "excluded_hiring_firm": excluded_count,
-    }
+    # Parse, filter and score (same plan as /api/search, without the school filter)
+    plan = SearchPlan(jd_text, exact_firm=exact_firm, skip_patterns=skip_patterns, law_school_filter=False)
+    scored = plan.run(SHORTLIST_SIZE)
+    patterns, meta = plan.patterns, plan.meta
 
     shortlist = scored[:SHORTLIST_SIZE]
     # Pre-serialize shortlist profiles for the client to merge
@@ -3678,34 +4585,35 @@ def search_stream():
 
     # Sanitize numpy types before JSON serialization
     safe_patterns = _sanitize_for_json(patterns)
-    safe_meta = _sanitize_for_json(meta)
+    safe_meta = _sanitize_for_json({**meta, "timings": request_timing.current().as_dict()})
 
     def generate():
         # Send patterns/meta + profiles immediately
         yield f"data: {json.dumps({'type': 'meta', 'hiring_patterns': safe_patterns, 'meta': safe_meta, 'profiles': shortlist_profiles})}\n\n"
 
-        # Stream the Claude response
-        for event in stream_claude_api(jd_text, patterns, shortlist, meta):
-            yield event
-            # When done, merge and save to session
-            if '"type": "done"' in event:
-                try:
-                    evt_data = json.loads(event.replace("data: ", "").strip())
-                    raw_candidates = evt_data.get("result", {}).get("candidates", [])
-                    merged = []
-                    for ac in raw_candidates:
-                        ac_name = (ac.get("name") or "").strip().lower()
-                        original = shortlist_by_name.get(ac_name, {})
-                        merged.append({**original, **ac})
-                    _session["jd"] = jd_text
-                    _session["candidates"] = merged
-                    _session["patterns"] = patterns
-                    _session["meta"] = meta
-                    _session["history"] = []
-                except Exception:
-                    pass
-
-    return Response(generate(), mimetype="text/event-stream",
+        # Stream the Claude response (the span includes the time the client takes to read it)
+        with request_timing.span("claude"):
+            for event in stream_claude_api(jd_text, patterns, shortlist, meta):
+                yield event
+                # When done, merge and save to session
+                if '"type": "done"' in event:
+                    try:
+                        evt_data = json.loads(event.replace("data: ", "").strip())
+                        raw_candidates = evt_data.get("result", {}).get("candidates", [])
+                        merged = []
+                        for ac in raw_candidates:
+                            ac_name = (ac.get("name") or "").strip().lower()
+                            original = shortlist_by_name.get(ac_name, {})
+                            merged.append({**original, **ac})
+                        _session["jd"] = jd_text
+                        _session["candidates"] = merged
+                        _session["patterns"] = patterns
+                        _session["meta"] = meta
+                        _session["history"] = []
+                    except Exception:
+                        pass
+
+    return Response(request_timing.stream(generate(), request_timing.streaming()), mimetype="text/event-stream",
                     headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
 
 
@@ -4734,6 +5642,7 @@ def api_remove_record_note(record_type, record_source, record_id, note_id):
 # ---- Attorney search for pipeline add ----
 
 @app.route("/api/attorneys/search", methods=["GET"])
+@startup.requires("attorneys")
 def api_search_attorneys():
     """Search attorneys by name for adding to pipeline."""
     q = request.args.get("q", "").strip().lower()
@@ -4764,6 +5673,7 @@ def api_search_attorneys():
 # ---- Single attorney lookup ----
 
 @app.route("/api/attorneys/<attorney_id>", methods=["GET"])
+@startup.requires("attorneys")
 def api_get_attorney(attorney_id):
     """Return full profile for a single attorney by ID."""
     if ATTORNEYS_DF.empty:
@@ -4777,6 +5687,7 @@ def api_get_attorney(attorney_id):
 
 
 @app.route("/api/attorneys/<attorney_id>/full-profile", methods=["GET"])
+@startup.requires("attorneys")
 def api_attorney_full_profile(attorney_id):
     """Return enriched attorney profile including pipeline entries and email history."""
     if ATTORNEYS_DF.empty:
@@ -4798,6 +5709,26 @@ def api_attorney_full_profile(attorney_id):
     })
 
 
+@app.route("/api/attorneys/<attorney_id>/best-fit-firms", methods=["GET"])
+@startup.requires("attorneys", "firms", "hiring_dna")
+def api_attorney_best_fit_firms(attorney_id):
+    """Firms whose Hiring DNA an attorney fits best (?limit=, default 25, max 100)."""
+    frame, hiring_dna = ATTORNEYS_DF, HIRING_DNA
+    if frame.empty:
+        return jsonify({"error": "No attorney data"}), 404
+    positions = np.flatnonzero((frame["id"] == str(attorney_id)).to_numpy())
+    if not len(positions):
+        return jsonify({"error": "Attorney not found"}), 404
+    limit = max(1, min(request.args.get("limit", BEST_FIT_FIRMS_LIMIT, type=int), 100))
+    firms = best_fit_firms(frame, hiring_dna, int(positions[0]), limit)
+    return jsonify(_sanitize_for_json({
+        "attorney_id": str(attorney_id),
+        "firms": firms,
+        "firms_scored": len(hiring_dna),
+        "strong_matches": sum(1 for f in firms if f["match_score"] >= 60),
+    }))
+
+
 @app.route("/api/attorneys/<attorney_id>/employment", methods=["GET"])
 def api_attorney_employment(attorney_id):
     """Return employment history for an attorney (stub — empty until API connected)."""
@@ -5051,6 +5982,8 @@ def _serialize_custom_job(cj):
 
 
 @app.route("/api/jobsearch", methods=["POST"])
+@startup.requires("jobs")
+@request_timing.timed("job_search")
 def job_search():
     data = request.get_json()
     query = data.get("query", "").strip()
@@ -5068,14 +6001,17 @@ def job_search():
     params = None
     ai_used = False
     if use_ai and ANTHROPIC_API_KEY and not JOBS_DF.empty:
-        params = _parse_job_query_with_claude(query)
+        with request_timing.span("claude"):
+            params = _parse_job_query_with_claude(query)
         if params:
             ai_used = True
     if not params:
-        params = _keyword_parse_job_query(query)
+        with request_timing.span("parse_query"):
+            params = _keyword_parse_job_query(query)
 
     # Search FP jobs
-    jobs = _search_jobs(params) if source_filter != "custom" else []
+    with request_timing.span("search_jobs"):
+        jobs = _search_jobs(params) if source_filter != "custom" else []
     for j in jobs:
         j.setdefault("source", "fp")
 
@@ -5083,10 +6019,11 @@ def job_search():
     if source_filter != "fp":
         custom_search = query
         custom_pa = params.get("practice_areas", [])
-        cj_list = ats_db.list_custom_jobs(
-            search=custom_search,
-            practice_area=custom_pa[0] if custom_pa else None,
-        )
+        with request_timing.span("custom_jobs"):
+            cj_list = ats_db.list_custom_jobs(
+                search=custom_search,
+                practice_area=custom_pa[0] if custom_pa else None,
+            )
         for cj in cj_list:
             jobs.append(_serialize_custom_job(cj))
 
@@ -5138,6 +6075,7 @@ def job_search():
             "min_years": params.get("min_years"),
             "max_years": params.get("max_years"),
         },
+        "timings": request_timing.current().as_dict(),
     })
 
 
@@ -5261,6 +6199,7 @@ def _firm_to_dict(row):
 
 
 @app.route("/api/firms")
+@startup.requires("firms", "hiring_dna")
 def api_firms():
     if FIRMS_DF.empty:
         return jsonify({"firms": [], "total": 0})
@@ -5311,6 +6250,7 @@ def api_firms():
 
 
 @app.route("/api/firms/search", methods=["POST"])
+@startup.requires("firms")
 def api_firms_search():
     """AI-powered firm search. Uses Claude to parse natural language query."""
     data = request.get_json(force=True)
@@ -5419,6 +6359,7 @@ Rules:
 
 
 @app.route("/api/firms/<firm_id>/jobs")
+@startup.requires("firms", "jobs")
 def api_firm_jobs(firm_id):
     """Get jobs from JOBS_DF where Firm Name matches this firm."""
     if FIRMS_DF.empty:
@@ -5436,6 +6377,7 @@ def api_firm_jobs(firm_id):
 
 
 @app.route("/api/firms/<firm_id>/pipeline")
+@startup.requires("firms")
 def api_firm_pipeline(firm_id):
     """Get pipeline candidates where attorney_firm matches or employer.name matches."""
     if FIRMS_DF.empty:
@@ -5465,6 +6407,7 @@ def api_firm_pipeline(firm_id):
 
 
 @app.route("/api/firms/my-clients")
+@startup.requires("firms")
 def api_firms_my_clients():
     """Return Active Client + Prospect firms enriched with job/pipeline/task data."""
     my_firms = ats_db.get_my_client_firms()
@@ -5575,6 +6518,7 @@ def api_firms_need_followup():
 
 
 @app.route("/api/firms/<firm_id>/status", methods=["PUT"])
+@startup.requires("firms")
 def api_firm_update_status(firm_id):
     """Update client_status, priority, owner, notes, next_follow_up for a firm."""
     data = request.get_json(force=True)
@@ -5600,6 +6544,7 @@ def api_firm_update_status(firm_id):
 
 
 @app.route("/api/firms/<firm_id>/pin", methods=["PUT"])
+@startup.requires("firms")
 def api_firm_pin(firm_id):
     """Toggle pin state for a firm."""
     data = request.get_json(force=True)
@@ -5619,6 +6564,7 @@ def api_firm_pin(firm_id):
 
 
 @app.route("/api/firms/<firm_id>/mark-active", methods=["POST"])
+@startup.requires("firms")
 def api_firm_mark_active(firm_id):
     """Quick-mark a firm as Active Client."""
     data = request.get_json(force=True)
@@ -5638,6 +6584,7 @@ def api_firm_mark_active(firm_id):
 
 
 @app.route("/api/firms/<firm_id>/relationship-timeline")
+@startup.requires("firms")
 def api_firm_relationship_timeline(firm_id):
     """Return CRM relationship timeline for a firm (notes, tasks, jobs, pipeline events)."""
     firm_name = ""
@@ -5693,6 +6640,7 @@ def api_firm_relationship_timeline(firm_id):
 
 
 @app.route("/api/firms/<firm_id>")
+@startup.requires("firms")
 def api_firm_detail(firm_id):
     if FIRMS_DF.empty:
         return jsonify({"error": "No firms data"}), 404
@@ -5730,6 +6678,7 @@ def api_firm_detail(firm_id):
 
 
 @app.route("/api/firms/<firm_id>/top-candidates")
+@startup.requires("attorneys", "firms", "hiring_dna")
 def api_firm_top_candidates(firm_id):
     """Return top 50 candidates matched against a firm's Hiring DNA."""
     if FIRMS_DF.empty:
@@ -5761,6 +6710,7 @@ def api_firm_top_candidates(firm_id):
 
 
 @app.route("/api/firms/<firm_id>/top-candidates/refresh", methods=["POST"])
+@startup.requires("attorneys", "firms", "hiring_dna")
 def api_firm_refresh_candidates(firm_id):
     """Clear cache and re-compute top candidates for a firm."""
     if FIRMS_DF.empty:
@@ -6011,7 +6961,7 @@ def _prefilter_similar(source_row, min_criteria=1, relaxed=False, skip_location=
     src_year = None
     if src_year_str.isdigit():
         src_year = int(src_year_str)
-        year_col = pd.to_numeric(df.get("graduationYear", pd.Series("", index=df.index)), errors="coerce")
+        year_col = data_snapshot.to_numeric(df.get("graduationYear", pd.Series("", index=df.index)))
         hard_mask = hard_mask & (year_col >= src_year - year_range) & (year_col <= src_year + year_range)
 
     # 3. Location (city-level)
@@ -6086,6 +7036,8 @@ def _prefilter_similar(source_row, min_criteria=1, relaxed=False, skip_location=
 
 
 @app.route("/api/attorneys/similar", methods=["POST"])
+@startup.requires("attorneys")
+@request_timing.timed("find_similar")
 def api_find_similar():
     """Find attorneys similar to a given attorney."""
     start_time = time.time()
@@ -6107,7 +7059,8 @@ def api_find_similar():
 
     # Pre-filter with hard filters (title, class year, location) + soft criteria
     # Adaptive pool sizing is handled inside _prefilter_similar
-    pool = _prefilter_similar(source_row, min_criteria=1)
+    with request_timing.span("prefilter"):
+        pool = _prefilter_similar(source_row, min_criteria=1)
 
     if pool.empty:
         return jsonify({
@@ -6116,13 +7069,15 @@ def api_find_similar():
             "similar": [],
             "pool_size": 0,
             "elapsed_seconds": round(time.time() - start_time, 1),
+            "timings": request_timing.current().as_dict(),
         })
 
     # Build Claude prompt
-    source_block = _build_source_block(source_row)
-    pool_blocks = []
-    for _, row in pool.iterrows():
-        pool_blocks.append(_build_pool_block(row))
+    with request_timing.span("prompt"):
+        source_block = _build_source_block(source_row)
+        pool_blocks = []
+        for _, row in pool.iterrows():
+            pool_blocks.append(_build_pool_block(row))
 
     # Limit to keep within token budget
     pool_text = "\n---\n".join(pool_blocks[:250])
@@ -6137,13 +7092,14 @@ Find the top 25 most similar attorneys from the candidate pool. Return JSON only
 
     try:
         client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
-        resp = client.messages.create(
-            model=CLAUDE_MODEL,
-            max_tokens=4000,
-            temperature=0,
-            system=SIMILAR_SYSTEM_PROMPT,
-            messages=[{"role": "user", "content": user_prompt}],
-        )
+        with request_timing.span("claude"):
+            resp = client.messages.create(
+                model=CLAUDE_MODEL,
+                max_tokens=4000,
+                temperature=0,
+                system=SIMILAR_SYSTEM_PROMPT,
+                messages=[{"role": "user", "content": user_prompt}],
+            )
         text = resp.content[0].text.strip()
         if text.startswith("```"):
             text = re.sub(r"^```(?:json)?\s*", "", text)
@@ -6159,24 +7115,26 @@ Find the top 25 most similar attorneys from the candidate pool. Return JSON only
     similar_raw = result.get("similar_attorneys", [])
     enriched = []
 
-    for s in similar_raw:
-        aid = str(s.get("attorney_id", ""))
-        amatch = ATTORNEYS_DF[ATTORNEYS_DF["id"].astype(str) == aid]
-        if amatch.empty:
-            continue
-        arow = amatch.iloc[0]
-        candidate = _serialize_candidate(arow.to_dict())
-        candidate["similarity_rank"] = s.get("similarity_rank", 0)
-        candidate["similarity_score"] = s.get("similarity_score", 0)
-        candidate["similarity_reason"] = s.get("reason", "")
-        enriched.append(candidate)
+    with request_timing.span("enrich"):
+        for s in similar_raw:
+            aid = str(s.get("attorney_id", ""))
+            amatch = ATTORNEYS_DF[ATTORNEYS_DF["id"].astype(str) == aid]
+            if amatch.empty:
+                continue
+            arow = amatch.iloc[0]
+            candidate = _serialize_candidate(arow.to_dict())
+            candidate["similarity_rank"] = s.get("similarity_rank", 0)
+            candidate["similarity_score"] = s.get("similarity_score", 0)
+            candidate["similarity_reason"] = s.get("reason", "")
+            enriched.append(candidate)
 
     # Also check pipeline status for all returned attorneys
     pipeline_ids = [str(c["id"]) for c in enriched if c.get("id")]
     pipeline_status = {}
     if pipeline_ids:
         try:
-            pipeline_status = ats_db.get_pipeline_status_for_attorneys(pipeline_ids)
+            with request_timing.span("pipeline_status"):
+                pipeline_status = ats_db.get_pipeline_status_for_attorneys(pipeline_ids)
         except Exception:
             pass
 
@@ -6191,6 +7149,7 @@ Find the top 25 most similar attorneys from the candidate pool. Return JSON only
         "similar": enriched,
         "pool_size": len(pool),
         "elapsed_seconds": elapsed,
+        "timings": request_timing.current().as_dict(),
     })
 
 
@@ -6438,15 +7397,375 @@ def api_compare_pdf():
                      as_attachment=True, download_name=filename)
 
 
-import threading
+# Top-candidate precompute (precompute.py): the "top_candidates" stage
+# loads every firm's top candidates from their artifact (in the gunicorn
+# master, so the workers share them); after startup and every swap the
+# firms still missing are scored in the background, most useful firms
+# first, on PRECOMPUTE's worker processes. Created at import, so under a
+# preloaded gunicorn its request-load count spans every worker. Its load
+# threshold defaults to the gunicorn worker count (pause while every
+# worker is serving); the count spans workers only when they fork from a
+# preloaded master, otherwise each worker pauses on its own load.
+PRECOMPUTE = precompute.from_env(
+    server_workers=int(os.environ.get("WEB_CONCURRENCY", 1)) if PRELOAD_MODE == "shared" else 1)
+
+# Statuses precomputed first, before recently viewed firms and the rest
+_PRECOMPUTE_STATUS_TIERS = {"Active Client": 0, "Prospect": 2}
+
+
+def _precompute_order():
+    """HIRING_DNA firms in precompute order.
+
+    Active Clients (pinned first), then recently viewed firms (latest
+    first), then Prospects, then the rest; firms with more hires first
+    within each group.
+    """
+    try:
+        statuses = ats_db.list_all_firm_statuses().values()
+        viewed = ats_db.get_recently_viewed(limit=200)
+    except Exception as e:
+        print(f"[Precompute] firm priorities unavailable: {e}")
+        statuses, viewed = [], []
+    tiers = {}
+    for i, row in enumerate(viewed):
+        resolved = _resolve_dna_firm_name(row["firm_name"])
+        if resolved:
+            tiers.setdefault(resolved, (1, i))
+    for st in statuses:
+        tier = _PRECOMPUTE_STATUS_TIERS.get(st.get("client_status"))
+        resolved = _resolve_dna_firm_name(st["firm_name"]) if tier is not None else None
+        if resolved and (tier, 0) < tiers.get(resolved, (3, 0)):
+            tiers[resolved] = (tier, 0 if st.get("pinned") else 1)
+    return sorted(HIRING_DNA, key=lambda f: (*tiers.get(f, (3, 0)), -HIRING_DNA[f].get("total_hires", 0)))
+
+
+def _top_rows(frame, hiring_dna, firms):
+    """[(firm, positions, parts)]: each firm's top candidate rows of frame and their score parts."""
+    matrix = _dna_matrix_for(frame)
+    weights = {f: _firm_dna_weights(hiring_dna[f], f) for f in firms}
+    covered = [f for f in firms if matrix is not None and matrix.covers(weights[f])]
+    top = dict(zip(covered, matrix.top_rows([weights[f] for f in covered], TOP_CANDIDATES_LIMIT))) if covered else {}
+    for firm_name in firms:
+        if firm_name not in top:
+            components = _firm_dna_components(hiring_dna[firm_name], firm_name, frame)
+            top[firm_name] = _firm_top_rows(components, TOP_CANDIDATES_LIMIT)
+    return [(firm_name, *top[firm_name]) for firm_name in firms]
+
+
+def _precompute_batch(version, firms):
+    """PRECOMPUTE task: [(firm, positions, parts)] for firms, or None for another dataset version.
+
+    Runs in the scheduler's worker processes (forked, so the globals are
+    those of the moment the pool started) or on its thread.
+    """
+    if version != DATASET_VERSION:
+        return None
+    return _top_rows(ATTORNEYS_DF, HIRING_DNA, firms)
+
+
+precompute.register_task(_precompute_batch)
+
+
+def _store_precomputed(version, results):
+    """PRECOMPUTE store: candidate dicts for a batch, into the top-candidate cache."""
+    cache, df, dna_by_firm = _top_candidates_cache, ATTORNEYS_DF, HIRING_DNA
+    if version != DATASET_VERSION:
+        return  # reloaded; the new version runs its own pre-compute
+    for firm_name, positions, parts in results:
+        if firm_name not in cache:
+            cache[firm_name] = _firm_candidates(dna_by_firm[firm_name], df, positions, parts)
+
 
 def _precompute_top_candidates():
-    """Background: pre-compute top candidates for all firms with hiring DNA."""
-    count = 0
-    for firm_name in list(HIRING_DNA.keys()):
-        get_top_candidates(firm_name)
-        count += 1
-    print(f"[Background] Pre-computed top candidates for {count} firms.")
+    """Background: queue the firms with hiring DNA and no cached top candidates on PRECOMPUTE."""
+    startup.wait_until_ready()
+    version = DATASET_VERSION
+    cache = _top_candidates_cache
+    matrix = _dna_matrix_for(ATTORNEYS_DF)
+    if matrix is not None:
+        _firm_dna_tables(matrix, HIRING_DNA)  # for best-fit firms
+    firms = [f for f in _precompute_order() if f not in cache]
+    return PRECOMPUTE.run(version, firms, _store_precomputed)
+
+
+def _load_top_candidates(frame, hiring_dna, build):
+    """Every hiring_dna firm's top candidates from their artifact, or {} without a fresh one.
+
+    With build, a missing or stale artifact is scored here and saved
+    (scripts and `python artifacts.py build`); a server leaves it to the
+    background precompute instead, which scores in priority order and
+    pauses under load.
+    """
+    inputs = frame[[c for c in _DNA_MATRIX_INPUTS if c in frame.columns]]
+    key = artifacts.fingerprint(inputs, sorted(hiring_dna.items()), TOP_CANDIDATES_LIMIT, "v1")
+    if build:
+        rows = artifacts.load_or_build("top_candidates", key, lambda: _top_rows(frame, hiring_dna, list(hiring_dna)))
+    else:
+        rows = artifacts.load("top_candidates", key)
+    return {firm_name: _firm_candidates(hiring_dna[firm_name], frame, positions, parts)
+            for firm_name, positions, parts in rows or ()}
+
+
+@startup.stage("top_candidates", shared=True)
+def _load_top_candidates_stage():
+    global _top_candidates_cache
+    matrix = _dna_matrix_for(ATTORNEYS_DF)
+    if matrix is not None:
+        _firm_dna_tables(matrix, HIRING_DNA)  # for best-fit firms, shared with the workers too
+    _top_candidates_cache = _load_top_candidates(ATTORNEYS_DF, HIRING_DNA, build=PRELOADED)
+
+
+# Process that started the background work (threads do not survive fork)
+_background_pid = None
+
+
+def start_background_tasks():
+    """Start this process's work: the process pools, the startup stages not
+    yet run, top-candidate precompute and the reload watcher. Called by
+    gunicorn.conf.py's post_fork, by `python app.py`, and on import when
+    JAIDE_BACKGROUND_TASKS=1; once per process.
+
+    The pools fork first, while no other thread runs (a fork copies locks
+    other threads may hold). The precompute pool scores the data it
+    inherits, so it is only forked when that is loaded (preloaded by the
+    gunicorn master) and some firm still needs scoring.
+    """
+    global _background_pid
+    if _background_pid == os.getpid():
+        return
+    _background_pid = os.getpid()
+    SCORING_ENGINE.start()
+    if startup.is_ready("attorneys", "hiring_dna") and set(HIRING_DNA) - set(_top_candidates_cache):
+        PRECOMPUTE.fork_pool(DATASET_VERSION)
+    startup.start()
+    threading.Thread(target=_precompute_top_candidates, daemon=True).start()
+    hot_reload.start_watcher()
+
+
+# ---------------------------------------------------------------------------
+# Hot reload — rebuild every dataset off to the side, then swap it in
+# ---------------------------------------------------------------------------
+
+# Bumped on every swap; background work checks it to notice it is stale
+DATASET_VERSION = 1
+_dataset_swap_lock = threading.Lock()
+
+
+def _build_dataset():
+    """Load a complete new dataset version without touching the live globals.
+
+    Same loaders as the startup stages; stale snapshots, the bio store and
+    artifacts are rebuilt on disk first (atomically, so the running version
+    keeps reading its old files).
+    """
+    data_snapshot.build_all()
+    attorneys_df, delta_result = _apply_attorney_deltas(load_attorneys(), attorney_delta.delta_files())
+    bio_updates = delta_result["bios"] if delta_result else {}
+    store = _load_attorney_bio_store()
+    if store is not None and bio_updates:
+        store = bio_store.patch_store(store, bio_updates)
+    hiring_df = load_hiring_history()
+    hiring_dna_by_firm = _load_hiring_dna(hiring_df)
+    aliases, sorted_keys = _load_school_aliases(attorneys_df)
+    return {
+        "ATTORNEY_KEYWORD_INDEX": _load_keyword_index(attorneys_df),
+        "ATTORNEY_DNA_MATRIX": _load_dna_matrix(attorneys_df, hiring_dna_by_firm),
+        "ATTORNEY_PRACTICE_TERMS": _load_practice_terms(attorneys_df),
+        "ATTORNEY_FILTER_INDEX": _load_filter_index(attorneys_df),
+        "FIRMS_DF": load_firms(),
+        "JOBS_DF": load_jobs(),
+        "ATTORNEYS_DF": attorneys_df,
+        "_attorney_bio_updates": bio_updates,
+        "_attorney_bio_store": store,
+        "HIRING_DF": hiring_df,
+        "FIRM_INDEX": _load_firm_index(hiring_df),
+        "HIRING_DNA": hiring_dna_by_firm,
+        "_LAW_SCHOOL_ALIASES": aliases,
+        "_LAW_SCHOOL_SORTED_KEYS": sorted_keys,
+        "_JD_MATCHER": _build_jd_matcher(aliases, sorted_keys),
+    }
+
+
+# Globals each startup stage loads; a swap replacing all of a stage's
+# globals marks that stage ready again, so one that failed at boot recovers
+_STAGE_GLOBALS = {
+    "firms": ("FIRMS_DF",),
+    "jobs": ("JOBS_DF",),
+    "attorneys": ("ATTORNEYS_DF",),
+    "bios": ("_attorney_bio_store",),
+    "hiring": ("HIRING_DF", "FIRM_INDEX"),
+    "hiring_dna": ("HIRING_DNA",),
+    "dna_matrix": ("ATTORNEY_DNA_MATRIX",),
+    "school_aliases": ("_LAW_SCHOOL_ALIASES", "_LAW_SCHOOL_SORTED_KEYS", "_JD_MATCHER"),
+    "practice_terms": ("ATTORNEY_PRACTICE_TERMS",),
+    "keyword_index": ("ATTORNEY_KEYWORD_INDEX",),
+    "filter_index": ("ATTORNEY_FILTER_INDEX",),
+}
+
+
+def _swap_dataset(bundle, top_candidates=None):
+    """Install a bundle from _build_dataset() and drop caches tied to the old version.
+
+    top_candidates seeds the new top-candidate cache with entries known to
+    be still valid (attorney deltas); by default it starts empty.
+    """
+    global DATASET_VERSION, _top_candidates_cache
+    with _dataset_swap_lock:
+        # Hold the old objects until after the update so no frame is freed
+        # (and no other thread can run) while the globals are half-swapped
+        previous = {name: globals()[name] for name in bundle}
+        globals().update(bundle)
+        _top_candidates_cache = dict(top_candidates or {})
+        DATASET_VERSION += 1
+        data_access.init(attorneys_df=ATTORNEYS_DF, jobs_df=JOBS_DF, firms_df=FIRMS_DF)
+        del previous
+    startup.mark_ready([stage for stage, names in _STAGE_GLOBALS.items() if all(n in bundle for n in names)])
+    SEARCH_SHORTLIST_CACHE.clear()
+    AI_RESULT_CACHE.clear()
+    SEARCH_RESULT_SETS.clear()
+    print(f"[Reload] dataset version {DATASET_VERSION}: {len(ATTORNEYS_DF):,} attorneys, "
+          f"{len(HIRING_DF):,} hires, {len(HIRING_DNA)} firms with DNA")
+    threading.Thread(target=_precompute_top_candidates, daemon=True).start()
+
+
+def _top_candidates_after_delta(cache, result):
+    """The cached top-candidate lists an attorney delta cannot have changed.
+
+    Scores depend only on the attorney's own row and the firm's DNA, so a
+    firm's cached list stays exact unless it contains a changed/deleted
+    attorney, or a new/updated row scores at least as high as its last entry
+    (any positive score while the list is shorter than the limit).
+    """
+    kept = {}
+    changed = result["changed_rows"]
+    for firm, cached in cache.items():
+        if any(c["id"] in result["removed_ids"] for c in cached):
+            continue
+        best = score_candidates_for_firm(firm, attorneys_df=changed, limit=1) if len(changed) else []
+        if best and (len(cached) < TOP_CANDIDATES_LIMIT or best[0]["match_score"] >= cached[-1]["match_score"]):
+            continue
+        kept[firm] = cached
+    return kept
+
+
+def _apply_new_attorney_deltas(paths):
+    """Apply new delta files to the live attorney data and swap the result in."""
+    if not startup.is_ready("attorneys"):
+        return None  # nothing to patch; the next full reload applies every delta
+    t0 = time.perf_counter()
+    df, result = _apply_attorney_deltas(ATTORNEYS_DF, paths)
+    if result is None:
+        return None
+    bio_updates = {**_attorney_bio_updates, **result["bios"]}
+    aliases, sorted_keys = _load_school_aliases(df)
+    kw_index = _keyword_index_for(ATTORNEYS_DF)
+    if kw_index is not None:
+        changed = keyword_index.build(_attorney_keyword_text(result["changed_rows"]), JD_KEYWORD_PHRASES)
+        kw_index = kw_index.remapped(result["take"], changed)
+        kw_index.frame = df
+    else:
+        kw_index = _load_keyword_index(df)
+    term_matrix = _practice_terms_for(ATTORNEYS_DF)
+    if term_matrix is not None:
+        changed = practice_terms.build(_attorney_spec_text(result["changed_rows"]))
+        term_matrix = term_matrix.remapped(result["take"], changed)
+        term_matrix.frame = df
+    else:
+        term_matrix = _load_practice_terms(df)
+    dna_scores = _dna_matrix_for(ATTORNEYS_DF)
+    if dna_scores is not None:
+        changed = dna_matrix.build(_dna_feature_columns(result["changed_rows"]), dna_scores.patterns)
+        dna_scores = dna_scores.remapped(result["take"], changed)
+        dna_scores.frame = df
+    else:
+        dna_scores = _load_dna_matrix(df, HIRING_DNA)
+    cache = _top_candidates_cache
+    kept = _top_candidates_after_delta(cache, result)
+    _swap_dataset({
+        "ATTORNEYS_DF": df,
+        "ATTORNEY_KEYWORD_INDEX": kw_index,
+        "ATTORNEY_PRACTICE_TERMS": term_matrix,
+        "ATTORNEY_DNA_MATRIX": dna_scores,
+        "ATTORNEY_FILTER_INDEX": _load_filter_index(df),
+        "_attorney_bio_updates": bio_updates,
+        "_attorney_bio_store": bio_store.patch_store(_attorney_bio_store, result["bios"]),
+        "_LAW_SCHOOL_ALIASES": aliases,
+        "_LAW_SCHOOL_SORTED_KEYS": sorted_keys,
+        "_JD_MATCHER": _build_jd_matcher(aliases, sorted_keys),
+    }, top_candidates=kept)
+    stats = {k: len(result[k]) for k in ("inserted", "updated", "deleted")}
+    stats.update(stale=result["stale"], files=len(paths), top_candidates_kept=len(kept),
+                 top_candidates_invalidated=len(cache) - len(kept),
+                 seconds=round(time.perf_counter() - t0, 3))
+    print(f"[Delta] {stats}")
+    return stats
+
+
+hot_reload.configure(build=_build_dataset, swap=_swap_dataset, apply_deltas=_apply_new_attorney_deltas)
+
+
+@app.route("/api/admin/reload", methods=["GET", "POST"])
+def api_admin_reload():
+    """POST: reload the FP exports in the background. GET: reload status."""
+    if request.method == "POST" and not hot_reload.request_reload("admin"):
+        return jsonify({"error": "A reload is already running", **hot_reload.status()}), 409
+    state = dict(hot_reload.status(), dataset_version=DATASET_VERSION)
+    return jsonify(state), (202 if request.method == "POST" else 200)
+
+
+@app.route("/api/admin/search-cache", methods=["GET", "DELETE"])
+def api_admin_search_cache():
+    """GET: hit/miss counters of the /api/search result caches and result sets (plus the scoring pool). DELETE: empty them."""
+    if request.method == "DELETE":
+        SEARCH_SHORTLIST_CACHE.clear()
+        AI_RESULT_CACHE.clear()
+        SEARCH_RESULT_SETS.clear()
+    return jsonify({"dataset_version": DATASET_VERSION,
+                    "caches": [SEARCH_SHORTLIST_CACHE.stats(), AI_RESULT_CACHE.stats()],
+                    "result_sets": SEARCH_RESULT_SETS.stats(), "scoring": SCORING_ENGINE.stats()})
+
+
+@app.route("/api/admin/precompute", methods=["GET", "POST"])
+def api_admin_precompute():
+    """GET: top-candidate precompute progress. POST {"action": "pause" | "resume" | "restart"}."""
+    if request.method == "POST":
+        action = (request.get_json(silent=True) or {}).get("action")
+        if action == "pause":
+            PRECOMPUTE.pause()
+        elif action == "resume":
+            PRECOMPUTE.resume()
+        elif action == "restart":
+            if not startup.is_ready("attorneys", "hiring_dna"):
+                return startup.not_ready_response(("attorneys", "hiring_dna"))
+            threading.Thread(target=_precompute_top_candidates, daemon=True).start()
+        else:
+            return jsonify({"error": "action must be pause, resume or restart"}), 400
+    return jsonify(dict(PRECOMPUTE.stats(), dataset_version=DATASET_VERSION,
+                        cached_firms=len(_top_candidates_cache), firms=len(HIRING_DNA)))
+
+
+@app.route("/api/admin/attorneys/delta", methods=["POST"])
+@startup.requires("attorneys")
+def api_admin_attorney_delta():
+    """Apply a changed-attorneys CSV (see attorney_delta.py) without a full reload.
+
+    The file is kept in data/deltas/ so restarts, full reloads and the other
+    workers (via their file watchers) apply it too.
+    """
+    upload = request.files.get("file")
+    data = upload.read() if upload else request.get_data()
+    if not data.strip():
+        return jsonify({"error": "Upload a CSV as 'file' or send it as the request body"}), 400
+    os.makedirs(attorney_delta.DELTA_DIR, exist_ok=True)
+    name = f"{datetime.now().strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}.csv"
+    path = os.path.join(attorney_delta.DELTA_DIR, name)
+    with open(path + ".tmp", "wb") as f:
+        f.write(data)
+    os.replace(path + ".tmp", path)  # the watchers only glob *.csv
+    stats = hot_reload.apply_deltas([path], blocking=True)
+    if stats is None:
+        return jsonify({"error": "Delta could not be applied", "file": name}), 422
+    return jsonify({"file": name, "dataset_version": DATASET_VERSION, **stats})
 
 @app.route("/debug", methods=["GET", "POST"])
 def debug_page():
@@ -6775,6 +8094,7 @@ def api_dashboard_jobs():
 # ---------------------------------------------------------------------------
 
 @app.route("/api/search/attorneys", methods=["GET"])
+@startup.requires("attorneys")
 def api_quicksearch_attorneys():
     """Return up to 10 attorneys matching ?q= (name search across FP + custom)."""
     q = (request.args.get("q") or "").strip().lower()
@@ -6821,6 +8141,7 @@ def api_quicksearch_attorneys():
 
 
 @app.route("/api/search/firms", methods=["GET"])
+@startup.requires("firms")
 def api_quicksearch_firms():
     """Return up to 10 firms matching ?q= (FP + custom)."""
     q = (request.args.get("q") or "").strip().lower()
@@ -6928,6 +8249,7 @@ def api_quicksearch_jobs():
 # ---------------------------------------------------------------------------
 
 @app.route("/api/firm-pitch/options", methods=["GET"])
+@startup.requires("firms")
 def firm_pitch_options():
     """Return offices and practice groups for a firm."""
     firm_name = (request.args.get("firm_name") or "").strip()
@@ -6955,6 +8277,8 @@ def firm_pitch_options():
 
 
 @app.route("/api/firm-pitch/generate", methods=["POST"])
+@startup.requires("attorneys", "hiring", "firms")
+@request_timing.timed("firm_pitch")
 def generate_firm_pitch():
     """Generate a firm pitch PDF document."""
     try:
@@ -6983,7 +8307,8 @@ def generate_firm_pitch():
             return jsonify({"error": "firm_name is required"}), 400
 
         # Compute all data
-        pitch_data = _compute_firm_pitch_data(firm_name, office, practice_group, attorney_id)
+        with request_timing.span("pitch_data"):
+            pitch_data = _compute_firm_pitch_data(firm_name, office, practice_group, attorney_id)
         matched_firm = pitch_data.get("matched_firm", firm_name)
 
         # Build charts
@@ -6991,32 +8316,35 @@ def generate_firm_pitch():
         cand_school = cand.get("law_school", "")
         cand_firm_str = cand.get("current_firm", "")
 
-        charts = {
-            "hiring_trend": _gen_fp_hiring_trend_chart(
-                pitch_data.get("hires_by_year", {}), matched_firm),
-            "net_growth": _gen_fp_net_growth_chart(
-                pitch_data.get("net_growth", {}), matched_firm),
-            "exit_breakdown": _gen_fp_exit_breakdown_chart(
-                pitch_data.get("dest_breakdown", {}), matched_firm),
-            "inhouse_destinations": _gen_fp_inhouse_destinations_chart(
-                pitch_data.get("inhouse_destinations", []), matched_firm),
-            "team_seniority": _gen_fp_team_seniority_chart(
-                pitch_data.get("team_by_title", {}),
-                f"Team Composition — {matched_firm[:25]}"),
-            "feeder_schools": _generate_feeder_bar_chart(
-                pitch_data.get("feeder_schools", []), cand_school,
-                f"Top Feeder Schools — {matched_firm[:22]}"),
-            "feeder_firms": _generate_feeder_bar_chart(
-                pitch_data.get("feeder_firms", []), cand_firm_str,
-                f"Top Feeder Firms — {matched_firm[:22]}"),
-        }
+        with request_timing.span("charts"):
+            charts = {
+                "hiring_trend": _gen_fp_hiring_trend_chart(
+                    pitch_data.get("hires_by_year", {}), matched_firm),
+                "net_growth": _gen_fp_net_growth_chart(
+                    pitch_data.get("net_growth", {}), matched_firm),
+                "exit_breakdown": _gen_fp_exit_breakdown_chart(
+                    pitch_data.get("dest_breakdown", {}), matched_firm),
+                "inhouse_destinations": _gen_fp_inhouse_destinations_chart(
+                    pitch_data.get("inhouse_destinations", []), matched_firm),
+                "team_seniority": _gen_fp_team_seniority_chart(
+                    pitch_data.get("team_by_title", {}),
+                    f"Team Composition — {matched_firm[:25]}"),
+                "feeder_schools": _generate_feeder_bar_chart(
+                    pitch_data.get("feeder_schools", []), cand_school,
+                    f"Top Feeder Schools — {matched_firm[:22]}"),
+                "feeder_firms": _generate_feeder_bar_chart(
+                    pitch_data.get("feeder_firms", []), cand_firm_str,
+                    f"Top Feeder Firms — {matched_firm[:22]}"),
+            }
         pitch_data["_charts"] = charts
 
         # Generate narratives via Claude
-        narratives = _generate_firm_pitch_narratives(pitch_data, custom_prompt, tone, anonymize)
+        with request_timing.span("claude"):
+            narratives = _generate_firm_pitch_narratives(pitch_data, custom_prompt, tone, anonymize)
 
         # Assemble PDF
-        pdf_buf = _assemble_firm_pitch_pdf(narratives, pitch_data, recruiter_info, anonymize)
+        with request_timing.span("pdf"):
+            pdf_buf = _assemble_firm_pitch_pdf(narratives, pitch_data, recruiter_info, anonymize)
 
         safe_name = re.sub(r"[^\w\s-]", "", matched_firm).strip().replace(" ", "_")[:40]
         return send_file(
@@ -7069,9 +8397,47 @@ def admin_catalog():
     return render_template("admin.html", today=today, user_name=session.get("user_name", "Admin"))
 
 
+def build_artifacts():
+    """Run every startup stage to completion, rebuilding a stale bio store and
+    stale artifacts on disk (`python artifacts.py build`). Returns the names of
+    the stages that failed."""
+    startup.run_all()
+    return [s["name"] for s in startup.readiness()["stages"] if s["state"] == "failed"]
+
+
+def _snapshots_prebuilt():
+    """True when the shared stages read fresh snapshots (no CSV to parse, no bio store to build).
+
+    Their artifacts are checked as they load: under artifacts.load_only() a
+    missing or stale one defers its stage, and the rest, to the workers.
+    """
+    return (all(data_snapshot.snapshot_is_fresh(name) or data_snapshot.source_csv_path(name) is None
+                for name in data_snapshot.DATASETS)
+            and bio_store.store_is_fresh())
+
+
+# See PRELOAD_MODE: the gunicorn master reads only the prebuilt snapshots
+# and artifacts before it binds; otherwise the server comes up immediately and the stages
+# load in the background.
+hot_reload.mark_loaded()
+if PRELOADED:
+    startup.run_all()
+elif PRELOAD_MODE == "shared":
+    with artifacts.load_only():
+        preloaded = startup.preload(_snapshots_prebuilt, defer=artifacts.NotBuilt)
+    print(f"[Startup] preloaded in the master: {', '.join(preloaded) or 'nothing (snapshots not prebuilt)'}")
+elif os.environ.get("JAIDE_BACKGROUND_TASKS") == "1" or __name__ == "__main__":
+    # Served without gunicorn.conf.py's hooks (`python app.py`, or plain
+    # `gunicorn app:app` with JAIDE_BACKGROUND_TASKS=1): fork the pools, then
+    # load and start this process's background work
+    start_background_tasks()
+else:
+    # A plain import (scripts, flask shell) loads in the background and
+    # starts no other work
+    startup.start()
+
+
 if __name__ == "__main__":
-    print(f"Loaded {len(ATTORNEYS_DF)} attorneys, {len(HIRING_DF)} hiring records, {len(JOBS_DF)} jobs, {len(FIRMS_DF)} firms.")
-    print(f"Hiring DNA computed for {len(HIRING_DNA)} firms. Pre-computing top candidates in background...")
+    print("Datasets loading in background (see /readyz). Top candidates pre-compute once ready...")
     _run_firm_status_migration()
-    threading.Thread(target=_precompute_top_candidates, daemon=True).start()
     app.run(debug=True, use_reloader=False, host='0.0.0.0', port=5000)
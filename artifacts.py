@@ -0,0 +1,168 @@
+"""
+artifacts.py — Persisted derived data keyed by a content hash of its inputs
+
+Hiring DNA, the firm word index, the law school alias map, the attorney
+indexes (DNA matrix, keyword index, practice terms, filter index) and every
+firm's top candidates are pure functions of a few dataset columns (plus some
+constants in app.py). Each is stored in data/snapshots/<name>.artifact
+together with a fingerprint of those inputs; at startup the artifact is
+loaded when the fingerprint matches and rebuilt (and rewritten atomically)
+when it does not.
+
+File layout: two consecutive pickles — a small header
+{"format", "name", "key", "built_at", "seconds"} and then the value — so a
+stale artifact is rejected without unpickling its payload.
+
+The gunicorn master loads artifacts before it binds its port, so it does
+that under load_only(): a missing or stale artifact raises NotBuilt instead
+of being rebuilt there, and the stage is left to the workers.
+
+Usage:
+    python artifacts.py build     # run the startup stages, (re)writing stale artifacts
+    python artifacts.py status    # list artifacts and their keys
+
+    dna = artifacts.load_or_build("hiring_dna", fingerprint(df[cols], "v1"),
+                                  lambda: compute_all_hiring_dna(df))
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+
+import data_snapshot
+
+ARTIFACT_DIR = data_snapshot.SNAPSHOT_DIR
+ARTIFACT_FORMAT = 1
+
+_load_only = False
+
+
+class NotBuilt(Exception):
+    """An artifact load_or_build() would have to build, under load_only()."""
+
+
+@contextmanager
+def load_only():
+    """Within the block, load_or_build() raises NotBuilt instead of building."""
+    global _load_only
+    _load_only = True
+    try:
+        yield
+    finally:
+        _load_only = False
+
+
+def artifact_path(name):
+    return os.path.join(ARTIFACT_DIR, f"{name}.artifact")
+
+
+def fingerprint(*parts):
+    """Content hash of the given inputs.
+
+    DataFrames and Series are hashed by value (column names, row order and
+    cell contents, not the index); anything else by its repr, so pass
+    constants in a deterministic form (e.g. sorted items).
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"format={ARTIFACT_FORMAT}".encode())
+    for part in parts:
+        if isinstance(part, (pd.DataFrame, pd.Series)):
+            names = list(part.columns) if isinstance(part, pd.DataFrame) else [part.name]
+            h.update(repr((type(part).__name__, names, len(part))).encode())
+            h.update(pd.util.hash_pandas_object(part, index=False).to_numpy().tobytes())
+        else:
+            h.update(repr(part).encode())
+    return h.hexdigest()
+
+
+def read_header(name):
+    """The stored header for an artifact, or None if missing/unreadable."""
+    try:
+        with open(artifact_path(name), "rb") as f:
+            header = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+    return header if isinstance(header, dict) else None
+
+
+def load(name, key):
+    """Return the stored value if its fingerprint matches key, else None."""
+    try:
+        with open(artifact_path(name), "rb") as f:
+            header = pickle.load(f)
+            if header.get("format") != ARTIFACT_FORMAT or header.get("key") != key:
+                return None
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None
+
+
+def save(name, key, value, seconds=None):
+    """Write an artifact atomically (readers see the old file or the new one)."""
+    os.makedirs(ARTIFACT_DIR, exist_ok=True)
+    path = artifact_path(name)
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    header = {
+        "format": ARTIFACT_FORMAT, "name": name, "key": key,
+        "built_at": time.strftime("%Y-%m-%dT%H:%M:%S"), "seconds": seconds,
+    }
+    with open(tmp_path, "wb") as f:
+        pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def load_or_build(name, key, build):
+    """Load artifact `name` if it was built from the same inputs, else build and store it."""
+    t0 = time.perf_counter()
+    value = load(name, key)
+    if value is not None:
+        print(f"[Artifacts] {name}: loaded in {(time.perf_counter() - t0) * 1000:.0f}ms")
+        return value
+    if _load_only:
+        raise NotBuilt(f"{name} artifact missing or stale")
+    value = build()
+    seconds = round(time.perf_counter() - t0, 3)
+    try:
+        save(name, key, value, seconds=seconds)
+        print(f"[Artifacts] {name}: rebuilt in {seconds:.2f}s and saved")
+    except OSError as e:
+        # Read-only data dir: keep serving the freshly built value
+        print(f"Warning: could not save artifact {name}: {e}")
+    return value
+
+
+def _status():
+    names = sorted(f[:-len(".artifact")] for f in os.listdir(ARTIFACT_DIR) if f.endswith(".artifact")) \
+        if os.path.isdir(ARTIFACT_DIR) else []
+    if not names:
+        print("No artifacts built.")
+    for name in names:
+        header = read_header(name) or {}
+        size_kb = os.path.getsize(artifact_path(name)) / 1024
+        print(f"{name:<16} key={header.get('key', '?')[:12]}  built {header.get('built_at', '?')}  "
+              f"({header.get('seconds')}s to build, {size_kb:,.0f} KB)")
+
+
+if __name__ == "__main__":
+    cmd = sys.argv[1] if len(sys.argv) > 1 else "build"
+    if cmd == "build":
+        # The startup stages load or rebuild their artifacts through load_or_build(),
+        # all of them in this thread (see app.PRELOAD_MODE)
+        os.environ["JAIDE_PRELOAD"] = "1"
+        import app
+        failed = app.build_artifacts()
+        _status()
+        if failed:
+            print(f"Failed stages: {', '.join(failed)}")
+            sys.exit(1)
+    elif cmd == "status":
+        _status()
+    else:
+        print(__doc__)
+        sys.exit(2)
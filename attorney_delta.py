@@ -0,0 +1,213 @@
+"""
+attorney_delta.py — Apply changed-attorney files to the loaded attorney frame
+
+A delta file is a CSV with the attorneys.csv columns (any subset that
+includes `id`), one row per changed profile, plus an optional `_action`
+column ("delete" removes the attorney; anything else is an upsert). Delta
+files live in data/deltas/ and are applied in file-name order on top of the
+full export, at startup, on every full reload and whenever a new one
+appears (hot_reload.py).
+
+Rows are keyed by `id` and ordered by `scraped_on`: within the deltas the
+latest row per id wins, and a row is ignored when the loaded profile was
+scraped later (so deltas already folded into a newer full export are
+harmless). Updates replace the row in place, inserts are appended and
+deletes drop the row — the same frame a full load of the merged CSV gives.
+
+Usage:
+    python attorney_delta.py bench [--base 500000] [--delta 5000]
+
+    delta = attorney_delta.read_delta(attorney_delta.delta_files())
+    new_df, result = attorney_delta.apply_delta(ATTORNEYS_DF, delta)
+    result["removed_ids"], result["changed_rows"], result["bios"]
+"""
+
+import glob
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+import bio_store
+import data_snapshot
+
+DELTA_DIR = os.path.join(data_snapshot.DATA_DIR, "deltas")
+ACTION_COLUMN = "_action"
+
+
+def delta_files():
+    """Delta CSVs in DELTA_DIR, in the order they are applied."""
+    return sorted(glob.glob(os.path.join(DELTA_DIR, "*.csv")))
+
+
+def read_delta(paths):
+    """Read delta files into one str frame holding the latest row per id."""
+    if isinstance(paths, str):
+        paths = [paths]
+    frames = [pd.read_csv(p, dtype=str, low_memory=False) for p in paths]
+    frames = [f for f in frames if "id" in f.columns and not f.empty]
+    if not frames:
+        return pd.DataFrame(columns=["id"])
+    delta = pd.concat(frames, ignore_index=True).fillna("")
+    delta["id"] = delta["id"].str.strip()
+    delta = delta[delta["id"] != ""]
+    if "scraped_on" in delta.columns:
+        order = _timestamps(delta["scraped_on"]).argsort(kind="stable")
+        delta = delta.iloc[order]
+    return delta.drop_duplicates("id", keep="last").reset_index(drop=True)
+
+
+def _timestamps(series):
+    return pd.to_datetime(series.astype(object), errors="coerce", format="mixed").to_numpy()
+
+
+def _as_base_dtype(values, base):
+    """Convert delta text to the dtype of the matching base column."""
+    if isinstance(base.dtype, pd.CategoricalDtype):
+        return pd.Categorical(values, categories=base.cat.categories)
+    if pd.api.types.is_bool_dtype(base.dtype):
+        return values.str.upper().eq("TRUE").to_numpy()
+    return pd.array(values, dtype=base.dtype)
+
+
+def apply_delta(base, delta):
+    """Apply a read_delta() frame to an attorney frame.
+
+    Returns (new_df, result); base is not modified. result holds the id
+    lists ("inserted", "updated", "deleted"), "stale" (rows skipped because
+    the loaded profile is newer), "removed_ids" (ids whose old row is gone:
+    updated + deleted), "changed_rows" (the new rows, in the base layout)
+    "bios" ({id: bio text}, "" for deleted attorneys) and "take" (per new
+    row: its base position, or len(base) + i for row i of changed_rows).
+    """
+    base_ids = base["id"].astype(object).astype(str)
+    first = ~base_ids.duplicated().to_numpy()
+    lookup = pd.Series(np.flatnonzero(first), index=base_ids[first].to_numpy())
+    pos = lookup.reindex(delta["id"].to_numpy()).fillna(-1).astype(np.int64).to_numpy()
+    matched = pos >= 0
+
+    is_delete = np.zeros(len(delta), dtype=bool)
+    if ACTION_COLUMN in delta.columns:
+        is_delete = delta[ACTION_COLUMN].str.strip().str.lower().eq("delete").to_numpy()
+    stale = np.zeros(len(delta), dtype=bool)
+    if "scraped_on" in delta.columns and "scraped_on" in base.columns and matched.any():
+        base_ts = _timestamps(base["scraped_on"].iloc[pos[matched]])
+        stale[matched] = _timestamps(delta["scraped_on"])[matched] < base_ts
+
+    deleted = matched & is_delete & ~stale
+    updated = matched & ~is_delete & ~stale
+    inserted = ~matched & ~is_delete
+    upserts = delta[updated | inserted]  # delta order: updates and inserts interleaved
+    upd_pos = pos[updated]
+    upd_rows = np.flatnonzero(updated[updated | inserted])
+    ins_rows = np.flatnonzero(inserted[updated | inserted])
+
+    # One gather per column: kept base rows (updated ones pointing at their
+    # new row, which follows the base in the combined column), then inserts
+    source = np.arange(len(base))
+    source[upd_pos] = len(base) + upd_rows
+    keep = np.ones(len(base), dtype=bool)
+    keep[pos[deleted]] = False
+    take = np.concatenate([source[keep], len(base) + ins_rows])
+    columns, new_rows = {}, {}
+    for col in base.columns:
+        column = base[col].reset_index(drop=True)
+        missing = col not in upserts.columns
+        values = (pd.Series([""] * len(upserts), dtype=object) if missing
+                  else upserts[col].reset_index(drop=True))
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            extra = pd.Index(values.unique()).difference(column.cat.categories)
+            if len(extra):
+                column = column.cat.add_categories(extra)
+        new = pd.Series(_as_base_dtype(values, column))
+        if missing and len(upd_rows):
+            # Column not in the delta: updated rows keep their old value
+            new.iloc[upd_rows] = column.iloc[upd_pos].to_numpy()
+        combined = pd.concat([column, new], ignore_index=True)
+        columns[col] = combined.take(take).reset_index(drop=True)
+        new_rows[col] = new
+    changed_rows = pd.DataFrame(new_rows)
+    out = pd.DataFrame(columns)
+
+    bios = {i: "" for i in delta["id"][deleted]}
+    if "attorneyBio" in upserts.columns or "matters" in upserts.columns:
+        ids, text = bio_store._bio_texts(upserts)
+        bios.update(zip(ids, text))
+    result = {
+        "inserted": delta["id"][inserted].tolist(),
+        "updated": delta["id"][updated].tolist(),
+        "deleted": delta["id"][deleted].tolist(),
+        "stale": int(stale.sum()),
+        "removed_ids": set(delta["id"][updated | deleted]),
+        "changed_rows": changed_rows,
+        "bios": bios,
+        "take": take,
+    }
+    return out, result
+
+
+def summary(result):
+    return (f"{len(result['updated']):,} updated, {len(result['inserted']):,} inserted, "
+            f"{len(result['deleted']):,} deleted, {result['stale']:,} stale")
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+
+def _scaled_base(n_rows):
+    """The loaded attorney frame repeated (with fresh ids) up to n_rows."""
+    df = data_snapshot.read_dataset("attorneys", compact=True)
+    reps = -(-n_rows // len(df))
+    base = pd.concat([df] * reps, ignore_index=True).iloc[:n_rows].reset_index(drop=True)
+    base["id"] = pd.array([str(10_000_000 + i) for i in range(n_rows)], dtype=df["id"].dtype)
+    return base
+
+
+def _synthetic_delta(base, n_rows, seed=7):
+    """n_rows changes: 70% updates, 20% inserts, 10% deletes, newer scraped_on."""
+    rng = np.random.default_rng(seed)
+    n_upd, n_del = int(n_rows * 0.7), int(n_rows * 0.1)
+    n_ins = n_rows - n_upd - n_del
+    picks = rng.choice(len(base), n_upd + n_del, replace=False)
+    text = base.iloc[picks].astype(object).astype(str)
+    text.loc[:, "title"] = "Partner"
+    text.loc[:, "scraped_on"] = "2099-01-01"
+    inserts = base.iloc[rng.choice(len(base), n_ins)].astype(object).astype(str)
+    inserts["id"] = [str(90_000_000 + i) for i in range(n_ins)]
+    delta = pd.concat([text, inserts], ignore_index=True)
+    delta[ACTION_COLUMN] = ""
+    delta.loc[n_upd:n_upd + n_del - 1, ACTION_COLUMN] = "delete"
+    return delta
+
+
+def bench(n_base=500_000, n_delta=5_000):
+    base = _scaled_base(n_base)
+    delta = _synthetic_delta(base, n_delta)
+    path = os.path.join(data_snapshot.SNAPSHOT_DIR, "_bench_delta.csv")
+    delta.to_csv(path, index=False)
+    try:
+        t0 = time.perf_counter()
+        parsed = read_delta(path)
+        t1 = time.perf_counter()
+        out, result = apply_delta(base, parsed)
+        t2 = time.perf_counter()
+    finally:
+        os.remove(path)
+    print(f"base {len(base):,} rows, delta {len(parsed):,} rows: {summary(result)} → {len(out):,} rows")
+    print(f"  read  {(t1 - t0) * 1000:7.0f} ms")
+    print(f"  apply {(t2 - t1) * 1000:7.0f} ms   ({len(parsed) / (t2 - t0):,.0f} delta rows/s end to end)")
+
+
+if __name__ == "__main__":
+    cmd = sys.argv[1] if len(sys.argv) > 1 else ""
+    if cmd == "bench":
+        args = sys.argv[2:]
+        n_base = int(args[args.index("--base") + 1]) if "--base" in args else 500_000
+        n_delta = int(args[args.index("--delta") + 1]) if "--delta" in args else 5_000
+        bench(n_base, n_delta)
+    else:
+        print(__doc__)
+        sys.exit(2)
@@ -0,0 +1,316 @@
+"""
+bio_store.py — Memory-mapped attorney bio store
+
+Stores every attorney's bio + matters text in one offset-indexed file
+(data/snapshots/attorney_bios.bin) that workers memory-map read-only. Pages
+live in the OS page cache, so N gunicorn workers share a single copy instead
+of each holding a dict of several hundred MB of Python strings.
+
+File layout (little-endian):
+    8 bytes   magic b"JBIOS01\\0"
+    8 bytes   header length H
+    H bytes   JSON header (count, id width, compression, section offsets)
+    ids       count x S{width}  — attorney ids, sorted (binary search)
+    offsets   count x uint64    — record start, relative to the data section
+    lengths   count x uint32    — record byte length
+    data      records, utf-8, optionally zlib-compressed one by one
+
+Usage:
+    python bio_store.py build [--force] [--no-compress]
+    python bio_store.py bench        # per-worker memory: dict cache vs mmap
+
+    store = open_store()
+    store.get("1234567")             # "" when unknown
+    store = patch_store(store, {"1234567": "new bio"})   # attorney deltas
+"""
+
+import gc
+import json
+import mmap
+import os
+import random
+import struct
+import subprocess
+import sys
+import time
+import zlib
+
+import numpy as np
+import pandas as pd
+
+import data_snapshot
+
+STORE_PATH = os.path.join(data_snapshot.SNAPSHOT_DIR, "attorney_bios.bin")
+_MAGIC = b"JBIOS01\0"
+_FORMAT = 1
+
+
+# ---------------------------------------------------------------------------
+# Reader
+# ---------------------------------------------------------------------------
+
+class BioStore:
+    """Read-only view over a bio store file. Lookups decode one record lazily."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[:8] != _MAGIC:
+            raise ValueError(f"{path} is not a bio store")
+        (header_len,) = struct.unpack_from("<Q", self._mm, 8)
+        self.header = json.loads(self._mm[16:16 + header_len])
+        count = self.header["count"]
+        self._ids = np.frombuffer(self._mm, dtype=f"S{self.header['id_width']}",
+                                  count=count, offset=self.header["ids_offset"])
+        self._offsets = np.frombuffer(self._mm, dtype="<u8", count=count,
+                                      offset=self.header["offsets_offset"])
+        self._lengths = np.frombuffer(self._mm, dtype="<u4", count=count,
+                                      offset=self.header["lengths_offset"])
+        self._data_offset = self.header["data_offset"]
+        self._compressed = self.header["compression"] == "zlib"
+
+    def __len__(self):
+        return len(self._ids)
+
+    def get(self, attorney_id) -> str:
+        """Return bio + matters for an attorney id, or "" if unknown."""
+        key = str(attorney_id).encode("utf-8")
+        if not key or len(key) > self._ids.dtype.itemsize:
+            return ""
+        i = int(np.searchsorted(self._ids, key))
+        if i >= len(self._ids) or self._ids[i] != key:
+            return ""
+        start = self._data_offset + int(self._offsets[i])
+        raw = self._mm[start:start + int(self._lengths[i])]
+        if self._compressed:
+            raw = zlib.decompress(raw)
+        return raw.decode("utf-8")
+
+
+class PatchedBioStore:
+    """A bio store with some records replaced in memory (attorney deltas).
+
+    updates maps attorney id → text; deleted attorneys map to "".
+    """
+
+    def __init__(self, base, updates):
+        self.base = base
+        self.updates = dict(updates)
+
+    def __len__(self):
+        return len(self.base) if self.base is not None else 0
+
+    def get(self, attorney_id) -> str:
+        key = str(attorney_id)
+        if key in self.updates:
+            return self.updates[key]
+        return self.base.get(key) if self.base is not None else ""
+
+    def patched(self, updates):
+        return PatchedBioStore(self.base, {**self.updates, **updates})
+
+
+def patch_store(store, updates):
+    """Overlay updated records on a BioStore (or an already patched store)."""
+    if isinstance(store, PatchedBioStore):
+        return store.patched(updates)
+    return PatchedBioStore(store, updates)
+
+
+def open_store(path=STORE_PATH):
+    """Open the bio store at path, or return None if it has not been built."""
+    if not os.path.exists(path):
+        return None
+    return BioStore(path)
+
+
+# ---------------------------------------------------------------------------
+# Builder
+# ---------------------------------------------------------------------------
+
+def _source_path():
+    """The file the store is derived from: the attorneys CSV, else its snapshot."""
+    csv_path = data_snapshot.source_csv_path("attorneys")
+    if csv_path is not None:
+        return csv_path
+    snap = data_snapshot.snapshot_path("attorneys")
+    return snap if os.path.exists(snap) else None
+
+
+def store_is_fresh(path=STORE_PATH):
+    """True when the store exists and is newer than the attorney source data."""
+    source = _source_path()
+    if not os.path.exists(path) or source is None:
+        return os.path.exists(path)
+    try:
+        store = BioStore(path)
+    except (OSError, ValueError):
+        return False
+    if store.header.get("format") != _FORMAT or store.header.get("source") != os.path.basename(source):
+        return False
+    return os.path.getmtime(path) >= os.path.getmtime(source)
+
+
+def _bio_texts(df):
+    """Vectorized `(bio + (" " + matters if matters else "")).strip()` per row."""
+    ids = df["id"].astype(str).str.strip()
+    empty = pd.Series("", index=df.index)
+    bio = df["attorneyBio"].str.strip() if "attorneyBio" in df.columns else empty
+    matters = df["matters"].str.strip() if "matters" in df.columns else empty
+    text = bio.where(matters == "", bio + " " + matters).str.strip()
+    return ids, text
+
+
+def build_store(path=STORE_PATH, compress=True, force=False):
+    """Write the bio store from the attorney dataset. Returns True if it was (re)written."""
+    if not force and store_is_fresh(path):
+        return False
+    source = _source_path()
+    if source is None:
+        return False
+    t0 = time.time()
+    df = data_snapshot.read_dataset("attorneys", columns=["id", "attorneyBio", "matters"])
+    ids, texts = _bio_texts(df)
+    # Later rows win on duplicate ids, matching the old dict cache
+    keep = ~ids.duplicated(keep="last")
+    ids, texts = ids[keep].to_numpy(), texts[keep].to_numpy()
+
+    id_bytes = np.array([i.encode("utf-8") for i in ids], dtype=object)
+    width = max((len(b) for b in id_bytes), default=1)
+    order = np.argsort(np.array(id_bytes, dtype=f"S{width}"), kind="stable")
+
+    records = []
+    for i in order:
+        raw = texts[i].encode("utf-8")
+        records.append(zlib.compress(raw, 6) if compress else raw)
+    lengths = np.array([len(r) for r in records], dtype="<u4")
+    offsets = np.zeros(len(records), dtype="<u8")
+    if len(records) > 1:
+        offsets[1:] = np.cumsum(lengths[:-1], dtype="<u8")
+    sorted_ids = np.array(id_bytes[order], dtype=f"S{width}")
+
+    header = {
+        "format": _FORMAT,
+        "count": len(records),
+        "id_width": width,
+        "compression": "zlib" if compress else "none",
+        "source": os.path.basename(source),
+        "built_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    # Offsets depend on the header length, so size the header with placeholders first
+    for key in ("ids_offset", "offsets_offset", "lengths_offset", "data_offset"):
+        header[key] = 0
+    header_len = len(json.dumps(header)) + 64
+    pos = 16 + header_len
+    header["ids_offset"] = pos
+    pos += sorted_ids.nbytes
+    pos += -pos % 8
+    header["offsets_offset"] = pos
+    pos += offsets.nbytes
+    header["lengths_offset"] = pos
+    pos += lengths.nbytes
+    header["data_offset"] = pos
+    header_bytes = json.dumps(header).encode().ljust(header_len)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    with open(tmp_path, "wb") as f:
+        f.write(_MAGIC)
+        f.write(struct.pack("<Q", header_len))
+        f.write(header_bytes)
+        f.write(sorted_ids.tobytes())
+        f.write(b"\0" * (header["offsets_offset"] - f.tell()))
+        f.write(offsets.tobytes())
+        f.write(lengths.tobytes())
+        for r in records:
+            f.write(r)
+    os.replace(tmp_path, path)  # atomic: open readers keep the old inode
+    size_mb = os.path.getsize(path) / 1024 / 1024
+    print(f"Bio store: {len(records):,} records → {size_mb:.1f} MB "
+          f"({header['compression']}) in {time.time() - t0:.1f}s")
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Benchmark — per-worker memory of the old dict cache vs the mmap store
+# ---------------------------------------------------------------------------
+
+def _memory_mb():
+    """Rss and anonymous (heap, per-process) bytes from smaps_rollup, in MB.
+
+    File-backed mmap pages count toward Rss but live in the shared page cache;
+    Anonymous is what each extra worker actually costs.
+    """
+    fields = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[1].isdigit():
+                fields[parts[0].rstrip(":")] = int(parts[1]) / 1024
+    return {
+        "rss": fields.get("Rss", 0),
+        "anon": fields.get("Anonymous", 0),
+    }
+
+
+def _bench_one(mode, lookups):
+    before = _memory_mb()
+    t0 = time.perf_counter()
+    if mode == "dict":
+        df = data_snapshot.read_dataset("attorneys", columns=["id", "attorneyBio", "matters"])
+        ids, texts = _bio_texts(df)
+        cache = dict(zip(ids, texts))
+        del df, ids, texts
+        get = lambda aid: cache.get(str(aid), "")
+        keys = list(cache)
+    else:
+        store = open_store()
+        get = store.get
+        keys = [k.decode() for k in store._ids]
+    ready = time.perf_counter() - t0
+    sample = random.Random(0).sample(keys, min(lookups, len(keys)))
+    t1 = time.perf_counter()
+    chars = sum(len(get(k)) for k in sample)
+    per_lookup_us = (time.perf_counter() - t1) / max(len(sample), 1) * 1e6
+    entries = len(keys)
+    del keys, sample  # bench scaffolding, not part of the worker's footprint
+    gc.collect()
+    after = _memory_mb()
+    print(json.dumps({
+        "mode": mode, "entries": entries, "ready_s": round(ready, 3),
+        "lookup_us": round(per_lookup_us, 1), "chars": chars,
+        "rss_mb": round(after["rss"] - before["rss"], 1),
+        "anon_mb": round(after["anon"] - before["anon"], 1),
+    }))
+
+
+def bench(lookups=5000):
+    """Run each mode in a fresh worker-like process and print the memory it adds."""
+    build_store()
+    rows = []
+    for mode in ("dict", "mmap"):
+        out = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "_bench-one", mode, str(lookups)],
+            capture_output=True, text=True, check=True,
+        )
+        rows.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    print(f"{'mode':<8}{'entries':>10}{'ready s':>10}{'lookup µs':>11}{'+RSS MB':>10}{'+anon MB':>10}")
+    for r in rows:
+        print(f"{r['mode']:<8}{r['entries']:>10,}{r['ready_s']:>10.3f}{r['lookup_us']:>11.1f}"
+              f"{r['rss_mb']:>10.1f}{r['anon_mb']:>10.1f}")
+    return rows
+
+
+if __name__ == "__main__":
+    cmd = sys.argv[1] if len(sys.argv) > 1 else "build"
+    if cmd == "build":
+        built = build_store(compress="--no-compress" not in sys.argv, force="--force" in sys.argv)
+        print("Bio store rebuilt." if built else "Bio store is fresh.")
+    elif cmd == "bench":
+        bench()
+    elif cmd == "_bench-one":
+        _bench_one(sys.argv[2], int(sys.argv[3]))
+    else:
+        print(__doc__)
+        sys.exit(2)
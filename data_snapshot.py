@@ -0,0 +1,419 @@
+"""
+data_snapshot.py — Columnar snapshots of the FP CSV exports
+
+Converts the CSV exports in data/ (attorneys, hiring history, jobs, firms)
+into typed Feather (Arrow IPC) files under data/snapshots/. Low-cardinality
+text columns are stored dictionary-encoded (pandas categoricals) and numeric
+columns as small integers, so a cold load is a memory-mapped column read
+instead of a full CSV parse.
+
+Usage:
+    python data_snapshot.py build [--force]   # (re)build stale snapshots
+    python data_snapshot.py bench             # CSV vs snapshot load time + RSS
+    python data_snapshot.py memory [name]     # per-column memory: str vs compact
+
+    from data_snapshot import read_dataset
+    df = read_dataset("attorneys", columns=ATTORNEY_COLUMNS)
+
+read_dataset() prefers a snapshot when it is newer than its source CSV and
+falls back to the CSV otherwise. Either way it returns the same frame the
+CSV loader always produced (every column str, missing values as "").
+
+Configuration (environment):
+    JAIDE_DATA_DIR   directory with the CSV exports (data/ next to this file);
+                     snapshots, artifacts and deltas live under it too
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+DATA_DIR = os.environ.get("JAIDE_DATA_DIR") or os.path.join(os.path.dirname(__file__), "data")
+SNAPSHOT_DIR = os.path.join(DATA_DIR, "snapshots")
+SNAPSHOT_FORMAT = 1
+
+# Heavy attorney columns the app never reads from the frame
+_ATTORNEY_DROP_COLUMNS = [
+    "fullbio_with_tags", "matters_with_tags", "prior_experience_with_tags",
+    "raw_memberships", "raw_notable_matters",
+]
+
+# ---------------------------------------------------------------------------
+# Dataset schemas
+# ---------------------------------------------------------------------------
+# sources:      candidate CSV files in DATA_DIR, first existing one wins
+# read_csv:     extra kwargs matching how app.py parses the CSV
+# categorical:  low-cardinality columns stored dictionary-encoded
+# integer:      columns stored as nullable small ints (only when lossless)
+# compact:      in-memory layout for read_dataset(compact=True) — "categorical"
+#               columns keep their text values ("" is a category, never NaN),
+#               "boolean" flags become bool (value.upper() == "TRUE"), and all
+#               other text becomes Arrow strings
+DATASETS = {
+    "attorneys": {
+        "sources": ["attorneys.csv", "attorneys_slim.csv"],
+        "read_csv": {"low_memory": False},
+        "drop": _ATTORNEY_DROP_COLUMNS,
+        "categorical": [
+            "firm_name", "firm_type", "location", "location_secondary", "title",
+            "lawSchool", "undergraduate", "llm_school", "barAdmissions",
+            "gender", "diverse", "top_200", "vault_50", "vault_10", "languages",
+        ],
+        "integer": ["graduationYear"],
+        "compact": {
+            "categorical": [
+                "firm_name", "firm_type", "location", "title", "lawSchool",
+                "gender", "graduationYear",
+            ],
+            "boolean": ["top_200", "vault_50", "vault_10"],
+        },
+    },
+    "hiring_history": {
+        "sources": ["hiring_history.csv"],
+        "read_csv": {},
+        "drop": [],
+        "categorical": [
+            "Firm", "Law School", "Previous Entity Type", "Moved From",
+            "Entity Type", "City", "State", "Title",
+        ],
+        "integer": ["Class Year"],
+    },
+    "jobs": {
+        "sources": ["jobs.csv"],
+        "read_csv": {"encoding": "utf-8-sig"},
+        "drop": [],
+        "categorical": ["Firm Name", "Status", "Practice Areas"],
+        "integer": ["MinYrs", "MaxYrs"],
+    },
+    "firms": {
+        "sources": ["firms.csv"],
+        "read_csv": {"encoding": "utf-8-sig"},
+        "drop": [],
+        "categorical": ["Practice Area Top 1", "Practice Area Top 2", "Practice Area Top 3"],
+        "integer": ["Partners", "Counsel", "Associates", "Total Attorneys"],
+    },
+}
+
+
+def source_csv_path(name):
+    """Return the CSV a dataset is built from, or None if none exists."""
+    for filename in DATASETS[name]["sources"]:
+        path = os.path.join(DATA_DIR, filename)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def snapshot_path(name):
+    return os.path.join(SNAPSHOT_DIR, f"{name}.feather")
+
+
+def _snapshot_meta(path):
+    """Read the snapshot's build metadata without loading any column data."""
+    try:
+        with pa.memory_map(path, "r") as source:
+            metadata = pa.ipc.open_file(source).schema.metadata or {}
+        return json.loads(metadata.get(b"jaide_snapshot", b"{}"))
+    except (OSError, pa.ArrowInvalid, ValueError):
+        return {}
+
+
+def snapshot_is_fresh(name):
+    """True when the snapshot exists, matches the current source CSV and is newer than it."""
+    snap = snapshot_path(name)
+    if not os.path.exists(snap):
+        return False
+    meta = _snapshot_meta(snap)
+    if meta.get("format") != SNAPSHOT_FORMAT:
+        return False
+    csv_path = source_csv_path(name)
+    if csv_path is None:
+        return True  # snapshot-only deploy
+    if meta.get("source") != os.path.basename(csv_path):
+        return False
+    return os.path.getmtime(snap) >= os.path.getmtime(csv_path)
+
+
+# ---------------------------------------------------------------------------
+# Loading
+# ---------------------------------------------------------------------------
+
+def _read_csv(name, csv_path, columns=None):
+    spec = DATASETS[name]
+    usecols = None
+    if columns is not None:
+        wanted = set(columns)
+        usecols = lambda c: c in wanted
+    elif spec["drop"]:
+        dropped = set(spec["drop"])
+        usecols = lambda c: c not in dropped
+    return pd.read_csv(csv_path, usecols=usecols, dtype=str, **spec["read_csv"])
+
+
+def _column_as_text(series):
+    """Convert a typed snapshot column back to the CSV loader's str/"" form."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        categories = np.asarray(series.cat.categories, dtype=object)
+        codes = series.cat.codes.to_numpy()
+        values = np.where(codes >= 0, categories[np.maximum(codes, 0)], "")
+        return pd.Series(values, index=series.index, name=series.name, dtype=object)
+    if pd.api.types.is_integer_dtype(series.dtype):
+        text = series.astype("string").fillna("")
+        return text.astype(object)
+    return series.fillna("").astype(object)
+
+
+def _read_snapshot(name, columns=None, typed=False):
+    path = snapshot_path(name)
+    if columns is not None:
+        with pa.memory_map(path, "r") as source:
+            available = set(pa.ipc.open_file(source).schema.names)
+        columns = [c for c in columns if c in available]
+    table = feather.read_table(path, columns=columns, memory_map=True)
+    df = table.to_pandas()
+    del table
+    if not typed:
+        df = pd.DataFrame({c: _column_as_text(df[c]) for c in df.columns}, index=df.index)
+    pa.default_memory_pool().release_unused()  # hand decode buffers back to the OS
+    return df
+
+
+def as_arrow_text(df):
+    """Return df with every object column stored as Arrow-backed strings.
+
+    The values stay str ("" for missing), but live in contiguous Arrow buffers
+    instead of one PyObject per cell — several times smaller, and reading them
+    never touches refcounts, so pages inherited from a preloaded gunicorn
+    master stay shared copy-on-write.
+    """
+    text_cols = [c for c in df.columns if df[c].dtype == object]
+    if not text_cols:
+        return df
+    return df.astype({c: "string[pyarrow]" for c in text_cols})
+
+
+def compact_frame(name, df):
+    """Apply the dataset's "compact" layout to a str/"" frame (see DATASETS)."""
+    spec = DATASETS[name].get("compact", {})
+    categorical = set(spec.get("categorical", ()))
+    boolean = set(spec.get("boolean", ()))
+    columns = {}
+    for col in df.columns:
+        series = df[col]
+        if col in boolean:
+            columns[col] = series.astype(object).str.upper() == "TRUE"
+        elif col in categorical:
+            cat = series.astype(object).astype("category")
+            if "" not in cat.cat.categories:
+                cat = cat.cat.add_categories("")  # so the app's .fillna("") stays valid
+            columns[col] = cat
+        elif series.dtype == object:
+            columns[col] = series.astype("string[pyarrow]")
+        else:
+            columns[col] = series
+    return pd.DataFrame(columns, index=df.index)
+
+
+def to_numeric(series):
+    """pd.to_numeric(series, errors="coerce"), parsing each category once for categoricals."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        numbers = pd.to_numeric(pd.Series(series.cat.categories, dtype=object), errors="coerce")
+        numbers = np.append(numbers.to_numpy(dtype=float), np.nan)  # code -1 (NaN) → NaN
+        return pd.Series(numbers[series.cat.codes.to_numpy()], index=series.index, name=series.name)
+    return pd.to_numeric(series, errors="coerce")
+
+
+def read_dataset(name, columns=None, typed=False, arrow_text=False, compact=False):
+    """Load a dataset, preferring a fresh snapshot over its CSV.
+
+    columns restricts the load to those columns (missing ones are ignored,
+    like the CSV usecols filter). With typed=False every column is str with
+    "" for missing values; typed=True returns the snapshot dtypes as stored
+    (categoricals / nullable ints) and only applies when a snapshot is used.
+    arrow_text=True stores the str columns as string[pyarrow] (as_arrow_text);
+    compact=True applies the dataset's compact layout (compact_frame).
+    Returns None when neither a snapshot nor a CSV exists.
+    """
+    df = None
+    if snapshot_is_fresh(name):
+        try:
+            df = _read_snapshot(name, columns=columns, typed=typed)
+        except (OSError, pa.ArrowInvalid) as e:
+            print(f"Warning: could not read {name} snapshot, falling back to CSV: {e}")
+    if df is None:
+        csv_path = source_csv_path(name)
+        if csv_path is None:
+            return None
+        df = _read_csv(name, csv_path, columns=columns).fillna("")
+    if compact:
+        return compact_frame(name, df)
+    return as_arrow_text(df) if arrow_text else df
+
+
+# ---------------------------------------------------------------------------
+# Building
+# ---------------------------------------------------------------------------
+
+def _lossless_int_column(series):
+    """Return series as the smallest nullable int dtype, or None if a value would change."""
+    values = series.dropna()
+    numeric = pd.to_numeric(values, errors="coerce")
+    if numeric.isna().any() or (numeric % 1 != 0).any():
+        return None
+    ints = numeric.astype("int64")
+    if not (ints.astype(str) == values).all():
+        return None  # e.g. "07" or "2019.0" would not round-trip
+    for dtype in ("Int16", "Int32", "Int64"):
+        info = np.iinfo(dtype.lower())
+        if ints.empty or (ints.min() >= info.min and ints.max() <= info.max):
+            return pd.to_numeric(series, errors="coerce").astype(dtype)
+    return None
+
+
+def _apply_schema(name, df):
+    spec = DATASETS[name]
+    typed = {}
+    for col in df.columns:
+        series = df[col]
+        if col in spec["integer"]:
+            as_int = _lossless_int_column(series)
+            if as_int is not None:
+                typed[col] = as_int
+                continue
+            print(f"  {name}.{col}: not losslessly integer, storing as categorical")
+            typed[col] = series.astype("category")
+        elif col in spec["categorical"]:
+            typed[col] = series.astype("category")
+        else:
+            typed[col] = series
+    return pd.DataFrame(typed, index=df.index)
+
+
+def build_snapshot(name, force=False):
+    """Convert one dataset's CSV into a snapshot. Returns True if it was (re)written."""
+    csv_path = source_csv_path(name)
+    if csv_path is None:
+        return False
+    if not force and snapshot_is_fresh(name):
+        return False
+    t0 = time.time()
+    df = _apply_schema(name, _read_csv(name, csv_path))
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    meta = dict(table.schema.metadata or {})
+    meta[b"jaide_snapshot"] = json.dumps({
+        "format": SNAPSHOT_FORMAT,
+        "source": os.path.basename(csv_path),
+        "source_size": os.path.getsize(csv_path),
+        "rows": len(df),
+        "built_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }).encode()
+    table = table.replace_schema_metadata(meta)
+
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    path = snapshot_path(name)
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    feather.write_feather(table, tmp_path)
+    os.replace(tmp_path, path)  # atomic: readers never see a partial file
+    size_mb = os.path.getsize(path) / 1024 / 1024
+    print(f"Snapshot {name}: {len(df):,} rows from {os.path.basename(csv_path)} "
+          f"→ {size_mb:.1f} MB in {time.time() - t0:.1f}s")
+    return True
+
+
+def build_all(force=False):
+    """Build every dataset snapshot whose CSV is present and newer than its snapshot."""
+    built = []
+    for name in DATASETS:
+        if build_snapshot(name, force=force):
+            built.append(name)
+    return built
+
+
+# ---------------------------------------------------------------------------
+# Benchmark — each measurement runs in a fresh interpreter so RSS is clean
+# ---------------------------------------------------------------------------
+
+def _rss_mb():
+    with open("/proc/self/statm") as f:
+        pages = int(f.read().split()[1])
+    return pages * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+
+
+def _bench_one(name, mode):
+    """Load one dataset in the current process and print timing/RSS as JSON."""
+    import gc
+    import resource
+    rss_before = _rss_mb()
+    t0 = time.perf_counter()
+    if mode == "csv":
+        df = _read_csv(name, source_csv_path(name)).fillna("")
+    else:
+        df = _read_snapshot(name, typed=(mode == "snapshot-typed"))
+    elapsed = time.perf_counter() - t0
+    gc.collect()
+    print(json.dumps({
+        "dataset": name, "mode": mode, "rows": len(df),
+        "seconds": round(elapsed, 3),
+        "rss_mb": round(_rss_mb() - rss_before, 1),
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "frame_mb": round(df.memory_usage(deep=True).sum() / 1024 / 1024, 1),
+    }))
+
+
+def bench():
+    """Compare CSV and snapshot cold-load time and resident memory per dataset."""
+    results = []
+    for name in DATASETS:
+        if source_csv_path(name) is None:
+            continue
+        build_snapshot(name)
+        for mode in ("csv", "snapshot", "snapshot-typed"):
+            out = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "_bench-one", name, mode],
+                capture_output=True, text=True, check=True,
+            )
+            results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    print(f"{'dataset':<16}{'mode':<16}{'rows':>10}{'load s':>10}{'+RSS MB':>10}{'peak MB':>10}{'frame MB':>10}")
+    for r in results:
+        print(f"{r['dataset']:<16}{r['mode']:<16}{r['rows']:>10,}{r['seconds']:>10.3f}"
+              f"{r['rss_mb']:>10.1f}{r['peak_rss_mb']:>10.1f}{r['frame_mb']:>10.1f}")
+    return results
+
+
+def memory_report(name="attorneys"):
+    """Per-column memory_usage(deep=True) of the str frame vs its compact layout."""
+    df = read_dataset(name)
+    if df is None:
+        print(f"{name}: no data")
+        return
+    compact = compact_frame(name, df)
+    before = df.memory_usage(deep=True, index=False)
+    after = compact.memory_usage(deep=True, index=False)
+    print(f"{name}: {len(df):,} rows")
+    print(f"{'column':<24}{'dtype':>16}{'str MB':>10}{'compact MB':>12}")
+    for col in df.columns:
+        print(f"{col:<24}{str(compact[col].dtype):>16}{before[col] / 2**20:>10.1f}{after[col] / 2**20:>12.1f}")
+    print(f"{'total':<24}{'':>16}{before.sum() / 2**20:>10.1f}{after.sum() / 2**20:>12.1f}")
+
+
+if __name__ == "__main__":
+    cmd = sys.argv[1] if len(sys.argv) > 1 else "build"
+    if cmd == "build":
+        built = build_all(force="--force" in sys.argv)
+        print(f"Snapshots rebuilt: {', '.join(built) if built else 'none (all fresh)'}")
+    elif cmd == "bench":
+        bench()
+    elif cmd == "memory":
+        memory_report(sys.argv[2] if len(sys.argv) > 2 else "attorneys")
+    elif cmd == "_bench-one":
+        _bench_one(sys.argv[2], sys.argv[3])
+    else:
+        print(__doc__)
+        sys.exit(2)
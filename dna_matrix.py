@@ -0,0 +1,302 @@
+"""
+dna_matrix.py — Hiring DNA scores for every firm in one batched pass
+
+score_candidates_for_firm() scores an attorney on seven components of a
+firm's Hiring DNA: feeder school, current/prior feeder firm, practice
+areas, specialties, class year, location and boomerang. The pandas path
+(_firm_dna_components in app.py) runs str.contains over the whole frame
+once per feeder firm, practice area, specialty and city, for every firm.
+
+Every input of those components is a function of one attorney column
+value, so DnaMatrix encodes each column once per dataset version:
+factorized into row codes over its distinct values, and — for the text
+columns the DNA searches (prior experience, practice areas, specialty) —
+the set of DNA patterns each distinct value contains, found with the same
+substring semantics as str.contains(regex=False) over every pattern of
+every firm. A firm's DNA becomes weight columns (points per school, per
+current firm, per pattern, ...), and scoring a block of rows against many
+firms at once is a gather of per-value tables plus, for the text columns,
+a row-wise sum (or max) over the weight rows of the patterns each row
+contains: a sparse attorney × pattern matrix times a pattern × firm
+weight matrix. The components match _firm_dna_components() exactly.
+
+top_rows() scores all rows against a list of firms in blocks of
+BLOCK_CELLS rows × firms and keeps, per firm, the `limit` best rows with
+a positive total (equal totals in row order, like top_k.select). The
+other way round, components(tables, [row]) scores one attorney against
+every firm whose weights went into tables (best-fit firms).
+
+Tests in tests/test_dna_matrix.py; `python -m tests.bench dna_matrix` times
+per-firm pandas vs matrix, and all firms in one pass.
+
+Usage:
+    matrix = dna_matrix.build(columns, patterns)        # once per dataset version
+    [(positions, parts), ...] = matrix.top_rows([weights_a, weights_b], limit=50)
+    parts = matrix.components(matrix.tables([weights_a, weights_b]), np.array([row]))
+"""
+
+import numpy as np
+import pandas as pd
+
+import keyword_index
+
+BLOCK_CELLS = 4_000_000  # rows × firms scored at once (~8 int16 arrays of this size live)
+
+CATEGORICAL = ("school", "current_firm", "location", "class_year")
+TEXT = ("prior", "practice_areas", "specialty")
+PARTS = ("total", "school", "firm", "current_firm", "pa", "spec", "cy", "loc", "boom")
+
+
+def _factorize(values):
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    return codes.astype(np.int32), list(uniques)
+
+
+def _incidence(uniques, patterns):
+    """(indptr, pattern ids): per distinct value, the patterns it contains (CSR)."""
+    pairs_value, pairs_pattern = [], []
+    for pattern_id, rows in enumerate(keyword_index.phrase_rows(pd.Series(uniques, dtype=object),
+                                                                patterns).values()):
+        pairs_value.append(rows)
+        pairs_pattern.append(np.full(len(rows), pattern_id, dtype=np.int32))
+    values = np.concatenate(pairs_value) if pairs_value else np.zeros(0, dtype=np.int64)
+    ids = np.concatenate(pairs_pattern) if pairs_pattern else np.zeros(0, dtype=np.int32)
+    order = np.argsort(values, kind="stable")
+    indptr = np.zeros(len(uniques) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(values, minlength=len(uniques)), out=indptr[1:])
+    return indptr, ids[order]
+
+
+class DnaMatrix:
+    """Encoded attorney columns for Hiring DNA scoring (positions = frame rows)."""
+
+    def __init__(self, codes, uniques, patterns, incidence, n_rows):
+        self.codes = codes            # column → int32 code per row (-1: no class year)
+        self.uniques = uniques        # column → distinct values
+        self.patterns = patterns      # text column → DNA patterns searched for
+        self.incidence = incidence    # text column → (indptr, pattern ids) per distinct value
+        self.n_rows = n_rows
+        self.frame = None  # the frame the positions refer to (set by the app, not pickled)
+        self.firm_tables = None  # (hiring_dna, firms, tables) for every firm (set by the app, not pickled)
+        self._lookup = {}
+
+    def __getstate__(self):
+        return {"codes": self.codes, "uniques": self.uniques, "patterns": self.patterns,
+                "incidence": self.incidence, "n_rows": self.n_rows}
+
+    def __setstate__(self, state):
+        self.__init__(state["codes"], state["uniques"], state["patterns"], state["incidence"], state["n_rows"])
+
+    @property
+    def nbytes(self):
+        return (sum(c.nbytes for c in self.codes.values())
+                + sum(p.nbytes + i.nbytes for p, i in self.incidence.values()))
+
+    def _index(self, column):
+        """value → position in uniques[column] (or patterns[column] for the text columns)."""
+        if column not in self._lookup:
+            values = self.patterns[column] if column in TEXT else self.uniques[column]
+            self._lookup[column] = {v: i for i, v in enumerate(values)}
+        return self._lookup[column]
+
+    def covers(self, weights):
+        """Whether every pattern the firm weights search for was encoded."""
+        wanted = {"prior": [*weights["prior"], weights["firm"]],
+                  "practice_areas": weights["practice_areas"], "specialty": weights["specialty"]}
+        return all(p in self._index(column) for column, values in wanted.items() for p in values)
+
+    def remapped(self, take, changed):
+        """Matrix for a frame rebuilt by an attorney delta.
+
+        changed is a matrix over the changed rows built with the same
+        patterns; take gives, per new row, its source position: < n_rows
+        for a row of this matrix, n_rows + i for row i of changed.
+        """
+        codes, uniques, incidence = {}, {}, {}
+        for column in self.codes:
+            index = {v: i for i, v in enumerate(self.uniques[column])}
+            merged = list(self.uniques[column])
+            new_ids = np.empty(len(changed.uniques[column]), dtype=np.int64)
+            appended = []
+            for i, value in enumerate(changed.uniques[column]):
+                if value not in index:
+                    index[value] = len(merged)
+                    merged.append(value)
+                    appended.append(i)
+                new_ids[i] = index[value]
+            changed_codes = changed.codes[column].astype(np.int64)
+            changed_codes = np.where(changed_codes < 0, -1, new_ids[np.maximum(changed_codes, 0)])
+            codes[column] = np.concatenate([self.codes[column], changed_codes]).astype(np.int32)[take]
+            uniques[column] = merged
+            if column in TEXT:
+                indptr, ids = self.incidence[column]
+                c_indptr, c_ids = changed.incidence[column]
+                lengths = np.diff(c_indptr)[appended]
+                extra = [c_ids[c_indptr[i]:c_indptr[i + 1]] for i in appended]
+                incidence[column] = (np.concatenate([indptr, indptr[-1] + np.cumsum(lengths)]),
+                                     np.concatenate([ids, *extra]).astype(np.int32))
+        return DnaMatrix(codes, uniques, self.patterns, incidence, len(take))
+
+    # -- scoring ------------------------------------------------------------
+
+    def tables(self, weights):
+        """Per-value and per-pattern weight tables for a list of firm weights (one column per firm)."""
+        n_firms = len(weights)
+        tables = {}
+        for column, key in (("school", "school"), ("current_firm", "current_firm")):
+            table = np.zeros((len(self.uniques[column]), n_firms), dtype=np.int16)
+            index = self._index(column)
+            for f, w in enumerate(weights):
+                for value, pts in w[key].items():
+                    if value in index:
+                        table[index[value], f] = pts
+            tables[column] = table
+
+        # Current employees: the firm name is in their firm, or their (non-empty) firm is in the name
+        firms = self.uniques["current_firm"]
+        index = self._index("current_firm")
+        names = list(dict.fromkeys(w["firm"] for w in weights))
+        containing = keyword_index.phrase_rows(pd.Series(firms, dtype=object), names)
+        at_firm = np.zeros((len(firms), n_firms), dtype=bool)
+        for f, w in enumerate(weights):
+            name = w["firm"]
+            at_firm[containing[name], f] = True
+            inside = {name[i:j] for i in range(len(name)) for j in range(i + 1, len(name) + 1)}
+            at_firm[[index[s] for s in inside if s in index], f] = True
+        tables["at_firm"] = at_firm
+
+        locations = self.uniques["location"]
+        cities = list(dict.fromkeys(c for w in weights for c in w["location"]))
+        city_rows = keyword_index.phrase_rows(pd.Series(locations, dtype=object), cities)
+        loc = np.zeros((len(locations), n_firms), dtype=np.int16)
+        for f, w in enumerate(weights):
+            for city in w["location"]:
+                loc[city_rows[city], f] = 5
+        tables["location"] = loc
+
+        # One extra row (index -1) for attorneys without a class year
+        years = np.array(self.uniques["class_year"] + [np.nan], dtype=float)[:, None]
+        lo, hi, med = (np.array([w["class_year"][k] for w in weights], dtype=float)[None, :] for k in range(3))
+        in_range = (years >= lo) & (years <= hi)
+        tables["class_year"] = np.where(in_range, 5, np.where(np.abs(years - med) <= 2, 3, 0)).astype(np.int16)
+
+        for column, key in (("prior", "prior"), ("practice_areas", "practice_areas"), ("specialty", "specialty")):
+            table = np.zeros((len(self.patterns[column]), n_firms), dtype=np.int16)
+            index = self._index(column)
+            for f, w in enumerate(weights):
+                items = w[key].items() if isinstance(w[key], dict) else ((p, 1) for p in w[key])
+                for pattern, pts in items:
+                    table[index[pattern], f] = pts
+            tables[column] = table
+        boom = np.zeros((len(self.patterns["prior"]), n_firms), dtype=np.int16)
+        for f, w in enumerate(weights):
+            boom[self._index("prior")[w["firm"]], f] = 10
+        tables["boomerang"] = boom
+        return tables
+
+    def _pattern_reduce(self, column, rows, table, op):
+        """Per row, op (np.add or np.maximum) over the table rows of the patterns its value contains."""
+        out = np.zeros((len(rows), table.shape[1]), dtype=np.int16)
+        if not table.any():
+            return out
+        indptr, ids = self.incidence[column]
+        values = self.codes[column][rows]
+        starts = indptr[values]
+        lengths = indptr[values + 1] - starts
+        # The k-th pattern of every row that has one: each row at most once per step
+        for k in range(int(lengths.max()) if len(lengths) else 0):
+            sel = np.flatnonzero(lengths > k)
+            gathered = table[ids[starts[sel] + k]]
+            out[sel] = op(out[sel], gathered)
+        return out
+
+    def components(self, tables, rows):
+        """Component scores of rows (sorted positions) for the firms in tables: name → (rows, firms)."""
+        school = tables["school"][self.codes["school"][rows]]
+        firm_codes = self.codes["current_firm"][rows]
+        current = tables["current_firm"][firm_codes]
+        prior = self._pattern_reduce("prior", rows, tables["prior"], np.maximum)
+        firm = np.minimum(current + prior, 25)
+        pa = np.minimum(self._pattern_reduce("practice_areas", rows, tables["practice_areas"], np.add), 20)
+        spec_count = self._pattern_reduce("specialty", rows, tables["specialty"], np.add)
+        spec = np.select([spec_count >= 3, spec_count == 2, spec_count == 1], [15, 10, 5], 0).astype(np.int16)
+        cy = tables["class_year"][self.codes["class_year"][rows]]
+        loc = tables["location"][self.codes["location"][rows]]
+        boom = self._pattern_reduce("prior", rows, tables["boomerang"], np.maximum)
+        total = school + firm + pa + spec + cy + loc + boom
+        total[tables["at_firm"][firm_codes]] = 0
+        return {"total": total, "school": school, "firm": firm, "current_firm": current,
+                "pa": pa, "spec": spec, "cy": cy, "loc": loc, "boom": boom}
+
+    def top_rows(self, weights, limit):
+        """Per firm weights: (positions, parts) of its `limit` best rows with a positive total.
+
+        Equal totals keep row order; parts are int64 arrays aligned with
+        positions, as _firm_top_rows() returns them.
+        """
+        n_firms = len(weights)
+        if not n_firms:
+            return []
+        tables = self.tables(weights)
+        block = max(limit, BLOCK_CELLS // n_firms)
+        # Running best: flat (firm, row, parts) arrays, at most `limit` per firm
+        kept_firm = np.zeros(0, dtype=np.int64)
+        kept_row = np.zeros(0, dtype=np.int64)
+        kept = None
+        threshold = np.zeros(n_firms, dtype=np.int64)  # a new row must score above this to enter
+        for start in range(0, self.n_rows, block):
+            rows = np.arange(start, min(start + block, self.n_rows))
+            parts = self.components(tables, rows)
+            total = parts["total"]
+            keep = total > threshold[None, :]
+            if len(rows) > limit:
+                # Within the block only its `limit` best per firm can make the list
+                kth = np.partition(total, len(rows) - limit, axis=0)[len(rows) - limit]
+                above = total > kth[None, :]
+                ties = (total == kth[None, :]) & (np.cumsum(total == kth[None, :], axis=0)
+                                                  <= limit - above.sum(axis=0)[None, :])
+                keep &= above | ties
+            r, f = np.nonzero(keep)
+            if not len(r):
+                continue
+            new = {name: values[r, f].astype(np.int64) for name, values in parts.items()}
+            firm_ids = np.concatenate([kept_firm, f])
+            row_ids = np.concatenate([kept_row, rows[r]])
+            merged = new if kept is None else {name: np.concatenate([kept[name], new[name]]) for name in new}
+            order = np.lexsort((row_ids, -merged["total"], firm_ids))
+            firm_ids, row_ids = firm_ids[order], row_ids[order]
+            group_start = np.searchsorted(firm_ids, firm_ids, side="left")
+            best = np.arange(len(order)) - group_start < limit
+            kept_firm, kept_row = firm_ids[best], row_ids[best]
+            kept = {name: values[order][best] for name, values in merged.items()}
+            counts = np.bincount(kept_firm, minlength=n_firms)
+            last = np.searchsorted(kept_firm, np.arange(n_firms), side="right") - 1
+            threshold = np.where(counts >= limit, kept["total"][np.maximum(last, 0)], 0)
+        if kept is None:
+            return [(kept_row, {name: kept_row for name in PARTS}) for _ in weights]
+        bounds = np.searchsorted(kept_firm, np.arange(n_firms + 1))
+        return [(kept_row[a:b], {name: values[a:b] for name, values in kept.items()})
+                for a, b in zip(bounds[:-1], bounds[1:])]
+
+
+def build(columns, patterns):
+    """Matrix over the attorney columns (name → Series of normalized values).
+
+    columns holds CATEGORICAL and TEXT entries; patterns maps each TEXT
+    column to the (lower-cased) DNA patterns to find in it.
+    """
+    codes, uniques, incidence, vocab = {}, {}, {}, {}
+    n_rows = 0
+    for column in CATEGORICAL + TEXT:
+        values = columns[column]
+        n_rows = len(values)
+        if column == "class_year":
+            values = pd.Series(values, dtype=float)
+        else:
+            values = pd.Series(values, dtype=object)
+        codes[column], uniques[column] = _factorize(values)
+        if column in TEXT:
+            vocab[column] = list(dict.fromkeys(patterns[column]))
+            incidence[column] = _incidence(uniques[column], vocab[column])
+    return DnaMatrix(codes, uniques, vocab, incidence, n_rows)
+
@@ -0,0 +1,122 @@
+"""
+filter_index.py — Precomputed row sets for the search filters
+
+SearchPlan (app.py) narrows the attorney frame by graduation year, city,
+practice area, title level and law school, then drops the hiring firm's
+own attorneys. Each of those keeps or drops a row by looking at one or two
+of its column values, so the decision only needs to be made once per
+distinct value: FilterIndex factorizes the filter columns once per dataset
+version and turns a predicate over the distinct values into a row mask by
+gathering through the codes. The app passes the same predicate functions
+its scan path applies to the rows, so both paths select the same rows.
+
+Row masks for the values the JD parsers can produce (the extract_location
+cities, the practice areas, the two title buckets) are built up front and
+kept as packed bitmaps; other values are built on first use and cached.
+Graduation years and law schools are kept as sorted row ids. The filter
+phase of a search is then a few bitmap ANDs.
+
+Tests in tests/test_filter_index.py; `python -m tests.bench filter_index`
+times the filter phase, scan vs index.
+
+Usage:
+    index = filter_index.FilterIndex(frame, ["location", "title"], years=grad_years,
+                                     groups={"lawSchool": normalize})
+    index.mask(("city", "boston"), [("location", predicate)], pin=True)
+    index.year_range(2016, 2020), index.group_mask("lawSchool", "harvard university")
+    index.value_mask("firm_name", predicate, positions)
+"""
+
+import numpy as np
+import pandas as pd
+
+MAX_CACHED_MASKS = 256  # masks built on first use (pinned ones are not counted)
+
+
+class FilterIndex:
+    """Factorized filter columns plus cached row masks over one attorney frame."""
+
+    def __init__(self, frame, columns, years=None, groups=None):
+        self.n_rows = len(frame)
+        self.frame = None  # the frame the positions refer to (set by the app)
+        self._codes, self._uniques = {}, {}
+        for col in columns:
+            codes, uniques = pd.factorize(frame[col], use_na_sentinel=False)
+            self._codes[col] = codes.astype(np.int16 if len(uniques) < 2**15 else np.int32)
+            self._uniques[col] = pd.Series(uniques)
+        self._pinned = {}   # key → packed bitmap
+        self._cached = {}   # key → packed bitmap, cleared when full
+
+        self._year_order = self._years_sorted = None
+        if years is not None:
+            years = np.asarray(years, dtype=float)
+            valid = np.flatnonzero(~np.isnan(years))
+            self._year_order = valid[np.argsort(years[valid], kind="stable")].astype(np.int32)
+            self._years_sorted = years[self._year_order]
+
+        # col → (normalized value → (start, end) into row order, row order)
+        self._groups = {}
+        for col, normalize in (groups or {}).items():
+            self._groups[col] = self._group_rows(col, normalize)
+
+    def _group_rows(self, col, normalize):
+        normalized = np.asarray(normalize(self._uniques[col]), dtype=object)
+        group_of_unique, names = pd.factorize(normalized)
+        row_group = group_of_unique[self._codes[col]]
+        order = np.argsort(row_group, kind="stable").astype(np.int32)
+        bounds = np.searchsorted(row_group[order], np.arange(len(names) + 1))
+        return {name: (bounds[i], bounds[i + 1]) for i, name in enumerate(names)}, order
+
+    @property
+    def nbytes(self):
+        total = sum(c.nbytes for c in self._codes.values())
+        total += sum(b.nbytes for b in (*self._pinned.values(), *self._cached.values()))
+        total += sum(order.nbytes for _, order in self._groups.values())
+        if self._year_order is not None:
+            total += self._year_order.nbytes + self._years_sorted.nbytes
+        return total
+
+    def _unpack(self, bits):
+        return np.unpackbits(bits, count=self.n_rows).view(bool)
+
+    def value_mask(self, col, predicate, positions=None):
+        """predicate (Series of distinct values → bool array) applied to every row, or to positions."""
+        keep = np.asarray(predicate(self._uniques[col]), dtype=bool)
+        codes = self._codes[col]
+        return keep[codes if positions is None else codes[positions]]
+
+    def mask(self, key, parts, pin=False):
+        """Row mask for key: the OR of value_mask(col, predicate) over parts, built once."""
+        bits = self._pinned.get(key)
+        if bits is None:
+            bits = self._cached.get(key)
+        if bits is None:
+            mask = np.zeros(self.n_rows, dtype=bool)
+            for col, predicate in parts:
+                mask |= self.value_mask(col, predicate)
+            bits = np.packbits(mask)
+            if pin:
+                self._pinned[key] = bits
+            else:
+                if len(self._cached) >= MAX_CACHED_MASKS:
+                    self._cached = {}
+                self._cached[key] = bits
+        return self._unpack(bits)
+
+    def year_range(self, lo, hi):
+        """Rows whose year is within [lo, hi] (missing years never are)."""
+        mask = np.zeros(self.n_rows, dtype=bool)
+        start = np.searchsorted(self._years_sorted, lo, side="left")
+        end = np.searchsorted(self._years_sorted, hi, side="right")
+        mask[self._year_order[start:end]] = True
+        return mask
+
+    def group_mask(self, col, value):
+        """Rows whose normalized col value equals value."""
+        bounds, order = self._groups[col]
+        mask = np.zeros(self.n_rows, dtype=bool)
+        if value in bounds:
+            start, end = bounds[value]
+            mask[order[start:end]] = True
+        return mask
+
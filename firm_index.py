@@ -0,0 +1,85 @@
+"""
+firm_index.py — Word → firm postings for fuzzy firm-name matching
+
+fuzzy_match_firm() scores a query's significant words against every firm
+in the hiring history (0.6 × the fraction of query words in the firm name
++ 0.4 × the fraction of firm words in the query, accepted at 0.5), and
+extract_firm_name() runs it for every 1–4 word window of a JD. A firm that
+shares no word with the query scores 0 and can never be the best match, so
+FirmIndex keeps, per word, the firms whose name contains it and only scores
+the firms sharing at least one word with the query — in hiring-history
+order, so ties go to the same firm as a scan of every firm.
+
+Results are memoized per query word set (LRU, MAX_CACHED_QUERIES): the
+score depends on nothing else, and the app builds a new FirmIndex on every
+dataset swap, so a memo never outlives its data. Queries sharing no word
+with any firm are answered without touching the memo.
+
+Tests in tests/test_firm_index.py; `python -m tests.bench firm_index` times
+extract_firm_name on 5 KB JDs, scan vs index.
+
+Usage:
+    index = firm_index.FirmIndex({"Ropes & Gray LLP": {"ropes", "gray"}, ...})
+    firm, score = index.match({"ropes", "gray"})
+"""
+
+import threading
+from collections import OrderedDict
+
+MAX_CACHED_QUERIES = 4096
+THRESHOLD = 0.5
+
+
+def _score(query_words, firm_words):
+    shared = len(query_words & firm_words)
+    return 0.6 * (shared / len(query_words)) + 0.4 * (shared / len(firm_words))
+
+
+class FirmIndex:
+    """Firm → significant words, plus word → firms postings and a match memo."""
+
+    def __init__(self, firm_words):
+        self.firm_words = firm_words  # canonical name → word set, in hiring-history order
+        self._firms = list(firm_words)
+        self._words = [firm_words[f] for f in self._firms]
+        postings = {}
+        for i, words in enumerate(self._words):
+            for word in words:
+                postings.setdefault(word, []).append(i)
+        self.postings = postings
+        self._memo = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._firms)
+
+    def match(self, query_words):
+        """(canonical firm, score) of the best match for a query word set, or (None, 0)."""
+        key = frozenset(query_words)
+        if not key or self.postings.keys().isdisjoint(key):
+            return None, 0
+        with self._lock:
+            result = self._memo.get(key)
+            if result is not None:
+                self._memo.move_to_end(key)
+                return result
+        result = self._best(key)
+        with self._lock:
+            self._memo[key] = result
+            if len(self._memo) > MAX_CACHED_QUERIES:
+                self._memo.popitem(last=False)
+        return result
+
+    def _best(self, query_words):
+        candidates = set()
+        for word in query_words:
+            candidates.update(self.postings.get(word, ()))
+        best_firm, best_score = None, 0
+        for i in sorted(candidates):
+            score = _score(query_words, self._words[i])
+            if score > best_score:
+                best_score, best_firm = score, self._firms[i]
+        if best_score >= THRESHOLD:
+            return best_firm, best_score
+        return None, 0
+
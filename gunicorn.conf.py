@@ -0,0 +1,62 @@
+"""
+gunicorn.conf.py — Preloaded, fork-friendly gunicorn setup
+
+app.py is imported once in the master. The master only binds its port
+after that import, so it runs the startup stages only while they read
+prebuilt data: the firms, jobs, attorney and hiring snapshots, the bio
+store, and the artifacts derived from them (Hiring DNA, the DNA matrix,
+school aliases and JD matcher, practice terms, keyword and filter
+indexes), all built at deploy time by render.yaml. Those load from disk
+in a few seconds and every worker shares them copy-on-write. The attorney
+frame is stored as Arrow strings (no per-cell PyObjects) and the master's
+heap is gc.freeze()'d before forking, so neither refcounts nor the
+garbage collector dirty the inherited pages. Without fresh snapshots the
+master preloads nothing, and a stale artifact stops the preload at its
+stage (artifacts.load_only()); each worker then answers /healthz as soon
+as it is forked and runs the remaining stages in a background thread.
+
+The master also loads every firm's top candidates from their artifact,
+so the Top Candidates cache is filled once and shared; a worker's
+precompute scheduler only scores firms still missing (or changed by a
+reload or delta). Without a fresh artifact every worker scores all firms
+itself, once, on its own pool (`python artifacts.py build` writes it).
+post_fork forks each worker's process pools before the worker starts any
+thread, then starts its background threads (the precompute scheduler, the
+hot-reload file watcher). The scheduler's in-flight request count is
+created in the master, so it spans every worker, and precompute backs off
+while all WEB_CONCURRENCY workers are serving API calls (precompute.py).
+A hot reload (hot_reload.py) runs in every worker, so reloaded frames are
+private to each worker until the next restart re-establishes sharing.
+
+Usage:
+    gunicorn -c gunicorn.conf.py app:app
+    WEB_CONCURRENCY=4 gunicorn -c gunicorn.conf.py app:app
+
+    # Under another config (gunicorn reads ./gunicorn.conf.py by default)
+    # nothing is preloaded; each worker loads on its own and starts its
+    # background threads only when asked to:
+    JAIDE_BACKGROUND_TASKS=1 gunicorn -c other.conf.py app:app
+"""
+
+import gc
+import os
+
+# Read by app.py at import time
+os.environ["JAIDE_PRELOAD"] = "shared"
+
+# bind ($PORT) and workers ($WEB_CONCURRENCY) keep gunicorn's env defaults
+preload_app = True
+
+
+def when_ready(server):
+    # The snapshot frames are loaded; move everything to the permanent
+    # generation so collections in the workers never write to the shared pages.
+    gc.freeze()
+    server.log.info("Preloaded app frozen for copy-on-write (%d objects)", gc.get_freeze_count())
+
+
+def post_fork(server, worker):
+    # Before any thread: forks the worker's process pools, then starts the
+    # remaining startup stages and the background threads
+    import app as jaide_app
+    jaide_app.start_background_tasks()
@@ -0,0 +1,194 @@
+"""
+hiring_dna.py — Hiring DNA profiles for every firm in one grouped pass
+
+Builds the per-firm hiring profile (feeder schools and firms, practice areas,
+specialties, class-year range, locations, title mix) that app.py serves as
+HIRING_DNA. Every column is factorized once and counted per (firm, value)
+with a single np.unique, instead of re-filtering the whole hiring history for
+each firm. Output is identical to the per-firm value_counts() version, down
+to tie order and float rounding (tests/test_hiring_dna.py; timings with
+`python -m tests.bench hiring_dna --scale 10`).
+
+Usage:
+    from hiring_dna import compute_all_hiring_dna
+    dna = compute_all_hiring_dna(hiring_df)
+"""
+
+import numpy as np
+import pandas as pd
+
+# Columns compute_all_hiring_dna() reads, and a version to bump whenever its
+# output changes — together they key the persisted artifact (artifacts.py)
+DNA_COLUMNS = ["Firm", "Law School", "Previous Entity Type", "Moved From", "Practice Areas New",
+               "Specialties New", "Class Year", "City", "State", "Title"]
+DNA_VERSION = 1
+
+# Series.quantile() hands np.percentile q * 100.0; keep the same float inputs
+_CLASS_YEAR_PERCENTILES = np.array([0.1, 0.9]) * 100.0
+_DEFAULT_CLASS_YEARS = {"min": 2010, "max": 2024, "median": 2018}
+
+
+# ---------------------------------------------------------------------------
+# Grouped counting helpers
+# ---------------------------------------------------------------------------
+
+def _count_order(counts):
+    """Indexes of counts by count descending, ties broken as value_counts() does.
+
+    value_counts() sorts with Series.sort_values(ascending=False), i.e. a
+    quicksort over the reversed array; repeating it exactly keeps tie order.
+    """
+    n = len(counts)
+    return (n - 1 - counts[::-1].argsort(kind="quicksort"))[::-1]
+
+
+def _grouped_counts(group_codes, values, n_groups, sort_values=False):
+    """Count values per group in one pass.
+
+    Returns (bounds, value_uniques, value_codes, counts) where group g owns
+    entries bounds[g]:bounds[g + 1]. Within a group, values are in order of
+    first appearance (what value_counts() sees before sorting) or sorted
+    ascending with sort_values=True (what groupby(sort=True) produces).
+    """
+    codes, uniques = pd.factorize(values, sort=sort_values)
+    width = max(len(uniques), 1)
+    keys, first, counts = np.unique(group_codes.astype(np.int64) * width + codes,
+                                    return_index=True, return_counts=True)
+    groups = keys // width
+    order = np.lexsort((keys, groups)) if sort_values else np.lexsort((first, groups))
+    bounds = np.searchsorted(groups[order], np.arange(n_groups + 1))
+    return bounds, np.asarray(uniques, dtype=object), (keys % width)[order], counts[order]
+
+
+def _top_entries(table, g, limit=None):
+    """Entry indexes of group g, most frequent first (value_counts().head(limit))."""
+    bounds, _, _, counts = table
+    lo, hi = bounds[g], bounds[g + 1]
+    idx = _count_order(counts[lo:hi])
+    if limit is not None:
+        idx = idx[:limit]
+    return lo + idx
+
+
+def _shares(table, denominators):
+    """round(count / denominator, 3) for every entry, as value_counts() callers computed it."""
+    bounds, _, _, counts = table
+    per_entry = np.repeat(denominators, np.diff(bounds))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.round(counts / per_entry, 3)
+
+
+def _exploded(series):
+    """Split a comma-separated column into (row position, stripped item) pairs, dropping blanks.
+
+    Each distinct cell is split once; rows then index into the split uniques.
+    """
+    codes, uniques = pd.factorize(series)
+    split = [[t for t in (p.strip() for p in str(u).split(",")) if t] for u in uniques]
+    lengths = np.array([len(items) for items in split], dtype=np.int64)
+    flat = np.array([t for items in split for t in items], dtype=object)
+    starts = np.concatenate([[0], np.cumsum(lengths)[:-1]]) if len(lengths) else lengths
+    row_lengths = lengths[codes]
+    positions = np.repeat(np.arange(len(series)), row_lengths)
+    offsets = np.arange(len(positions)) - np.repeat(np.cumsum(row_lengths) - row_lengths, row_lengths)
+    return positions, flat[np.repeat(starts[codes], row_lengths) + offsets]
+
+
+# ---------------------------------------------------------------------------
+# Hiring DNA
+# ---------------------------------------------------------------------------
+
+def compute_all_hiring_dna(hiring_df, min_hires=5):
+    """Compute a Hiring DNA profile for every firm with enough hiring data."""
+    if hiring_df.empty:
+        return {}
+    firm_counts = hiring_df["Firm"].value_counts()
+    eligible = firm_counts[firm_counts >= min_hires].index.tolist()
+    if not eligible:
+        return {}
+
+    firm_codes, firm_names = pd.factorize(hiring_df["Firm"])
+    n_firms = len(firm_names)
+    code_of = {name: i for i, name in enumerate(firm_names)}
+    totals = np.bincount(firm_codes, minlength=n_firms)
+
+    schools = _grouped_counts(firm_codes, hiring_df["Law School"], n_firms)
+    titles = _grouped_counts(firm_codes, hiring_df["Title"], n_firms)
+
+    law_firm = (hiring_df["Previous Entity Type"] == "Law Firm").to_numpy()
+    lf_codes = firm_codes[law_firm]
+    lf_totals = np.bincount(lf_codes, minlength=n_firms)
+    feeders = _grouped_counts(lf_codes, hiring_df["Moved From"][law_firm], n_firms)
+
+    pa_pos, pa_items = _exploded(hiring_df["Practice Areas New"])
+    areas = _grouped_counts(firm_codes[pa_pos], pa_items, n_firms)
+    sp_pos, sp_items = _exploded(hiring_df["Specialties New"])
+    specs = _grouped_counts(firm_codes[sp_pos], sp_items, n_firms)
+
+    # groupby(["City", "State"]) sorts its keys, so count (city, state) pairs in sorted order
+    city_codes, cities = pd.factorize(hiring_df["City"], sort=True)
+    state_codes, states = pd.factorize(hiring_df["State"], sort=True)
+    n_states = max(len(states), 1)
+    locations = _grouped_counts(firm_codes, city_codes.astype(np.int64) * n_states + state_codes,
+                                n_firms, sort_values=True)
+
+    # Class years: numeric rows sorted by (firm, year) so each firm is one slice
+    cy = pd.to_numeric(hiring_df["Class Year"], errors="coerce").to_numpy(dtype=float)
+    cy_valid = ~np.isnan(cy)
+    cy_firms, cy_values = firm_codes[cy_valid], cy[cy_valid]
+    cy_order = np.lexsort((cy_values, cy_firms))
+    cy_values = cy_values[cy_order]
+    cy_bounds = np.searchsorted(cy_firms[cy_order], np.arange(n_firms + 1))
+
+    school_pct = _shares(schools, totals)
+    feeder_pct = _shares(feeders, lf_totals)
+    area_pct = _shares(areas, totals)
+
+    dna = {}
+    for firm_name in eligible:
+        g = code_of[firm_name]
+        total = int(totals[g])
+
+        def entries(table, limit=None):
+            _, uniques, codes, counts = table
+            return [(i, uniques[codes[i]], int(counts[i])) for i in _top_entries(table, g, limit)]
+
+        feeder_schools = [{"school": s, "hires": c, "pct": school_pct[i]}
+                          for i, s, c in entries(schools, 15) if s]
+        # No law-firm laterals means no feeder entries, so the 0 denominator never shows
+        feeder_firms = [{"firm": f, "hires": c, "pct": feeder_pct[i]}
+                        for i, f, c in entries(feeders, 15) if f]
+        practice_areas = [{"area": a, "hires": c, "pct": area_pct[i]}
+                          for i, a, c in entries(areas)]
+        specialties = [{"specialty": s, "hires": c} for _, s, c in entries(specs, 20)]
+
+        years = cy_values[cy_bounds[g]:cy_bounds[g + 1]]
+        if len(years) >= 3:
+            lo, hi = np.percentile(years, _CLASS_YEAR_PERCENTILES, method="linear")
+            cy_range = {"min": int(lo), "max": int(hi), "median": int(np.median(years))}
+        elif len(years) > 0:
+            cy_range = {"min": int(years[0]), "max": int(years[-1]), "median": int(np.median(years))}
+        else:
+            cy_range = dict(_DEFAULT_CLASS_YEARS)
+
+        hiring_locations = []
+        for _, key, cnt in entries(locations, 15):
+            city = cities[key // n_states]
+            if city:
+                hiring_locations.append({"location": city, "state": states[key % n_states], "hires": cnt})
+
+        title_distribution = {k: c for _, k, c in entries(titles) if k}
+
+        dna[firm_name] = {
+            "firm_name": firm_name,
+            "total_hires": total,
+            "feeder_schools": feeder_schools,
+            "feeder_firms": feeder_firms,
+            "practice_areas": practice_areas,
+            "specialties": specialties,
+            "class_year_range": cy_range,
+            "hiring_locations": hiring_locations,
+            "title_distribution": title_distribution,
+        }
+    return dna
+
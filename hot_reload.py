@@ -0,0 +1,196 @@
+"""
+hot_reload.py — Swap refreshed FP exports in without a restart
+
+A reload rebuilds every dataset and derived index (snapshots, bio store,
+Hiring DNA, firm index, school aliases) off to the side while requests keep
+being served from the current version, then hands the finished bundle to
+app.py, which swaps it in and drops every cache tied to the old version.
+Requests already running (including SSE streams) finish on the frames they
+started with; the old version is freed when they let go of it.
+
+A reload is triggered either explicitly (admin endpoint) or by the watcher
+thread noticing that a source file changed. New attorney delta files
+(attorney_delta.py) take the cheaper path: the watcher hands them to the
+app's apply_deltas callback instead of reloading everything. Explicit reloads also touch a
+stamp file so every other gunicorn worker's watcher picks them up too, and
+the rebuild of on-disk snapshots/artifacts is serialised across processes
+with a file lock (the first worker rebuilds, the others load its output).
+
+Usage:
+    hot_reload.configure(build=_build_dataset, swap=_swap_dataset,
+                         apply_deltas=_apply_new_attorney_deltas)
+    hot_reload.start_watcher()          # poll the data files every POLL_SECONDS
+    hot_reload.request_reload("admin")  # reload now, in the background
+    hot_reload.apply_deltas([path])     # apply a new delta file now
+    hot_reload.status()                 # last reload, running/error
+"""
+
+import fcntl
+import os
+import threading
+import time
+import traceback
+
+import attorney_delta
+import data_snapshot
+import startup
+
+POLL_SECONDS = float(os.environ.get("JAIDE_RELOAD_POLL_SECONDS", "30"))
+STAMP_PATH = os.path.join(data_snapshot.SNAPSHOT_DIR, ".reload-requested")
+LOCK_PATH = os.path.join(data_snapshot.SNAPSHOT_DIR, ".reload.lock")
+
+_build = None   # () -> bundle, must not touch the live globals
+_swap = None    # (bundle) -> None, installs the bundle
+_apply_deltas = None  # ([paths]) -> stats, applies attorney delta files
+_lock = threading.Lock()   # one reload at a time in this process
+_watcher = None
+_seen_signature = None
+_seen_deltas = set()   # delta files already reflected in the live data
+_status = {
+    "running": False, "reason": None,
+    "started_at": None, "seconds": None, "error": None, "reloads": 0,
+    "last_delta": None,
+}
+
+
+def configure(build, swap, apply_deltas=None):
+    """Register the app's bundle builder, swap and delta functions."""
+    global _build, _swap, _apply_deltas
+    _build, _swap, _apply_deltas = build, swap, apply_deltas
+
+
+def source_signature():
+    """(path, mtime_ns, size) for every file a reload would read, plus the stamp file.
+
+    Each dataset contributes its source CSV, or its snapshot for
+    snapshot-only deploys (rebuilt snapshots of a CSV do not count).
+    """
+    paths = []
+    for name in data_snapshot.DATASETS:
+        path = data_snapshot.source_csv_path(name) or data_snapshot.snapshot_path(name)
+        paths.append(path)
+    paths.append(STAMP_PATH)
+    signature = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+            signature.append((path, st.st_mtime_ns, st.st_size))
+        except OSError:
+            signature.append((path, None, None))
+    return tuple(signature)
+
+
+def _touch_stamp():
+    try:
+        os.makedirs(os.path.dirname(STAMP_PATH), exist_ok=True)
+        with open(STAMP_PATH, "a"):
+            os.utime(STAMP_PATH)
+    except OSError as e:
+        print(f"Warning: could not touch reload stamp: {e}")
+
+
+def _reload(reason):
+    global _seen_signature
+    startup.wait_until_ready()  # never race the initial load
+    if not _lock.acquire(blocking=False):
+        return False
+    _status.update(running=True, reason=reason, started_at=time.strftime("%Y-%m-%dT%H:%M:%S"),
+                   seconds=None, error=None)
+    t0 = time.perf_counter()
+    try:
+        _seen_signature = source_signature()
+        _seen_deltas.update(attorney_delta.delta_files())  # a full build applies them all
+        print(f"[Reload] building new dataset version ({reason})...")
+        os.makedirs(os.path.dirname(LOCK_PATH), exist_ok=True)
+        with open(LOCK_PATH, "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                bundle = _build()
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+        _swap(bundle)
+        _status["reloads"] += 1
+    except Exception as e:
+        # Keep serving the current version; the next trigger retries
+        _status["error"] = f"{type(e).__name__}: {e}"
+        traceback.print_exc()
+    finally:
+        _status["seconds"] = round(time.perf_counter() - t0, 3)
+        _status["running"] = False
+        _lock.release()
+    print(f"[Reload] {'failed' if _status['error'] else 'swapped in'} after {_status['seconds']:.1f}s")
+    return _status["error"] is None
+
+
+def request_reload(reason="admin", broadcast=True):
+    """Start a reload in the background. Returns False if one is already running."""
+    if _build is None or _lock.locked():
+        return False
+    if broadcast:
+        _touch_stamp()  # other workers' watchers see the new stamp
+    threading.Thread(target=_reload, args=(reason,), name="reload", daemon=True).start()
+    return True
+
+
+def apply_deltas(paths, blocking=True):
+    """Apply attorney delta files now. Returns the app's stats, or None if busy/unset."""
+    paths = [p for p in paths if p not in _seen_deltas]
+    if _apply_deltas is None or not paths or not _lock.acquire(blocking=blocking):
+        return None
+    try:
+        stats = _apply_deltas(paths)
+        _status["last_delta"] = stats
+        return stats
+    except Exception:
+        # Not retried: a broken file would fail on every poll; a full reload re-applies it
+        traceback.print_exc()
+        return None
+    finally:
+        _seen_deltas.update(paths)
+        _lock.release()
+
+
+def _watch():
+    global _seen_signature
+    startup.wait_until_ready()  # never race the initial load
+    if _seen_signature is None:
+        _seen_signature = source_signature()
+    pending = None
+    while True:
+        time.sleep(POLL_SECONDS)
+        new_deltas = [p for p in attorney_delta.delta_files() if p not in _seen_deltas]
+        if new_deltas:
+            apply_deltas(new_deltas, blocking=False)
+        current = source_signature()
+        if current == _seen_signature or _lock.locked():
+            pending = None
+            continue
+        # Only reload once the files stop changing (an export may still be copying)
+        if current != pending:
+            pending = current
+            continue
+        changed = [os.path.basename(p) for (p, *a), (_, *b) in zip(current, _seen_signature) if a != b]
+        pending = None
+        _reload(f"changed: {', '.join(changed)}")
+
+
+def start_watcher():
+    """Start the file-watch thread (once per process)."""
+    global _watcher
+    if _watcher is not None and _watcher.is_alive():
+        return
+    _watcher = threading.Thread(target=_watch, name="reload-watcher", daemon=True)
+    _watcher.start()
+
+
+def mark_loaded():
+    """Record the files the startup load read, so the watcher only reacts to later changes."""
+    global _seen_signature
+    _seen_signature = source_signature()
+    _seen_deltas.update(attorney_delta.delta_files())
+
+
+def status():
+    """Snapshot of the reload state for the admin endpoint."""
+    return dict(_status, watching=_watcher is not None and _watcher.is_alive(),
+                poll_seconds=POLL_SECONDS)
@@ -0,0 +1,154 @@
+"""
+jd_matcher.py — One-pass phrase matching for JD parsing
+
+The JD parsers in app.py look for fixed vocabularies in the JD text: the
+keyword phrases (extract_keywords), practice-area and bar phrases, the
+cities extract_location knows, and every law-school alias
+(extract_law_school — thousands of them, each previously a word-boundary
+regex run against three spellings of the JD). JDMatcher compiles all of
+them into one Aho-Corasick automaton, built once per dataset version (the
+school aliases come from the attorney data), and scan() walks the
+lower-cased JD once to find every occurrence of every phrase.
+
+Semantics are those of the code it replaces:
+  - substring phrases are found anywhere (`phrase in text_lower`);
+  - cities report every occurrence, for extract_location to replay its
+    regex's leftmost, non-overlapping order;
+  - school aliases only count on \\b word boundaries, in the JD as written,
+    with "&" → "and" and with "and" → "&"; the alias earliest in the
+    priority order (longest first) wins. The two respellings are scanned
+    only when they differ from the JD.
+
+Tests in tests/test_jd_matcher.py; `python -m tests.bench jd_matcher
+[--schools 3000]` times parsing 10–20 KB JDs, old vs new.
+
+Usage:
+    matcher = jd_matcher.JDMatcher(substrings, cities, [(alias, school), ...])
+    hits = matcher.scan(jd_text)
+    hits.found, hits.cities, hits.school
+"""
+
+import re
+from collections import deque, namedtuple
+
+# found: set of the substring phrases present; cities: [(start, end)] of
+# each city occurrence in order; school: the winning alias's school or None
+JDHits = namedtuple("JDHits", ["found", "cities", "school"])
+
+
+class Automaton:
+    """Aho-Corasick automaton over a list of (already lower-cased) patterns."""
+
+    def __init__(self, patterns):
+        self.lengths = [len(p) for p in patterns]
+        goto, out = [{}], [[]]
+        for i, pattern in enumerate(patterns):
+            state = 0
+            for ch in pattern:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append([])
+                state = nxt
+            out[state].append(i)
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                out[nxt].extend(out[fail[nxt]])
+        self.goto, self.fail = goto, fail
+        self.out = [tuple(o) for o in out]
+
+    def __len__(self):
+        return len(self.goto)
+
+    def iter(self, text):
+        """Yield (start, end, pattern index) for every occurrence, by end position."""
+        goto, fail, out, lengths = self.goto, self.fail, self.out, self.lengths
+        state = 0
+        for end, ch in enumerate(text, 1):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                for i in out[state]:
+                    yield end - lengths[i], end, i
+
+
+def _is_word(ch):
+    return ch.isalnum() or ch == "_"
+
+
+def _on_boundaries(text, start, end):
+    """Whether \\b holds at both start and end of text[start:end] (as re does)."""
+    before = start > 0 and _is_word(text[start - 1])
+    after = end < len(text) and _is_word(text[end])
+    return (before != _is_word(text[start])) and (_is_word(text[end - 1]) != after)
+
+
+_AND_WORD = re.compile(r"\band\b")
+
+
+class JDMatcher:
+    """All JD vocabularies in one automaton; see the module docstring."""
+
+    def __init__(self, substrings, cities, schools):
+        """schools: (alias, school name) pairs in priority order."""
+        patterns = {}
+
+        def _add(phrase):
+            return patterns.setdefault(phrase, len(patterns))
+
+        substring_ids = {_add(p.lower()) for p in substrings if p}
+        city_ids = {_add(c.lower()) for c in cities if c}
+        school_rank = {}
+        self.schools = list(schools)
+        for rank, (alias, _school) in enumerate(self.schools):
+            if alias:
+                school_rank.setdefault(_add(alias), rank)
+        self.patterns = list(patterns)
+        self._substring_ids = substring_ids
+        self._city_ids = city_ids
+        self._school_rank = school_rank
+        self.automaton = Automaton(self.patterns)
+        self._last = None
+
+    def scan(self, text):
+        """JDHits for one JD (the last result is reused for the same text)."""
+        last = self._last
+        if last is not None and last[0] == text:
+            return last[1]
+        text_lower = text.lower()
+        patterns, school_rank = self.patterns, self._school_rank
+        found, cities = set(), []
+        best = len(self.schools)
+        for start, end, i in self.automaton.iter(text_lower):
+            if i in self._substring_ids:
+                found.add(patterns[i])
+            if i in self._city_ids:
+                cities.append((start, end))
+            rank = school_rank.get(i)
+            if rank is not None and rank < best and _on_boundaries(text_lower, start, end):
+                best = rank
+        if school_rank:
+            for variant in (text_lower.replace("&", "and"), _AND_WORD.sub("&", text_lower)):
+                if variant == text_lower:
+                    continue
+                for start, end, i in self.automaton.iter(variant):
+                    rank = school_rank.get(i)
+                    if rank is not None and rank < best and _on_boundaries(variant, start, end):
+                        best = rank
+        cities.sort()
+        school = self.schools[best][1] if best < len(self.schools) else None
+        hits = JDHits(found, cities, school)
+        self._last = (text, hits)
+        return hits
+
@@ -0,0 +1,135 @@
+"""
+keyword_index.py — Inverted index of JD keyword phrases over attorney text
+
+score_attorneys_vectorized() counts, per attorney, how many JD keywords
+occur (as substrings) in the lower-cased concatenation of the attorney's
+text columns. JD keywords always come from the fixed phrase list in app.py
+(JD_KEYWORD_PHRASES), so each phrase's matches are computed once per dataset
+version — phrase → packed bitmap over ATTORNEYS_DF row positions — and a
+search gathers the bits of its filtered rows instead of scanning text.
+
+Build: the texts are laid out as one UTF-8 buffer (Arrow's string layout)
+and each phrase is located with bytes.find, jumping to the next row after a
+hit; a hit straddling a row boundary is skipped. A bit is therefore set
+exactly when `texts.str.contains(phrase, regex=False)` is true for the row.
+
+Tests in tests/test_keyword_index.py; `python -m tests.bench keyword_index`
+times /api/search with and without the index.
+
+Usage:
+    index = keyword_index.build(texts, phrases)
+    counts, missing = index.count(["fund formation", "lpa"], positions)
+"""
+
+from bisect import bisect_right
+
+import numpy as np
+import pyarrow as pa
+
+
+class KeywordIndex:
+    """phrase → packed bitmap of the row positions whose text contains it."""
+
+    def __init__(self, bitmaps, n_rows):
+        self.bitmaps = bitmaps
+        self.n_rows = n_rows
+        self.frame = None  # the frame the positions refer to (set by the app, not pickled)
+
+    def __getstate__(self):
+        return {"bitmaps": self.bitmaps, "n_rows": self.n_rows}
+
+    def __setstate__(self, state):
+        self.__init__(state["bitmaps"], state["n_rows"])
+
+    def __contains__(self, phrase):
+        return phrase in self.bitmaps
+
+    @property
+    def nbytes(self):
+        return sum(b.nbytes for b in self.bitmaps.values())
+
+    def rows(self, phrase):
+        """Boolean mask over all rows for one indexed phrase."""
+        return np.unpackbits(self.bitmaps[phrase], count=self.n_rows).view(bool)
+
+    def count(self, phrases, positions):
+        """Per position, how many of the (lower-cased) phrases its text contains.
+
+        Returns (counts, missing): phrases not in the index are not counted
+        and are returned so the caller can scan for them.
+        """
+        positions = np.asarray(positions, dtype=np.int64)
+        byte_pos, shift = positions >> 3, (7 - (positions & 7)).astype(np.uint8)
+        counts = np.zeros(len(positions), dtype=np.int64)
+        missing = []
+        for phrase in phrases:
+            bitmap = self.bitmaps.get(phrase)
+            if bitmap is None:
+                missing.append(phrase)
+                continue
+            counts += (bitmap[byte_pos] >> shift) & 1
+        return counts, missing
+
+    def remapped(self, take, new_rows):
+        """Index for a frame rebuilt by an attorney delta.
+
+        take gives, per new row, its source position: < n_rows for a row of
+        this index, n_rows + i for row i of new_rows (an index over the
+        changed rows, same phrases).
+        """
+        bitmaps = {}
+        for phrase, bitmap in self.bitmaps.items():
+            combined = np.concatenate([self.rows(phrase), new_rows.rows(phrase)])
+            bitmaps[phrase] = np.packbits(combined[take])
+        return KeywordIndex(bitmaps, len(take))
+
+
+def _utf8_layout(texts):
+    """(buffer bytes, row start offsets + end) of a string Series, nulls as ""."""
+    arr = pa.array(texts, from_pandas=True)
+    if isinstance(arr, pa.ChunkedArray):
+        arr = arr.combine_chunks()
+    arr = arr.cast(pa.large_string()).fill_null("")
+    offsets = np.frombuffer(arr.buffers()[1], dtype=np.int64, count=len(arr) + 1, offset=arr.offset * 8)
+    data = arr.buffers()[2]
+    start, end = int(offsets[0]), int(offsets[-1])
+    buf = data.to_pybytes()[start:end] if data is not None else b""
+    return buf, (offsets - start).tolist()
+
+
+def _matching_rows(buf, offsets, needle):
+    rows = []
+    pos = buf.find(needle)
+    while pos != -1:
+        row = bisect_right(offsets, pos) - 1
+        row_end = offsets[row + 1]
+        if pos + len(needle) <= row_end:
+            rows.append(row)
+            pos = buf.find(needle, row_end)
+        else:
+            pos = buf.find(needle, pos + 1)
+    return rows
+
+
+def phrase_rows(texts, phrases):
+    """phrase → sorted row positions of texts containing it, as str.contains(phrase, regex=False)."""
+    buf, offsets = _utf8_layout(texts)
+    rows = {}
+    for phrase in dict.fromkeys(phrases):
+        if phrase:
+            rows[phrase] = np.array(_matching_rows(buf, offsets, phrase.encode("utf-8")), dtype=np.int64)
+        else:
+            rows[phrase] = np.arange(len(texts), dtype=np.int64)  # "" is in every string
+    return rows
+
+
+def build(texts, phrases):
+    """Index texts (a Series of lower-cased attorney text) by the lower-cased phrases."""
+    n_rows = len(texts)
+    bitmaps = {}
+    for phrase, rows in phrase_rows(texts, [p.lower() for p in phrases]).items():
+        mask = np.zeros(n_rows, dtype=bool)
+        mask[rows] = True
+        bitmaps[phrase] = np.packbits(mask)
+    return KeywordIndex(bitmaps, n_rows)
+
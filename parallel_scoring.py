@@ -0,0 +1,299 @@
+"""
+parallel_scoring.py — Optional multi-process scoring over shared-memory attorney columns
+
+Search scoring (_score_components) and firm DNA scoring
+(score_candidates_for_firm) are column-wise NumPy / Arrow work over the
+attorney frame, so they shard cleanly by row. ScoringEngine runs them on a
+pool of worker processes:
+
+  - the columns the kernels read (and the keyword-index bitmaps) are copied
+    once per attorney frame into one shared-memory segment; workers map it
+    and rebuild zero-copy pandas columns on first use, so only the shard's
+    row positions and the query travel with a task;
+  - each shard is scored by the same kernel function the app runs in
+    process, and per-shard results (all matches, or each shard's top K)
+    are merged by the caller in shard order, so ties keep row order and the
+    result equals the single-process one;
+  - small candidate pools (below min_rows) and setups without workers are
+    scored in process.
+
+Workers are forked from the app process, so kernels are plain app
+functions registered with register_kernel(). A fork copies the parent's
+locks in whatever state its other threads hold them, so the pool is only
+forked by start(), which the app calls before it starts any thread
+(gunicorn's post_fork); until then everything is scored in process. The
+workers read the data from the shared segments, not from what they
+inherited, so one pool serves every frame. A new attorney frame is
+published as a new segment and the old one unlinked; workers drop their
+old mapping when they see the new one.
+
+Configuration (environment):
+    JAIDE_SCORING_WORKERS     worker processes (0 = score in process, the default)
+    JAIDE_SCORING_MIN_ROWS    smallest pool scored in parallel (50000)
+
+Tests in tests/test_parallel_scoring.py; `python -m tests.bench
+parallel_scoring [--cores 1,2,4,8]` times scoring per core count.
+
+Usage:
+    engine = parallel_scoring.ScoringEngine(workers=4, min_rows=50_000)
+    engine.start()                      # before any other thread starts
+    engine.use_for(n_rows)
+    table = engine.publish(frame, lambda f: SharedTable.publish(f, columns, arrays, meta))
+    results = engine.map("search", table, [(shard, ...), ...])
+"""
+
+import atexit
+import multiprocessing
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+_ALIGN = 64
+_KERNELS = {}
+
+
+def register_kernel(name, fn):
+    """Make fn(table, *args) callable in the workers as `name` (before the pool starts)."""
+    _KERNELS[name] = fn
+
+
+# ---------------------------------------------------------------------------
+# Shared-memory tables
+# ---------------------------------------------------------------------------
+
+class SharedTable:
+    """Frame columns and NumPy arrays laid out in one shared-memory segment.
+
+    spec is the picklable description workers attach with; frame and
+    arrays are the attached (zero-copy) views, meta any small picklable
+    extras, and cache a place for kernels to keep state derived from them.
+    """
+
+    def __init__(self, shm, spec, owner):
+        self.shm, self.spec, self.owner = shm, spec, owner
+        self.frame, self.arrays = _read(shm.buf, spec)
+        self.meta = spec["meta"]
+        self.cache = {}
+
+    @classmethod
+    def publish(cls, frame, columns, arrays=None, meta=None):
+        parts, layout = [], {"n_rows": len(frame), "columns": [], "arrays": {}, "meta": meta or {}}
+        for col in columns:
+            layout["columns"].append((col, _column_layout(frame[col], parts)))
+        for name, values in (arrays or {}).items():
+            values = np.ascontiguousarray(values)
+            layout["arrays"][name] = (_add(parts, values), values.dtype.str, values.shape)
+        size = max(sum(_padded(len(p)) for p in parts), 1)
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        offset = 0
+        offsets = []
+        try:
+            for p in parts:
+                shm.buf[offset:offset + len(p)] = p
+                offsets.append(offset)
+                offset += _padded(len(p))
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+        layout["offsets"] = offsets
+        layout["name"], layout["size"] = shm.name, size
+        return cls(shm, layout, owner=True)
+
+    @classmethod
+    def attach(cls, spec):
+        return cls(shared_memory.SharedMemory(name=spec["name"]), spec, owner=False)
+
+    @property
+    def nbytes(self):
+        return self.spec["size"]
+
+    def release(self):
+        """Drop the views; the owner also unlinks the segment."""
+        self.frame = self.arrays = self.cache = None
+        try:
+            self.shm.close()
+        except BufferError:
+            pass  # views still referenced elsewhere; the mapping goes with them
+        if self.owner:
+            self.shm.unlink()
+
+
+def _padded(n):
+    return -(-n // _ALIGN) * _ALIGN
+
+
+def _add(parts, buffer):
+    """Append a buffer to the segment parts; returns its part index."""
+    parts.append(memoryview(buffer).cast("B"))
+    return len(parts) - 1
+
+
+def _column_layout(series, parts):
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        codes = np.ascontiguousarray(series.cat.codes.to_numpy())
+        categories = series.cat.categories
+        return {"kind": "category", "ordered": dtype.ordered,
+                "codes": (_add(parts, codes), codes.dtype.str, len(codes)),
+                "categories": _column_layout(pd.Series(categories, dtype=categories.dtype), parts)}
+    if isinstance(dtype, pd.StringDtype) or dtype == object:
+        arr = pa.array(series.astype("string[pyarrow]").array if dtype == object else series.array)
+        if isinstance(arr, pa.ChunkedArray):
+            arr = arr.combine_chunks()
+        validity, offsets, data = arr.buffers()
+        return {"kind": "string", "dtype": str(dtype), "length": len(arr), "offset": arr.offset,
+                "null_count": arr.null_count, "type": str(arr.type),
+                "buffers": [None if validity is None else _add(parts, validity),
+                            _add(parts, offsets), _add(parts, data)]}
+    values = np.ascontiguousarray(series.to_numpy())
+    return {"kind": "numpy", "values": (_add(parts, values), values.dtype.str, len(values))}
+
+
+def _read(buf, spec):
+    offsets = spec["offsets"]
+
+    def numpy_at(ref):
+        part, dtype, shape = ref
+        dtype = np.dtype(dtype)
+        count = int(np.prod(shape)) if isinstance(shape, (tuple, list)) else shape
+        return np.frombuffer(buf, dtype=dtype, count=count, offset=offsets[part]).reshape(shape)
+
+    def arrow_buffer(part, nbytes=None):
+        start = offsets[part]
+        end = start + (nbytes if nbytes is not None else len(buf) - start)
+        return pa.py_buffer(buf[start:end])
+
+    def column(layout):
+        if layout["kind"] == "numpy":
+            return pd.Series(numpy_at(layout["values"]), copy=False)
+        if layout["kind"] == "category":
+            categories = column(layout["categories"])
+            cat_index = pd.Index(categories)
+            values = pd.Categorical.from_codes(numpy_at(layout["codes"]),
+                                               dtype=pd.CategoricalDtype(cat_index, layout["ordered"]),
+                                               validate=False)
+            return pd.Series(values, copy=False)
+        arrow_type = pa.large_string() if layout["type"] == "large_string" else pa.string()
+        buffers = [None if b is None else arrow_buffer(b) for b in layout["buffers"]]
+        arr = pa.Array.from_buffers(arrow_type, layout["length"], buffers,
+                                    null_count=layout["null_count"], offset=layout["offset"])
+        series = pd.Series(pd.arrays.ArrowStringArray(pa.chunked_array([arr])), copy=False)
+        if layout["dtype"] == "object":
+            series = series.astype(object)
+        return series
+
+    frame = pd.DataFrame({col: column(layout) for col, layout in spec["columns"]})
+    arrays = {name: numpy_at(ref) for name, ref in spec["arrays"].items()}
+    return frame, arrays
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+_attached = {"name": None, "table": None}
+
+
+def _run(kernel, spec, args):
+    """Task entry point in a worker: attach spec's segment (once) and run the kernel."""
+    if _attached["name"] != spec["name"]:
+        old = _attached["table"]
+        _attached.update(name=None, table=None)
+        if old is not None:
+            old.release()
+        _attached.update(name=spec["name"], table=SharedTable.attach(spec))
+    return _KERNELS[kernel](_attached["table"], *args)
+
+
+def _worker_init():
+    _attached.update(name=None, table=None)
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+class ScoringEngine:
+    """Process pool plus the shared table of the current attorney frame."""
+
+    def __init__(self, workers=0, min_rows=50_000):
+        self.workers = workers
+        self.min_rows = min_rows
+        self._pool = None
+        self._table = None
+        self._source = None  # weakref to the frame the table was published from (not kept alive)
+        self._lock = threading.Lock()
+        atexit.register(self.shutdown)  # unlink the segment on exit
+
+    def start(self):
+        """Fork the worker processes now (no-op without workers, or if already started).
+
+        Call it while no other thread runs; the pool is never forked lazily.
+        """
+        with self._lock:
+            if self.workers > 1 and self._pool is None:
+                # Workers share this process's tracker; one of their own would unlink
+                # the segments they attached to when they exit
+                resource_tracker.ensure_running()
+                pool = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("fork"),
+                                           initializer=_worker_init)
+                pool.submit(os.getpid).result()  # a fork pool starts all of its workers on first use
+                self._pool = pool
+
+    def use_for(self, n_rows):
+        """Whether a pool of n_rows should be scored in parallel (only once start() forked the pool)."""
+        return self._pool is not None and n_rows >= max(self.min_rows, 1)
+
+    def publish(self, frame, build):
+        """The shared table for frame, build(frame) → SharedTable on first use (the previous one is unlinked)."""
+        with self._lock:
+            if self._source is None or self._source() is not frame:
+                old = self._table
+                t0 = time.perf_counter()
+                self._table = build(frame)
+                self._source = weakref.ref(frame)
+                print(f"[Scoring] published {len(frame):,} rows to shared memory "
+                      f"({self._table.nbytes / 2**20:.0f} MB) in {time.perf_counter() - t0:.2f}s")
+                if old is not None:
+                    old.release()
+            return self._table
+
+    def map(self, kernel, table, shard_args):
+        """Run kernel(table, *args) for each args tuple in the workers; results in order."""
+        pool = self._pool
+        futures = [pool.submit(_run, kernel, table.spec, args) for args in shard_args]
+        return [f.result() for f in futures]
+
+    def shutdown(self):
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(cancel_futures=True)
+                self._pool = None
+            if self._table is not None:
+                self._table.release()
+                self._table = self._source = None
+
+    def stats(self):
+        return {"workers": self.workers, "min_rows": self.min_rows, "pool_started": self._pool is not None,
+                "shared_mb": round(self._table.nbytes / 2**20, 1) if self._table is not None else 0}
+
+
+def shards(n_rows, n_shards):
+    """[(start, stop)] splitting range(n_rows) into n_shards contiguous pieces."""
+    bounds = np.linspace(0, n_rows, max(n_shards, 1) + 1).astype(np.int64)
+    return [(int(a), int(b)) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+
+
+def from_env():
+    """ScoringEngine configured from JAIDE_SCORING_WORKERS and JAIDE_SCORING_MIN_ROWS."""
+    return ScoringEngine(int(os.environ.get("JAIDE_SCORING_WORKERS", 0)),
+                         int(os.environ.get("JAIDE_SCORING_MIN_ROWS", 50_000)))
+
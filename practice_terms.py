@@ -0,0 +1,130 @@
+"""
+practice_terms.py — Pre-tokenized practice-area text for the practice-area score
+
+score_attorneys_vectorized() gives practice-area points for each JD term
+that occurs as a whole token in an attorney's lower-cased practice_areas +
+specialty text, i.e. where the regex (?:^|[\\s,;/])term(?:$|[\\s,;/])
+matches. Instead of running that regex per term over every filtered row,
+the text is split on the same delimiters once per dataset version into an
+attorney × term matrix — stored by term as sorted row ids (CSC layout:
+indptr into one int32 row array) — and a row's count for a JD is the
+number of the JD's term columns that contain it.
+
+The attorney text columns are string[pyarrow], so pandas runs that regex
+with Arrow's engine (RE2), where \\s is [\\t\\n\\f\\r ] only; the text is
+split with the same engine and class. A term can only be a whole token if
+it contains no delimiter, so a term that does is returned as missing for
+the caller to scan with the regex.
+
+Tests in tests/test_practice_terms.py; `python -m tests.bench practice_terms`
+times practice-area counting, regex vs matrix.
+
+Usage:
+    matrix = practice_terms.build(spec_texts)
+    counts, missing = matrix.count(["securities", "litigation"], positions)
+"""
+
+import re
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+_DELIMITERS = r"[\s,;/]+"
+_DELIMITER_CHARS = frozenset("\t\n\f\r ,;/")  # what \s and the class match in RE2
+
+
+def term_pattern(term):
+    """The regex the scorer applies for term (the scan fallback)."""
+    return r'(?:^|[\s,;/])' + re.escape(term) + r'(?:$|[\s,;/])'
+
+
+class TermMatrix:
+    """Sparse attorney × token matrix: token → sorted row positions containing it."""
+
+    def __init__(self, vocabulary, indptr, rows, n_rows):
+        self.vocabulary = vocabulary  # token → column
+        self.indptr = indptr          # column c's rows are rows[indptr[c]:indptr[c + 1]]
+        self.rows = rows
+        self.n_rows = n_rows
+        self.frame = None  # the frame the positions refer to (set by the app, not pickled)
+
+    def __getstate__(self):
+        return {"vocabulary": self.vocabulary, "indptr": self.indptr, "rows": self.rows, "n_rows": self.n_rows}
+
+    def __setstate__(self, state):
+        self.__init__(state["vocabulary"], state["indptr"], state["rows"], state["n_rows"])
+
+    @property
+    def nbytes(self):
+        return self.indptr.nbytes + self.rows.nbytes
+
+    def column(self, term):
+        """Sorted row positions whose text has term as a token (empty if none)."""
+        col = self.vocabulary.get(term)
+        if col is None:
+            return self.rows[:0]
+        return self.rows[self.indptr[col]:self.indptr[col + 1]]
+
+    def count(self, terms, positions):
+        """Per position, how many of the (lower-cased) terms are tokens of its text.
+
+        Returns (counts, missing): terms that contain a delimiter (or are
+        empty) cannot be tokens and are returned for the caller to scan.
+        """
+        columns, missing = [], []
+        for term in terms:
+            if not term or not _DELIMITER_CHARS.isdisjoint(term):
+                missing.append(term)
+            else:
+                columns.append(self.column(term))
+        if not columns:
+            return np.zeros(len(positions), dtype=np.int64), missing
+        # Row sum over the term columns (each column holds a row at most once)
+        counts = np.bincount(np.concatenate(columns), minlength=self.n_rows)
+        return counts[np.asarray(positions, dtype=np.int64)].astype(np.int64), missing
+
+    def remapped(self, take, new_rows):
+        """Matrix for a frame rebuilt by an attorney delta.
+
+        take gives, per new row, its source position: < n_rows for a row of
+        this matrix, n_rows + i for row i of new_rows (a matrix over the
+        changed rows).
+        """
+        vocabulary = dict(self.vocabulary)
+        for term in new_rows.vocabulary:
+            vocabulary.setdefault(term, len(vocabulary))
+        new_cols = np.array([vocabulary[t] for t in new_rows.vocabulary], dtype=np.int64)
+        cols = np.concatenate([np.repeat(np.arange(len(self.vocabulary)), np.diff(self.indptr)),
+                               np.repeat(new_cols, np.diff(new_rows.indptr)).astype(np.int64)])
+        sources = np.concatenate([self.rows.astype(np.int64), new_rows.rows.astype(np.int64) + self.n_rows])
+        new_position = np.full(self.n_rows + new_rows.n_rows, -1, dtype=np.int64)
+        new_position[np.asarray(take, dtype=np.int64)] = np.arange(len(take))
+        positions = new_position[sources]
+        keep = positions >= 0
+        return _from_pairs(vocabulary, cols[keep], positions[keep], len(take))
+
+
+def _from_pairs(vocabulary, cols, rows, n_rows):
+    """TermMatrix from (column, row) pairs — duplicates dropped, sorted by column then row."""
+    keys = np.unique(cols.astype(np.int64) * max(n_rows, 1) + rows)
+    cols, rows = np.divmod(keys, max(n_rows, 1))
+    indptr = np.searchsorted(cols, np.arange(len(vocabulary) + 1)).astype(np.int64)
+    return TermMatrix(vocabulary, indptr, rows.astype(np.int32), n_rows)
+
+
+def build(texts):
+    """Matrix over texts (a Series of lower-cased practice-area text, nulls as "")."""
+    arr = pa.array(texts, from_pandas=True)
+    if isinstance(arr, pa.ChunkedArray):
+        arr = arr.combine_chunks()
+    arr = arr.cast(pa.large_string()).fill_null("")
+    tokens = pc.split_pattern_regex(arr, _DELIMITERS)
+    rows = pc.list_parent_indices(tokens).to_numpy()
+    flat = pc.list_flatten(tokens)
+    keep = pc.greater(pc.binary_length(flat), 0)
+    encoded = pc.filter(flat, keep).dictionary_encode()
+    rows = rows[keep.to_numpy(zero_copy_only=False)]
+    vocabulary = {term: i for i, term in enumerate(encoded.dictionary.to_pylist())}
+    return _from_pairs(vocabulary, encoded.indices.to_numpy().astype(np.int64), rows.astype(np.int64), len(arr))
+
@@ -0,0 +1,274 @@
+"""
+precompute.py — Background top-candidate precompute on a bounded process pool
+
+The Top Candidates tab of a firm scores every attorney against its Hiring
+DNA; get_top_candidates() caches the result per dataset version. The
+startup data usually fills that cache already (the app loads it from an
+artifact, in the gunicorn master); the scheduler fills in whatever is
+missing after startup and every reload or delta, so the first view of a
+firm does not pay for the scoring.
+
+Firms are queued in the app's priority order (Active Clients, then
+recently viewed firms, ...) and scored in batches by a registered task.
+The task runs on a pool of at most JAIDE_PRECOMPUTE_WORKERS processes,
+forked from the app process so they share its frames copy-on-write;
+scoring there keeps the CPU work off the GIL the request threads need.
+Only firm names go in and (firm, row positions, score components) come
+back; the app turns those into candidate dicts and caches them.
+
+A fork copies the parent's locks in whatever state its other threads
+hold them, so the pool is only forked by fork_pool(), which the app calls
+before it starts any thread (gunicorn's post_fork), never lazily. A
+forked worker sees the dataset of that moment, so the pool is tagged
+with its dataset version: runs for any other version (after a swap), and
+runs without a pool, score on the scheduler thread instead. A new run
+supersedes the one before it.
+
+Between batches the scheduler waits while it is paused (pause()/resume(),
+the admin endpoint) or while max_active or more requests are in flight
+(request_started()/request_finished(), called by the app's request hooks
+for authenticated API calls; health checks and static files do not count),
+so precompute never competes with a busy server. In-flight requests are
+counted in shared memory (LoadCounter) by every process forked after the
+scheduler was created: under gunicorn with the app preloaded, the master
+creates it and the count covers every worker, so a sync worker (one
+request at a time) still sees its siblings' load. Without a preload each
+worker counts only its own requests.
+
+Configuration (environment):
+    JAIDE_PRECOMPUTE_WORKERS      worker processes (1; 0 = score on the scheduler thread)
+    JAIDE_PRECOMPUTE_BATCH        firms per task (16)
+    JAIDE_PRECOMPUTE_MAX_ACTIVE   pause while this many requests are in flight, all
+                                  workers together (from_env's server_workers: the
+                                  app passes gunicorn's WEB_CONCURRENCY, so precompute
+                                  pauses while every worker is serving; 0 = never)
+
+Tests in tests/test_precompute.py; `python -m tests.bench precompute` times
+a whole run and the first batch, per worker count.
+
+Usage:
+    precompute.register_task(score_batch)     # score_batch(version, firms) → [(firm, ...)] or None
+    scheduler = precompute.from_env()
+    scheduler.fork_pool(version)              # before any other thread starts
+    scheduler.run(version, firms, store)      # store(version, results) in the scheduler thread
+    scheduler.pause(); scheduler.resume(); scheduler.stats()
+"""
+
+import atexit
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+_TASK = {"fn": None}
+_POLL_SECONDS = 0.05
+
+
+def register_task(fn):
+    """Make fn(version, firms) the batch task (before the pool starts: workers are forked)."""
+    _TASK["fn"] = fn
+
+
+def _run_task(version, firms):
+    return _TASK["fn"](version, firms)
+
+
+def _alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class LoadCounter:
+    """Requests in flight, summed over this process and the processes forked from it.
+
+    One (pid, count) slot per process in shared memory, claimed on its
+    first request. Slots of exited processes are not counted and are
+    reused, so a worker killed mid-request leaves no load behind.
+    """
+
+    def __init__(self, slots=256):
+        ctx = multiprocessing.get_context("fork")
+        self._pids = ctx.RawArray("q", slots)
+        self._counts = ctx.RawArray("q", slots)
+        self._claim = ctx.Lock()
+        self._lock = threading.Lock()
+        self._slot = None  # (pid, index) of this process's slot
+
+    def _index(self):
+        pid = os.getpid()
+        if self._slot is None or self._slot[0] != pid:
+            with self._claim:
+                free = next((i for i, p in enumerate(self._pids) if p == 0 or not _alive(p)), None)
+                if free is None:
+                    return None  # more processes than slots: this one goes uncounted
+                self._pids[free], self._counts[free] = pid, 0
+            self._slot = (pid, free)
+        return self._slot[1]
+
+    def add(self, n):
+        with self._lock:
+            i = self._index()
+            if i is not None:
+                self._counts[i] = max(self._counts[i] + n, 0)
+
+    def total(self):
+        return sum(count for pid, count in zip(self._pids[:], self._counts[:])
+                   if pid and count and _alive(pid))
+
+
+class Scheduler:
+    """Runs one precompute at a time, in priority-ordered batches, pausable and load-aware."""
+
+    def __init__(self, workers=1, batch_size=16, max_active=1):
+        self.workers = workers
+        self.batch_size = max(batch_size, 1)
+        self.max_active = max_active
+        self._pool = None
+        self._pool_version = None
+        self._lock = threading.Lock()
+        self._run_id = 0
+        self._paused = False
+        self._load = LoadCounter()
+        self._progress = {"state": "idle", "version": None, "total": 0, "done": 0,
+                          "started_at": None, "seconds": None, "error": None}
+        atexit.register(self.shutdown)
+
+    # -- load and pause -------------------------------------------------------
+
+    def request_started(self):
+        self._load.add(1)
+
+    def request_finished(self):
+        self._load.add(-1)
+
+    def pause(self):
+        self._paused = True
+
+    def resume(self):
+        self._paused = False
+
+    def _busy(self):
+        return 0 < self.max_active <= self._load.total()
+
+    def _wait_turn(self, run_id):
+        """Block while paused or busy; False once run_id has been superseded."""
+        while run_id == self._run_id:
+            if not self._paused and not self._busy():
+                self._set(run_id, state="running")
+                return True
+            self._set(run_id, state="paused" if self._paused else "waiting (load)")
+            time.sleep(_POLL_SECONDS)
+        return False
+
+    # -- runs -----------------------------------------------------------------
+
+    def fork_pool(self, version):
+        """Fork the worker processes now, for a dataset version (no-op without workers).
+
+        Call it while no other thread runs: the workers are forked here and
+        never again, and only runs for this version use them.
+        """
+        if self.workers <= 0:
+            return
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+            pool = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("fork"))
+            pool.submit(os.getpid).result()  # a fork pool starts all of its workers on first use
+            self._pool, self._pool_version = pool, version
+
+    def run(self, version, firms, store):
+        """Precompute firms (in order) for a dataset version on a background thread.
+
+        store(version, results) is called with each batch's task results.
+        Any earlier run stops at its next batch.
+        """
+        with self._lock:
+            self._run_id += 1
+            run_id = self._run_id
+            self._progress = {"state": "queued", "version": version, "total": len(firms), "done": 0,
+                              "started_at": time.time(), "seconds": None, "error": None}
+        thread = threading.Thread(target=self._run, args=(run_id, version, list(firms), store),
+                                  name="precompute", daemon=True)
+        thread.start()
+        return thread
+
+    def _run(self, run_id, version, firms, store):
+        t0 = time.perf_counter()
+        with self._lock:
+            pool = self._pool if self._pool_version == version else None
+        batches = deque(firms[i:i + self.batch_size] for i in range(0, len(firms), self.batch_size))
+        pending = deque()  # (firms, future) in submission order, at most `workers`
+        try:
+            while batches or pending:
+                while batches and len(pending) < (self.workers if pool is not None else 1):
+                    if not self._wait_turn(run_id):
+                        return
+                    batch = batches.popleft()
+                    pending.append((batch, self._submit(pool, version, batch)))
+                batch, future = pending.popleft()
+                results = future() if callable(future) else future.result()
+                if run_id != self._run_id:
+                    return
+                if results is None:
+                    self._set(run_id, state="stale")  # the app moved on; its new run takes over
+                    return
+                store(version, results)
+                with self._lock:
+                    if run_id == self._run_id:
+                        self._progress["done"] += len(batch)
+        except Exception as e:
+            if run_id == self._run_id:  # superseded runs see their futures cancelled
+                self._set(run_id, state="failed", error=f"{type(e).__name__}: {e}")
+                print(f"[Precompute error] version {version}: {e}")
+            return
+        seconds = time.perf_counter() - t0
+        self._set(run_id, state="done", seconds=round(seconds, 2))
+        where = f"{self.workers} worker process{'es' if self.workers != 1 else ''}" if pool else "scheduler thread"
+        print(f"[Background] Pre-computed top candidates for {len(firms)} firms in {seconds:.1f}s ({where}).")
+
+    @staticmethod
+    def _submit(pool, version, firms):
+        """A future for the task on the pool (or, without one, a callable running it here)."""
+        if pool is None:
+            return lambda: _run_task(version, firms)
+        return pool.submit(_run_task, version, firms)
+
+    def _set(self, run_id, **fields):
+        with self._lock:
+            if run_id == self._run_id:
+                self._progress.update(fields)
+
+    def shutdown(self):
+        with self._lock:
+            self._run_id += 1
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+    def stats(self):
+        with self._lock:
+            progress = dict(self._progress)
+        active = self._load.total()
+        return {**progress, "paused": self._paused, "active_requests": active, "workers": self.workers,
+                "batch_size": self.batch_size, "max_active": self.max_active,
+                "pool_started": self._pool is not None, "pool_version": self._pool_version}
+
+
+def from_env(server_workers=1):
+    """Scheduler configured from JAIDE_PRECOMPUTE_WORKERS, _BATCH and _MAX_ACTIVE.
+
+    max_active defaults to server_workers, the processes sharing the load
+    count: precompute pauses while every one of them is serving.
+    """
+    return Scheduler(int(os.environ.get("JAIDE_PRECOMPUTE_WORKERS", 1)),
+                     int(os.environ.get("JAIDE_PRECOMPUTE_BATCH", 16)),
+                     int(os.environ.get("JAIDE_PRECOMPUTE_MAX_ACTIVE", max(server_workers, 1))))
+
@@ -0,0 +1,155 @@
+"""
+request_timing.py — Per-stage timings for the search endpoints
+
+A slow search could be JD parsing, firm-name matching, hiring-pattern
+analysis, filtering, scoring, rationale building, the custom-attorney
+query or the Claude call. Views decorated with @timed(name) get a Timings
+for the request; code anywhere below them wraps a stage in span(stage),
+which is a no-op outside a timed request (precompute threads, CLI checks).
+
+When the view returns, the response gets a Server-Timing header (one
+metric per stage plus total, shown in the browser's network panel), and
+requests slower than JAIDE_SLOW_REQUEST_MS are logged with their stage
+breakdown. Views also put timings.as_dict() in their JSON (meta.timings).
+
+Streamed (SSE) responses run most stages after the view returns: such a
+view takes its Timings with streaming() and wraps its generator in
+stream(), which runs it as part of the request and finishes (logs) the
+timings when it ends; the header then only covers what ran before the
+stream started.
+
+Configuration (environment):
+    JAIDE_SLOW_REQUEST_MS   log requests slower than this, with their stages (2000; 0 = off)
+
+Usage:
+    @app.route("/api/search", methods=["POST"])
+    @request_timing.timed("search")
+    def search():
+        with request_timing.span("score"):
+            ...
+        meta["timings"] = request_timing.current().as_dict()
+"""
+
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+from flask import make_response
+
+SLOW_REQUEST_MS = float(os.environ.get("JAIDE_SLOW_REQUEST_MS", 2000))
+
+_local = threading.local()
+
+
+class Timings:
+    """Milliseconds per stage for one request, in first-seen order (repeated stages add up)."""
+
+    def __init__(self, name):
+        self.name = name
+        self.stages = {}
+        self.streaming = False
+        self._t0 = time.perf_counter()
+        self._total_ms = None
+
+    def add(self, stage, ms):
+        self.stages[stage] = self.stages.get(stage, 0.0) + ms
+
+    @contextmanager
+    def span(self, stage):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, (time.perf_counter() - t0) * 1000)
+
+    @property
+    def total_ms(self):
+        if self._total_ms is not None:
+            return self._total_ms
+        return (time.perf_counter() - self._t0) * 1000
+
+    def as_dict(self):
+        return {"total_ms": round(self.total_ms, 1),
+                "stages": [{"stage": stage, "ms": round(ms, 1)} for stage, ms in self.stages.items()]}
+
+    def header(self):
+        """Server-Timing header value."""
+        metrics = [f"{_metric_name(stage)};dur={ms:.1f}" for stage, ms in self.stages.items()]
+        return ", ".join(metrics + [f"total;dur={self.total_ms:.1f}"])
+
+    def finish(self):
+        """Stop the clock and log the request if it was slow."""
+        if self._total_ms is None:
+            self._total_ms = (time.perf_counter() - self._t0) * 1000
+            if 0 < SLOW_REQUEST_MS <= self._total_ms:
+                breakdown = ", ".join(f"{stage} {ms:.0f}ms" for stage, ms in
+                                      sorted(self.stages.items(), key=lambda item: -item[1]))
+                print(f"[Slow request] {self.name} took {self._total_ms:.0f}ms: {breakdown or 'no stages'}")
+
+
+def _metric_name(stage):
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", stage)
+
+
+def current():
+    """The Timings of the request this thread is serving, or None."""
+    return getattr(_local, "timings", None)
+
+
+@contextmanager
+def activate(timings):
+    """Make timings the current request's (for a stream generator) while the block runs."""
+    previous = current()
+    _local.timings = timings
+    try:
+        yield timings
+    finally:
+        _local.timings = previous
+
+
+@contextmanager
+def span(stage):
+    """Time the block as stage of the current request (nothing outside a timed request)."""
+    timings = current()
+    if timings is None:
+        yield
+        return
+    with timings.span(stage):
+        yield
+
+
+def streaming():
+    """Hand the current Timings to a stream: timed() will not finish (log) it."""
+    timings = current()
+    if timings is not None:
+        timings.streaming = True
+    return timings
+
+
+def stream(events, timings):
+    """Yield from the events generator as part of timings' request, then finish timings."""
+    if timings is None:
+        yield from events
+        return
+    with activate(timings):
+        yield from events
+    timings.finish()
+
+
+def timed(name):
+    """Decorator for Flask views: time the request and add a Server-Timing header."""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            timings = Timings(name)
+            with activate(timings):
+                response = make_response(view(*args, **kwargs))
+            if not timings.streaming:
+                timings.finish()
+            response.headers["Server-Timing"] = timings.header()
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,112 @@
+"""
+result_cache.py — TTL caches for repeated /api/search runs
+
+Recruiters re-run the same JD (toggling AI, re-opening a tab). search()
+keeps two caches keyed by a hash of the normalized JD and the request
+options that change the result, plus the dataset version so a reload or
+delta never serves results computed on older data:
+
+  - shortlist: the SearchPlan output (parsed JD, hiring patterns, scored
+    shortlist, meta) — skips parsing, pattern analysis and scoring;
+  - ai:        the Claude tiering of that shortlist — skips the API call.
+
+Entries expire after a TTL and the least recently used ones are dropped
+beyond a size bound. Hits, misses, expiries and evictions are counted for
+/api/admin/search-cache.
+
+Configuration (environment):
+    JAIDE_SEARCH_CACHE_TTL / JAIDE_SEARCH_CACHE_SIZE   shortlist (600 s, 256 entries)
+    JAIDE_AI_CACHE_TTL / JAIDE_AI_CACHE_SIZE           AI results (1800 s, 256 entries)
+
+Usage:
+    cache = result_cache.TTLCache("shortlist", ttl=600, maxsize=256)
+    key = result_cache.make_key(result_cache.normalize_jd(jd), firm, skip, DATASET_VERSION)
+    value = cache.get(key)            # None on a miss or an expired entry
+    cache.put(key, value)
+    cache.stats()
+"""
+
+import copy
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+
+def normalize_jd(text):
+    """JD text with line endings unified, trailing spaces and outer blank lines removed.
+
+    Only differences the JD parsers ignore are normalized away (case and
+    inner spacing are kept), so the same normalized text always parses the
+    same way; search() parses the normalized text itself.
+    """
+    lines = (text or "").replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    return "\n".join(line.rstrip() for line in lines).strip("\n")
+
+
+def make_key(*parts):
+    """Stable hash of JSON-serializable key parts."""
+    payload = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire ttl seconds after being stored.
+
+    Values are deep-copied in and out, so callers may mutate what they get.
+    """
+
+    def __init__(self, name, ttl, maxsize):
+        self.name = name
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries = OrderedDict()  # key → (stored_at, value)
+        self._lock = threading.Lock()
+        self._counts = {"hits": 0, "misses": 0, "expired": 0, "evicted": 0}
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] > self.ttl:
+                del self._entries[key]
+                self._counts["expired"] += 1
+                entry = None
+            if entry is None:
+                self._counts["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._counts["hits"] += 1
+            value = entry[1]
+        return copy.deepcopy(value)
+
+    def put(self, key, value):
+        if self.ttl <= 0 or self.maxsize <= 0:
+            return
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._counts["evicted"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self._counts["hits"] + self._counts["misses"]
+            return {
+                "name": self.name, "ttl_seconds": self.ttl, "maxsize": self.maxsize,
+                "entries": len(self._entries), **self._counts,
+                "hit_rate": round(self._counts["hits"] / lookups, 3) if lookups else None,
+            }
+
+
+def from_env(name, prefix, default_ttl, default_size):
+    """TTLCache configured from {prefix}_TTL and {prefix}_SIZE."""
+    return TTLCache(name, float(os.environ.get(f"{prefix}_TTL", default_ttl)),
+                    int(os.environ.get(f"{prefix}_SIZE", default_size)))
@@ -0,0 +1,151 @@
+"""
+result_sets.py — Server-side result sets for paging through a search
+
+/api/search returns the top 25 candidates, but a search usually matches
+thousands. Instead of re-running the search for the next page, search()
+stores every matching row position with its component scores (int32 /
+int16 arrays, ~16 bytes per match) under a result-set id, and
+/api/search/<id>/page serializes further pages from it without re-scoring.
+
+The arrays are stored in the scorer's row order and ranked (score
+descending, equal scores in row order — the shortlist's order) on the
+first page request, so a search nobody pages through never pays for a full
+sort. Row positions refer to the attorney frame the search ran on; the app
+keeps that frame with the set and drops every set on a dataset swap.
+
+Sets expire after a TTL and the least recently used ones are dropped while
+the stored arrays exceed a memory budget (the newest set is always kept).
+
+Configuration (environment):
+    JAIDE_RESULT_SETS_MB    memory budget for the stored arrays (64)
+    JAIDE_RESULT_SETS_TTL   seconds a set lives after its last use (1800)
+
+Usage:
+    store = result_sets.ResultSetStore(max_bytes=64 * 2**20, ttl=1800)
+    set_id = store.add(result_sets.ResultSet(positions, scores, context))
+    rs = store.get(set_id)            # None once expired or evicted
+    positions, scores = rs.page(cursor, limit)
+    store.stats()
+"""
+
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+import numpy as np
+
+
+def _compact(values):
+    """values as the smallest signed integer dtype that holds them."""
+    values = np.asarray(values)
+    for dtype in (np.int16, np.int32):
+        info = np.iinfo(dtype)
+        if not len(values) or (values.min() >= info.min and values.max() <= info.max):
+            return values.astype(dtype)
+    return values.astype(np.int64)
+
+
+class ResultSet:
+    """Matching row positions and their scores for one search.
+
+    scores maps score names to arrays aligned with positions and must
+    include "match_score"; context is whatever the app needs to turn rows
+    into candidates (frame, keywords, ...).
+    """
+
+    def __init__(self, positions, scores, context=None):
+        self.positions = _compact(positions)
+        self.scores = {name: _compact(values) for name, values in scores.items()}
+        self.context = context or {}
+        self.ranked = False
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.positions)
+
+    @property
+    def nbytes(self):
+        return self.positions.nbytes + sum(v.nbytes for v in self.scores.values())
+
+    def _rank(self):
+        with self._lock:
+            if not self.ranked:
+                order = np.lexsort((self.positions, -self.scores["match_score"].astype(np.int64)))
+                self.positions = self.positions[order]
+                self.scores = {name: values[order] for name, values in self.scores.items()}
+                self.ranked = True
+
+    def page(self, cursor, limit):
+        """(positions, scores) of ranks cursor .. cursor + limit - 1."""
+        self._rank()
+        end = cursor + limit
+        return (self.positions[cursor:end].astype(np.int64),
+                {name: values[cursor:end].astype(np.int64) for name, values in self.scores.items()})
+
+
+class ResultSetStore:
+    """Thread-safe id → ResultSet map bounded by a TTL and a memory budget."""
+
+    def __init__(self, max_bytes, ttl):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._sets = OrderedDict()  # id → (last_used, ResultSet)
+        self._lock = threading.Lock()
+        self._counts = {"added": 0, "hits": 0, "misses": 0, "expired": 0, "evicted": 0}
+
+    def add(self, result_set):
+        set_id = uuid.uuid4().hex
+        with self._lock:
+            self._sets[set_id] = (time.monotonic(), result_set)
+            self._counts["added"] += 1
+            self._evict()
+        return set_id
+
+    def get(self, set_id):
+        with self._lock:
+            self._expire()
+            entry = self._sets.get(set_id)
+            if entry is None:
+                self._counts["misses"] += 1
+                return None
+            self._sets[set_id] = (time.monotonic(), entry[1])
+            self._sets.move_to_end(set_id)
+            self._counts["hits"] += 1
+            return entry[1]
+
+    def _expire(self):
+        now = time.monotonic()
+        while self._sets:
+            set_id, (last_used, _) = next(iter(self._sets.items()))
+            if now - last_used <= self.ttl:
+                break
+            del self._sets[set_id]
+            self._counts["expired"] += 1
+
+    def _evict(self):
+        self._expire()
+        total = sum(rs.nbytes for _, rs in self._sets.values())
+        while len(self._sets) > 1 and total > self.max_bytes:
+            _, (_, rs) = self._sets.popitem(last=False)
+            total -= rs.nbytes
+            self._counts["evicted"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._sets.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "sets": len(self._sets), "max_bytes": self.max_bytes, "ttl_seconds": self.ttl,
+                "bytes": sum(rs.nbytes for _, rs in self._sets.values()),
+                "rows": sum(len(rs) for _, rs in self._sets.values()), **self._counts,
+            }
+
+
+def from_env():
+    """ResultSetStore configured from JAIDE_RESULT_SETS_MB and JAIDE_RESULT_SETS_TTL."""
+    return ResultSetStore(int(float(os.environ.get("JAIDE_RESULT_SETS_MB", 64)) * 2**20),
+                          float(os.environ.get("JAIDE_RESULT_SETS_TTL", 1800)))
@@ -0,0 +1,198 @@
+"""
+search_bench.py — Search latency benchmark for comparing commits
+
+Replays a fixed set of JDs through /api/search (Quick Match, AI off) with
+the Flask test client, and scores the firms with a Hiring DNA through
+score_candidates_for_firm(), then reports p50/p95/p99 latency, throughput
+and peak RSS as JSON. The shortlist cache is cleared before every search,
+so each request parses, filters and scores; the first request of each
+kind is a warm-up and not counted.
+
+The JDs are FIXTURE_JDS plus --jobs job descriptions taken at even steps
+from the loaded jobs export. Run it against a synthetic data directory
+(see synthetic_data.py) so the numbers do not depend on whichever export
+is on disk; the same seed and scale give the same data on every commit.
+
+Usage:
+    python synthetic_data.py generate --scale 500k --out /tmp/jaide-500k
+    JAIDE_DATA_DIR=/tmp/jaide-500k python search_bench.py run --out before.json
+        [--jobs 24] [--firms 20] [--repeats 3]
+    python search_bench.py compare before.json after.json
+
+The first run on a data directory also builds its snapshots and artifacts
+(reported as startup_s); run twice when comparing startup.
+"""
+
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+# Different query shapes: broad multi-area, narrow specialty, firm-named,
+# location + class-year filters, partner level, and a one-word JD
+FIXTURE_JDS = [
+    "Experienced lawyer: litigation, corporate, tax, intellectual property, employment, "
+    "bankruptcy, antitrust.",
+    "Corporate associate — M&A, private equity, capital markets, securities, venture capital, "
+    "joint ventures and general corporate governance.",
+    "Litigation associate, class of 2016-2020, New York. Securities litigation, white collar, "
+    "internal investigations, SEC enforcement.",
+    "Fund formation associate with 3-5 years of experience in Boston. Private equity funds, "
+    "limited partnership agreements, side letters, carried interest. Harvard preferred.",
+    "Partner, real estate, New York and Chicago, Georgetown, 10+ years of experience in "
+    "commercial real estate, leasing, zoning and real estate finance.",
+    "Patent litigation associate in Palo Alto or San Francisco with a technical degree and "
+    "2-6 years of experience in licensing, trademark and patent prosecution.",
+    "Restructuring and bankruptcy counsel, Houston or Dallas, leveraged finance and credit "
+    "facilities, class of 2012-2018.",
+    "tax",
+]
+
+
+def _load_app():
+    os.environ["JAIDE_PRELOAD"] = "1"
+    os.environ.pop("ANTHROPIC_API_KEY", None)  # Quick Match only
+    import app
+    return app
+
+
+def _commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _latency(ms, seconds):
+    ms = np.asarray(ms, dtype=float)
+    if not len(ms):
+        return {"runs": 0}
+    p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+    return {"runs": len(ms), "p50_ms": round(p50, 1), "p95_ms": round(p95, 1), "p99_ms": round(p99, 1),
+            "mean_ms": round(ms.mean(), 1), "max_ms": round(ms.max(), 1),
+            "throughput_per_s": round(len(ms) / seconds, 2) if seconds else None}
+
+
+def _fixture_jds(app, jobs):
+    descriptions = app.JOBS_DF["Job Description"] if "Job Description" in app.JOBS_DF else []
+    sampled = [d for d in list(descriptions)[::max(1, len(descriptions) // jobs)][:jobs] if d.strip()] if jobs else []
+    return FIXTURE_JDS + sampled
+
+
+def _bench_firms(app, n):
+    """n firms with a Hiring DNA, at even steps through the sorted names."""
+    firms = sorted(app.HIRING_DNA)
+    return firms[::max(1, len(firms) // n)][:n] if n else []
+
+
+def bench_search(app, jds, repeats):
+    client = app.app.test_client()
+    with client.session_transaction() as session:
+        session["user_id"] = 1
+
+    def search(jd):
+        app.SEARCH_SHORTLIST_CACHE.clear()
+        t0 = time.perf_counter()
+        response = client.post("/api/search", json={"jd": jd, "use_ai": False})
+        ms = (time.perf_counter() - t0) * 1000
+        if response.status_code != 200:
+            raise RuntimeError(f"/api/search returned {response.status_code}: {response.get_data(as_text=True)[:200]}")
+        return ms, response.get_json()["meta"].get("timings", {}).get("stages", [])
+
+    search(jds[0])
+    ms, stages = [], {}
+    t0 = time.perf_counter()
+    for _ in range(repeats):
+        for jd in jds:
+            request_ms, request_stages = search(jd)
+            ms.append(request_ms)
+            for stage in request_stages:
+                stages.setdefault(stage["stage"], []).append(stage["ms"])
+    report = _latency(ms, time.perf_counter() - t0)
+    report["stage_p50_ms"] = {stage: round(float(np.median(v)), 1) for stage, v in stages.items()}
+    return report
+
+
+def bench_firm_scoring(app, firms, repeats):
+    if not firms:
+        return _latency([], 0)
+    app.score_candidates_for_firm(firms[0])
+    ms = []
+    t0 = time.perf_counter()
+    for _ in range(repeats):
+        for firm in firms:
+            t1 = time.perf_counter()
+            app.score_candidates_for_firm(firm)
+            ms.append((time.perf_counter() - t1) * 1000)
+    return _latency(ms, time.perf_counter() - t0)
+
+
+def run(jobs=24, firms=20, repeats=3):
+    t0 = time.perf_counter()
+    app = _load_app()
+    startup_s = time.perf_counter() - t0
+    if app.ATTORNEYS_DF.empty:
+        raise SystemExit(f"No attorney data in {app.data_snapshot.DATA_DIR} (set JAIDE_DATA_DIR)")
+    jds = _fixture_jds(app, jobs)
+    firm_names = _bench_firms(app, firms)
+    print(f"{len(app.ATTORNEYS_DF):,} attorneys, {len(app.HIRING_DNA):,} firms with a Hiring DNA; "
+          f"{len(jds)} JDs and {len(firm_names)} firms x {repeats}", file=sys.stderr)
+    report = {
+        "commit": _commit(),
+        "data_dir": os.path.abspath(app.data_snapshot.DATA_DIR),
+        "dataset_version": app.DATASET_VERSION,
+        "attorneys": len(app.ATTORNEYS_DF),
+        "hiring_moves": len(app.HIRING_DF),
+        "jds": len(jds),
+        "firms": len(firm_names),
+        "repeats": repeats,
+        "scoring_workers": app.SCORING_ENGINE.workers,
+        "startup_s": round(startup_s, 2),
+        "search": bench_search(app, jds, repeats),
+        "firm_scoring": bench_firm_scoring(app, firm_names, repeats),
+        # The scoring workers (if any) are separate processes and not included
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+    return report
+
+
+def compare(before, after):
+    """Print the latency and memory change between two run reports."""
+    print(f"{'':32}{before.get('commit') or 'before':>12}{after.get('commit') or 'after':>12}{'change':>10}")
+    rows = [(f"{section} {stat}", before[section].get(stat), after[section].get(stat))
+            for section in ("search", "firm_scoring")
+            for stat in ("p50_ms", "p95_ms", "p99_ms", "throughput_per_s")]
+    rows += [("startup_s", before["startup_s"], after["startup_s"]),
+             ("peak_rss_mb", before["peak_rss_mb"], after["peak_rss_mb"])]
+    for label, a, b in rows:
+        change = f"{(b - a) / a * 100:+.0f}%" if a and b is not None else ""
+        print(f"{label:32}{a if a is not None else '-':>12}{b if b is not None else '-':>12}{change:>10}")
+    if before.get("attorneys") != after.get("attorneys") or before.get("data_dir") != after.get("data_dir"):
+        print("Note: the runs used different data")
+
+
+def _option(args, name, default):
+    return args[args.index(name) + 1] if name in args else default
+
+
+if __name__ == "__main__":
+    cmd = sys.argv[1] if len(sys.argv) > 1 else ""
+    args = sys.argv[2:]
+    if cmd == "run":
+        report = run(int(_option(args, "--jobs", 24)), int(_option(args, "--firms", 20)), int(_option(args, "--repeats", 3)))
+        out = _option(args, "--out", None)
+        if out:
+            with open(out, "w") as f:
+                json.dump(report, f, indent=2)
+        print(json.dumps(report, indent=2))
+    elif cmd == "compare" and len(args) == 2:
+        with open(args[0]) as a, open(args[1]) as b:
+            compare(json.load(a), json.load(b))
+    else:
+        print(__doc__)
+        sys.exit(2)
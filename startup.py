@@ -0,0 +1,200 @@
+"""
+startup.py — Staged startup and readiness
+
+app.py registers its heavy data loads (datasets, bio store, Hiring DNA,
+firm index, school aliases) as ordered stages instead of running them at
+import time. start() runs them in a background thread so the HTTP server
+answers immediately. Stages registered as shared only read prebuilt
+snapshots and artifacts: under gunicorn.conf.py, preload() runs those in
+the master (when they are fresh) so workers inherit the data, and each
+worker's start() runs whatever is left after the port is bound. A shared
+stage that finds its input stale raises one of preload()'s `defer`
+exceptions and is left, with the stages after it, to start().
+
+Usage:
+    @startup.stage("hiring_dna")
+    def _load_hiring_dna(): ...
+
+    @startup.stage("attorneys", shared=True)   # a snapshot read preload() may run
+    def _load_attorneys(): ...
+
+    @app.route("/api/firms")
+    @startup.requires("firms", "hiring_dna")   # 503 until loaded (Retry-After unless failed)
+    def api_firms(): ...
+
+    startup.readiness()    # per-stage state and timings, for /readyz
+    startup.mark_ready(["attorneys"])   # after a hot reload replaced its data
+"""
+
+import threading
+import time
+import traceback
+from functools import wraps
+
+from flask import jsonify
+
+RETRY_AFTER_SECONDS = 5
+
+_stages = []   # [(name, fn)] in registration order
+_shared = set()  # names of stages preload() may run
+_next = 0      # index of the first stage not yet run
+_status = {}   # name → {"state", "seconds", "error"}
+_lock = threading.Lock()
+_all_done = threading.Event()
+_started = False
+_started_at = None
+
+
+def stage(name, shared=False):
+    """Register fn as the next startup stage (shared: preload() may run it)."""
+    def decorator(fn):
+        _stages.append((name, fn))
+        if shared:
+            _shared.add(name)
+        _status[name] = {"state": "pending", "seconds": None, "error": None}
+        return fn
+    return decorator
+
+
+def _run_stage(name, fn, defer=()):
+    status = _status[name]
+    status["state"] = "running"
+    t0 = time.perf_counter()
+    try:
+        fn()
+        status["state"] = "ready"
+    except defer as e:
+        status["state"] = "pending"
+        print(f"[Startup] {name}: deferred ({e})")
+        raise
+    except Exception as e:
+        # Later stages still run; endpoints needing this one keep answering 503
+        status["state"] = "failed"
+        status["error"] = f"{type(e).__name__}: {e}"
+        traceback.print_exc()
+    status["seconds"] = round(time.perf_counter() - t0, 3)
+    print(f"[Startup] {name}: {status['state']} in {status['seconds']:.2f}s")
+
+
+def _run_stages(shared_only=False, defer=()):
+    """Run stages from the first one not yet run.
+
+    shared_only stops at the first unshared stage, and a stage raising a
+    `defer` exception stops the run there (the stage stays pending).
+    """
+    global _next
+    while _next < len(_stages):
+        name, fn = _stages[_next]
+        if shared_only and name not in _shared:
+            break
+        try:
+            _run_stage(name, fn, defer)
+        except defer:
+            break
+        _next += 1
+
+
+def preload(cheap, defer=()):
+    """Run the leading shared stages in the calling thread if cheap() is true.
+
+    For the gunicorn master, which cannot answer /healthz until it has
+    loaded and bound its port: cheap() says whether the shared stages'
+    inputs are prebuilt (otherwise everything is left to start() in the
+    workers), and a stage raising one of the `defer` exception types
+    leaves itself and the rest to start(). Returns the names of the
+    stages run.
+    """
+    global _started_at
+    with _lock:
+        if _started or not cheap():
+            return []
+        _started_at = _started_at or time.time()
+        first = _next
+        _run_stages(shared_only=True, defer=defer)
+    return [name for name, _ in _stages[first:_next]]
+
+
+def run_all():
+    """Run every registered stage not yet run, in order, in the calling thread.
+
+    If the stages are already running (start()), waits for them instead.
+    """
+    global _started, _started_at
+    with _lock:
+        running = _started
+        _started = True
+        _started_at = _started_at or time.time()
+    if running:
+        wait_until_ready()
+        return
+    try:
+        _run_stages()
+    finally:
+        _all_done.set()
+    print(f"[Startup] all stages finished in {time.time() - _started_at:.1f}s")
+
+
+def start():
+    """Run the stages in a background thread (no-op if already started)."""
+    if _started:
+        return
+    threading.Thread(target=run_all, name="startup", daemon=True).start()
+
+
+def mark_ready(names):
+    """Mark finished stages ready: their data was just reloaded outside the
+    startup run (a hot reload swap), so a stage that failed at boot recovers."""
+    for name in names:
+        status = _status[name]
+        if status["state"] in ("ready", "failed"):
+            status.update(state="ready", error=None)
+
+
+def is_ready(*names):
+    """True when every named stage (default: all) has loaded successfully."""
+    names = names or [n for n, _ in _stages]
+    return all(_status[n]["state"] == "ready" for n in names)
+
+
+def wait_until_ready(timeout=None):
+    """Block until all stages have finished (ready or failed)."""
+    return _all_done.wait(timeout)
+
+
+def readiness():
+    """Snapshot of per-stage state for the /readyz endpoint."""
+    return {
+        "ready": is_ready(),
+        "uptime_seconds": round(time.time() - _started_at, 1) if _started_at else 0,
+        "stages": [{"name": n, **_status[n]} for n, _ in _stages],
+    }
+
+
+def not_ready_response(names):
+    """Fast 503 naming the stages still loading and the stages that failed.
+
+    Retry-After is only sent while nothing needed has failed: a failed
+    stage stays failed until a reload replaces its data (mark_ready).
+    """
+    names = names or [n for n, _ in _stages]
+    failed = [{"name": n, "error": _status[n]["error"]} for n in names if _status[n]["state"] == "failed"]
+    loading = [n for n in names if _status[n]["state"] not in ("ready", "failed")]
+    if failed:
+        resp = jsonify({"error": "Data failed to load", "failed": failed, "loading": loading})
+    else:
+        resp = jsonify({"error": "Data is still loading, please retry shortly", "loading": loading})
+        resp.headers["Retry-After"] = str(RETRY_AFTER_SECONDS)
+    resp.status_code = 503
+    return resp
+
+
+def requires(*names):
+    """Route decorator: answer 503 (+ Retry-After while loading) until the named stages are ready."""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if not is_ready(*names):
+                return not_ready_response(names)
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -396,7 +396,76 @@
         chatMessages.scrollTop = chatMessages.scrollHeight;
     }
 
+    // Quick Match over SSE: paint the header, charts and the first ranked
+    // candidates as soon as the server has them, then fill in the rest.
+    // Falls back to the plain JSON endpoint if the stream fails.
     function sendSearchQuick(text) {
+        const loader = addLoader();
+        const payload = { jd: text, use_ai: false };
+        if (_exactFirmName) payload.firm_name = _exactFirmName;
+        if (_skipPatterns) payload.skip_patterns = true;
+        let candidates = [];
+        let partial = null;
+        let finished = false;
+        fetch("/api/search/stream", {
+            method: "POST",
+            headers: { "Content-Type": "application/json" },
+            body: JSON.stringify(payload),
+        }).then((response) => {
+            if (!response.ok || !response.body) throw new Error("stream unavailable");
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffer = "";
+
+            function pump() {
+                return reader.read().then(({ done, value }) => {
+                    if (done) {
+                        if (!finished) throw new Error("stream ended early");
+                        return;
+                    }
+                    buffer += decoder.decode(value, { stream: true });
+                    const lines = buffer.split("\n");
+                    buffer = lines.pop();
+                    for (const line of lines) {
+                        if (!line.startsWith("data: ")) continue;
+                        let evt;
+                        try { evt = JSON.parse(line.slice(6)); } catch { continue; }
+
+                        if (evt.type === "parsed") {
+                            partial = { mode: "quick", meta: evt.parsed, hiring_patterns: null, candidates: [] };
+                        } else if (evt.type === "patterns") {
+                            partial.hiring_patterns = evt.hiring_patterns;
+                            renderResults(partial);
+                        } else if (evt.type === "candidates") {
+                            if (!candidates.length) loader.remove();
+                            candidates = candidates.concat(evt.candidates);
+                            currentCandidates = candidates;
+                            renderCandidateTable(currentCandidates);
+                        } else if (evt.type === "custom") {
+                            currentCandidates = evt.candidates;
+                            renderCandidateTable(currentCandidates);
+                        } else if (evt.type === "meta") {
+                            currentMeta = evt.meta;
+                        } else if (evt.type === "done") {
+                            finished = true;
+                            loader.remove();
+                            addBubble(evt.chat_response, "assistant");
+                            hasResults = true;
+                        }
+                    }
+                    return pump();
+                });
+            }
+            return pump();
+        }).catch((err) => {
+            if (finished) return;
+            loader.remove();
+            console.error(err);
+            sendSearchQuickJson(text);
+        });
+    }
+
+    function sendSearchQuickJson(text) {
         const loader = addLoader();
         const payload = { jd: text, use_ai: false };
         if (_exactFirmName) payload.firm_name = _exactFirmName;
@@ -0,0 +1,322 @@
+"""
+synthetic_data.py — Synthetic FP exports for benchmarking
+
+The attorney and hiring-history exports are proprietary, so search
+performance cannot be measured from a fresh checkout. This writes a data
+directory with attorneys.csv, hiring_history.csv, jobs.csv and firms.csv
+in the columns the app reads (ATTORNEY_COLUMNS plus attorneyBio/matters
+for the bio store, the hiring-history columns hiring_dna.py and the
+pattern analysis use, and the jobs/firms export layouts), with values
+drawn from fixed pools so the search filters, keyword index, practice
+terms and firm DNA all have realistic work to do.
+
+The output depends only on the seed and the sizes: the same arguments
+always produce the same files, so benchmark runs on different commits see
+identical data. Point the app at the directory with JAIDE_DATA_DIR (see
+data_snapshot.py); its snapshots and artifacts are built there too.
+
+Usage:
+    python synthetic_data.py generate --scale 500k --out /tmp/jaide-500k
+    python synthetic_data.py generate --attorneys 20000 --out /tmp/jaide-20k --seed 3
+        [--moves N] [--jobs 400] [--firms 200]
+    JAIDE_DATA_DIR=/tmp/jaide-500k python search_bench.py run
+
+Scales: 50k, 500k and 2m attorneys; hiring history defaults to one move
+per five attorneys, jobs to 400 and firms to 200.
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+SCALES = {"50k": 50_000, "500k": 500_000, "2m": 2_000_000}
+
+_CHUNK_ROWS = 100_000
+
+# ---------------------------------------------------------------------------
+# Value pools
+# ---------------------------------------------------------------------------
+
+# The practice-area columns of the firms export
+PRACTICE_AREAS = [
+    "Antitrust", "Banking", "Bankruptcy", "Corporate", "Data Privacy", "ERISA", "Energy",
+    "Entertainment", "Environmental", "FDA", "Government", "Health Care", "Insurance",
+    "Intellectual Property", "International Trade", "Labor & Employment", "Litigation", "Media",
+    "Real Estate", "Tax", "Telecommunications", "Transportation", "Trusts & Estates",
+]
+
+SPECIALTIES = [
+    "fund formation", "private equity", "mergers and acquisitions", "securities litigation",
+    "commercial real estate", "patent litigation", "leveraged finance", "restructuring",
+    "tax planning", "employee benefits", "white collar", "antitrust litigation", "data privacy",
+    "capital markets", "venture capital", "real estate finance", "class action",
+    "executive compensation", "project finance", "investment management", "emerging companies",
+    "commercial litigation", "appellate", "regulatory compliance", "trademark", "licensing",
+]
+
+KEYWORDS = [
+    "fund formation", "private equity", "due diligence", "M&A", "litigation", "real estate",
+    "lease", "loan", "tax", "patent", "ERISA", "bankruptcy", "antitrust", "energy", "healthcare",
+    "compliance", "IPO", "securitization", "arbitration", "trial", "joint venture",
+    "carried interest", "side letter", "limited partnership", "credit facility", "zoning",
+    "mortgage", "tenant", "licensing", "deposition", "discovery", "SEC reporting",
+]
+
+LAW_SCHOOLS = [
+    "Harvard University", "Yale University", "Stanford University", "New York University",
+    "Columbia University", "University of Chicago", "University of Pennsylvania",
+    "University of Virginia", "University of Michigan", "Georgetown University", "Boston College",
+    "Boston University", "Brooklyn Law School", "Fordham University",
+    "University of California Berkeley", "University of California Los Angeles",
+    "University of Texas", "Duke University", "Cornell University", "Northwestern University",
+    "Washington & Lee University", "George Washington University", "Cardozo Law",
+    "Suffolk University", "Emory University", "Vanderbilt University", "University of Southern California",
+]
+
+CITIES = [
+    ("Boston", "Massachusetts"), ("New York", "New York"), ("San Francisco", "California"),
+    ("Chicago", "Illinois"), ("Los Angeles", "California"), ("Washington", "District of Columbia"),
+    ("Houston", "Texas"), ("Dallas", "Texas"), ("Austin", "Texas"), ("Seattle", "Washington"),
+    ("Miami", "Florida"), ("Atlanta", "Georgia"), ("Denver", "Colorado"),
+    ("Philadelphia", "Pennsylvania"), ("Palo Alto", "California"), ("Charlotte", "North Carolina"),
+]
+
+TITLES = (["Associate"] * 8 + ["Senior Associate"] * 3 + ["Partner"] * 4 + [
+    "Counsel", "Of Counsel", "Senior Counsel", "Special Counsel", "Staff Attorney", "Attorney",
+    "Shareholder", "Member", "Managing Associate", "Principal", "",
+])
+
+FIRST_NAMES = ["James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda",
+               "David", "Elizabeth", "Wei", "Priya", "Carlos", "Aisha", "Noah", "Emma", "Daniel",
+               "Sofia", "Kevin", "Grace"]
+
+LAST_NAMES = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+              "Chen", "Patel", "Nguyen", "Kim", "Lopez", "Cohen", "Rossi", "Okafor", "Walsh",
+              "Schultz", "Ramirez", "Becker", "Hughes", "Foster", "Sato", "Murphy"]
+
+ENTITY_TYPES = ["Law Firm", "Law Firm", "Law Firm", "Company", "Government Agency"]
+
+JOB_TITLES = ["{pa} Associate", "Senior {pa} Associate", "{pa} Counsel", "{spec} Associate",
+              "{pa} Associate (Mid-Level)", "{pa} Partner"]
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _pick(rng, pool, n):
+    return np.asarray(pool, dtype=object)[rng.integers(0, len(pool), n)]
+
+
+def _maybe(rng, values, p):
+    """values where a coin with P(present) = p says so, else ""."""
+    return np.where(rng.random(len(values)) < p, values, "")
+
+
+def _pick_lists(rng, pool, n, max_items, sep=", ", min_items=0):
+    """n strings of min_items..max_items distinct pool values joined by sep."""
+    pool = np.asarray(pool, dtype=object)
+    counts = rng.integers(min_items, max_items + 1, n)
+    picks = rng.random((n, len(pool))).argsort(axis=1)[:, :max_items]
+    return np.array([sep.join(pool[row[:k]]) for row, k in zip(picks, counts)], dtype=object)
+
+
+def _cities(rng, n):
+    idx = rng.integers(0, len(CITIES), n)
+    return (np.array([f"{c}, {s}" for c, s in CITIES], dtype=object)[idx],
+            np.array([c for c, _ in CITIES], dtype=object)[idx],
+            np.array([s for _, s in CITIES], dtype=object)[idx])
+
+
+def firm_names(n, seed):
+    """n distinct "<Name> & <Name> LLP" firm names."""
+    rng = np.random.default_rng([seed, 1])
+    pairs = [(a, b) for a in LAST_NAMES for b in LAST_NAMES if a != b]
+    order = rng.permutation(len(pairs))
+    names = []
+    for i in range(n):
+        a, b = pairs[order[i % len(pairs)]]
+        names.append(f"{a} & {b} LLP" if i < len(pairs) else f"{a} & {b} {i // len(pairs) + 1} LLP")
+    return names
+
+
+# ---------------------------------------------------------------------------
+# Datasets
+# ---------------------------------------------------------------------------
+
+
+def _attorney_chunk(rng, start, n, firms):
+    location, _, state = _cities(rng, n)
+    keywords = _pick_lists(rng, KEYWORDS, n, 6)
+    ids = np.arange(start, start + n) + 1_000_000
+    return pd.DataFrame({
+        "id": ids.astype(str),
+        "first_name": _pick(rng, FIRST_NAMES, n),
+        "last_name": _pick(rng, LAST_NAMES, n),
+        "firm_name": _pick(rng, firms, n),
+        "firm_type": _pick(rng, ["Law Firm", "Law Firm", "Boutique", ""], n),
+        "location": location,
+        "title": _pick(rng, TITLES, n),
+        "summary": _maybe(rng, "Experienced in " + _pick_lists(rng, KEYWORDS, n, 4, min_items=4) + ".", 0.85),
+        "practice_areas": _pick_lists(rng, PRACTICE_AREAS, n, 3),
+        "specialty": _pick_lists(rng, SPECIALTIES, n, 4),
+        "added_keywords": keywords,
+        "nlp_specialties": _maybe(rng, _pick_lists(rng, SPECIALTIES, n, 2, "; ", min_items=2), 0.6),
+        "barAdmissions": _maybe(rng, state, 0.8),
+        "lawSchool": _maybe(rng, _pick(rng, LAW_SCHOOLS, n), 0.95),
+        "graduationYear": _maybe(rng, rng.integers(1975, 2026, n).astype(str), 0.9),
+        "undergraduate": _maybe(rng, _pick(rng, LAW_SCHOOLS, n), 0.7),
+        "llm_school": _maybe(rng, _pick(rng, LAW_SCHOOLS, n), 0.1),
+        "llm_specialty": "",
+        "clerkships": _maybe(rng, "Hon. Judge " + _pick(rng, LAST_NAMES, n), 0.15),
+        "prior_experience": _maybe(rng, _pick_lists(rng, firms, n, 3, "; ", min_items=1), 0.6),
+        "gender": _pick(rng, ["Male", "Female", ""], n),
+        "diverse": _pick(rng, ["TRUE", "FALSE", ""], n),
+        "top_200": _pick(rng, ["TRUE", "FALSE"], n),
+        "vault_50": _pick(rng, ["TRUE", "FALSE"], n),
+        "vault_10": _pick(rng, ["TRUE", "FALSE", "FALSE", "FALSE"], n),
+        "photo_url": "",
+        "profileURL": "",
+        "linkedinURL": "",
+        "languages": _maybe(rng, _pick(rng, ["Spanish", "French", "Mandarin", "German"], n), 0.2),
+        "raw_acknowledgements": _maybe(rng, "Chambers Band " + _pick(rng, ["1", "2", "3"], n), 0.2),
+        "email": np.char.add(np.char.add("a", ids.astype(str)), "@example.com"),
+        "phone_primary": "",
+        "scraped_on": [f"2025-{m:02d}-{d:02d}" for m, d in zip(rng.integers(1, 13, n), rng.integers(1, 29, n))],
+        "location_secondary": _maybe(rng, _cities(rng, n)[0], 0.3),
+        "attorneyBio": "Bio of attorney " + ids.astype(str).astype(object) + ". Practice focuses on "
+                       + keywords + "; " + _pick_lists(rng, KEYWORDS, n, 5, min_items=3) + ".",
+        "matters": _maybe(rng, "Represented clients in " + _pick(rng, KEYWORDS, n) + " matters.", 0.5),
+    })
+
+
+def _hiring_chunk(rng, n, firms, hiring_firms):
+    _, city, state = _cities(rng, n)
+    specialties = [s.title() for s in SPECIALTIES]
+    return pd.DataFrame({
+        "Firm": _pick(rng, hiring_firms, n),
+        "Law School": _maybe(rng, _pick(rng, LAW_SCHOOLS, n), 0.95),
+        "Previous Entity Type": _pick(rng, ENTITY_TYPES, n),
+        "Moved From": _pick(rng, firms, n),
+        "Practice Areas New": _pick_lists(rng, PRACTICE_AREAS, n, 3),
+        "Specialties New": _pick_lists(rng, specialties, n, 3),
+        "Class Year": _maybe(rng, rng.integers(1990, 2025, n).astype(str), 0.9),
+        "City": _maybe(rng, city, 0.95),
+        "State": state,
+        "Title": _pick(rng, TITLES, n),
+        "Specialties Old": _pick_lists(rng, specialties, n, 2),
+        "Move Date": [f"{y}-{m:02d}-01" for y, m in zip(rng.integers(2019, 2027, n), rng.integers(1, 13, n))],
+        "Practice Areas Old": _pick_lists(rng, PRACTICE_AREAS, n, 2),
+        "Entity Type": _pick(rng, ["Law Firm", "Company", "Government Agency", "Corporation"], n),
+    })
+
+
+def _job_description(rng, firm, title, city, practice, specs, min_yrs, max_yrs):
+    school = rng.choice(LAW_SCHOOLS)
+    extra = ", ".join(rng.choice(KEYWORDS, 3, replace=False))
+    return (f"{firm} is seeking a {title} to join its {practice} practice in the {city} office. "
+            f"Qualified candidates have {min_yrs}-{max_yrs} years of experience in {specs}, "
+            f"including {extra}. Strong academic credentials required; {school} preferred. "
+            f"Candidates must be admitted to practice and have excellent writing and client service skills.")
+
+
+def _jobs(rng, n, firms):
+    rows = []
+    for i in range(n):
+        firm = firms[rng.integers(len(firms))]
+        city, state = CITIES[rng.integers(len(CITIES))]
+        practice = PRACTICE_AREAS[rng.integers(len(PRACTICE_AREAS))]
+        specs = list(rng.choice(SPECIALTIES, 2, replace=False))
+        min_yrs = int(rng.integers(0, 8))
+        max_yrs = min_yrs + int(rng.integers(2, 6))
+        title = JOB_TITLES[rng.integers(len(JOB_TITLES))].format(pa=practice, spec=specs[0].title())
+        rows.append({
+            "FP ID": str(2_000_000 + i), "Firm Name": firm, "Job Location": f"{city}, {state}",
+            "Job Title": title,
+            "Job Description": _job_description(rng, firm, title.lower(), city, practice.lower(),
+                                                 " and ".join(specs), min_yrs, max_yrs),
+            "Practice Areas": practice, "Specialty": ", ".join(s.title() for s in specs),
+            "MinYrs": str(min_yrs), "MaxYrs": str(max_yrs), "Status": "Open", "Closed Date": "",
+        })
+    return pd.DataFrame(rows)
+
+
+def _firms(rng, firms):
+    rows = []
+    for i, name in enumerate(firms):
+        counts = rng.integers(0, 120, len(PRACTICE_AREAS)) * (rng.random(len(PRACTICE_AREAS)) < 0.7)
+        top = np.argsort(-counts, kind="stable")[:3]
+        partners, counsel, associates = (int(x) for x in rng.integers([20, 5, 30], [600, 200, 1200]))
+        offices = rng.choice(len(CITIES), int(rng.integers(1, 8)), replace=False)
+        rows.append({
+            "FP ID": str(900 + i), "Name": name,
+            "Website": "http://" + name.lower().replace(" llp", "").replace(" & ", "").replace(" ", "") + ".com",
+            "Partners": str(partners), "Counsel": str(counsel), "Associates": str(associates),
+            "Firm Office Locations": "; ".join(f"{CITIES[c][0]}, {CITIES[c][1]}" for c in offices),
+            **{pa: (str(c) if c else "") for pa, c in zip(PRACTICE_AREAS, counts)},
+            **{f"Practice Area Top {k + 1}": f"{PRACTICE_AREAS[t]} : {counts[t]}" for k, t in enumerate(top)},
+            "Total Attorneys": str(partners + counsel + associates),
+            "PPP": f"{int(rng.integers(500, 6000)) * 1000:,}",
+        })
+    return pd.DataFrame(rows)
+
+
+def _write_chunks(path, chunks):
+    rows = 0
+    for i, chunk in enumerate(chunks):
+        chunk.to_csv(path, mode="w" if i == 0 else "a", header=i == 0, index=False)
+        rows += len(chunk)
+    return rows
+
+
+def generate(out, attorneys, moves=None, jobs=400, firms=200, seed=7):
+    """Write the four CSV exports to out; returns {file: rows}."""
+    os.makedirs(out, exist_ok=True)
+    moves = attorneys // 5 if moves is None else moves
+    names = firm_names(firms, seed)
+    hiring_firms = names[:max(1, firms // 3)]  # the firms that hire, and so have a Hiring DNA
+    written = {}
+
+    rng = np.random.default_rng([seed, 2])
+    written["attorneys.csv"] = _write_chunks(
+        os.path.join(out, "attorneys.csv"),
+        (_attorney_chunk(rng, start, min(_CHUNK_ROWS, attorneys - start), names)
+         for start in range(0, attorneys, _CHUNK_ROWS)))
+
+    rng = np.random.default_rng([seed, 3])
+    written["hiring_history.csv"] = _write_chunks(
+        os.path.join(out, "hiring_history.csv"),
+        (_hiring_chunk(rng, min(_CHUNK_ROWS, moves - start), names, hiring_firms)
+         for start in range(0, moves, _CHUNK_ROWS)))
+
+    rng = np.random.default_rng([seed, 4])
+    written["jobs.csv"] = _write_chunks(os.path.join(out, "jobs.csv"), [_jobs(rng, jobs, hiring_firms)])
+    rng = np.random.default_rng([seed, 5])
+    written["firms.csv"] = _write_chunks(os.path.join(out, "firms.csv"), [_firms(rng, names)])
+    return written
+
+
+def _option(args, name, default):
+    return args[args.index(name) + 1] if name in args else default
+
+
+if __name__ == "__main__":
+    cmd = sys.argv[1] if len(sys.argv) > 1 else ""
+    args = sys.argv[2:]
+    if cmd == "generate" and "--out" in args and ("--scale" in args or "--attorneys" in args):
+        scale = _option(args, "--scale", None)
+        attorneys = SCALES[scale.lower()] if scale else int(_option(args, "--attorneys", 0))
+        moves = _option(args, "--moves", None)
+        out, seed = _option(args, "--out", None), int(_option(args, "--seed", 7))
+        t0 = time.perf_counter()
+        written = generate(out, attorneys, int(moves) if moves else None, int(_option(args, "--jobs", 400)),
+                           int(_option(args, "--firms", 200)), seed)
+        for name, rows in written.items():
+            print(f"  {name:20s} {rows:>10,d} rows  {os.path.getsize(os.path.join(out, name)) / 2**20:8.1f} MB")
+        print(f"Wrote {out} in {time.perf_counter() - t0:.1f}s (seed {seed})")
+    else:
+        print(__doc__)
+        sys.exit(2)
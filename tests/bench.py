@@ -0,0 +1,331 @@
+"""
+tests/bench.py — Timings for the optimized paths against what they replaced
+
+Each benchmark runs on the data in JAIDE_DATA_DIR (or data/); generate a
+large synthetic directory first (see synthetic_data.py). Correctness is
+covered by the tests next to this file; these only time.
+
+Usage:
+    JAIDE_DATA_DIR=/tmp/jaide-500k python -m tests.bench <name> [options]
+    python -m tests.bench            # lists the benchmarks
+
+    hiring_dna        per-firm vs grouped Hiring DNA (--scale N: history repeated N times, 10)
+    jd_matcher        JD parsing on 10–20 KB JDs, per-phrase vs automaton (--schools N extra aliases)
+    keyword_index     keyword counting and /api/search p50/p95, scan vs index
+    filter_index      SearchPlan filter phase, scan vs index
+    top_k             score + shortlist on broad JDs, full sort vs top-k
+    parallel_scoring  search and firm DNA scoring per core count (--cores 1,2,4,8)
+    practice_terms    practice-area counting, regex vs term matrix
+    firm_index        extract_firm_name on 5 KB JDs, scan vs index
+    dna_matrix        per-firm pandas vs matrix, and all firms in one pass
+    precompute        whole top-candidate run and first batch, per worker count (--workers 0,1,2)
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+from tests.support import load_app
+
+
+def _option(args, name, default):
+    return type(default)(args[args.index(name) + 1]) if name in args else default
+
+
+def _hiring_history():
+    import data_snapshot
+    df = data_snapshot.read_dataset("hiring_history")
+    if df is None:
+        raise SystemExit("No hiring history found in the data directory.")
+    return df
+
+
+def hiring_dna(args):
+    from hiring_dna import compute_all_hiring_dna
+    from tests.test_hiring_dna import per_firm_hiring_dna, scaled_history
+    base = _hiring_history()
+    for s in sorted({1, _option(args, "--scale", 10)}):
+        df = scaled_history(base, s)
+        t0 = time.perf_counter()
+        dna = compute_all_hiring_dna(df)
+        grouped = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        per_firm_hiring_dna(df)
+        per_firm = time.perf_counter() - t0
+        print(f"scale {s:>3}x: {len(df):>9,} rows, {len(dna):>6,} firms | "
+              f"per-firm {per_firm:8.2f}s | grouped {grouped:6.2f}s | {per_firm / grouped:6.1f}x")
+
+
+def jd_matcher(args, repeats=5):
+    from tests.test_jd_matcher import long_jds, parse, parse_per_phrase, use_synthetic_schools
+    n_schools = _option(args, "--schools", 0)
+    app = load_app()
+    if n_schools:
+        t0 = time.perf_counter()
+        use_synthetic_schools(app, n_schools)
+        print(f"built matcher with {n_schools:,} extra schools in {time.perf_counter() - t0:.2f}s")
+    matcher = app._JD_MATCHER
+    print(f"{len(matcher.patterns):,} phrases ({len(matcher.schools):,} school aliases), "
+          f"{len(matcher.automaton):,} automaton states")
+    for jd in long_jds():
+        timings = {}
+        for label, fn in (("per-phrase", parse_per_phrase), ("automaton", parse)):
+            times = []
+            for _ in range(repeats):
+                matcher._last = None
+                t0 = time.perf_counter()
+                fn(app, jd)
+                times.append((time.perf_counter() - t0) * 1000)
+            timings[label] = min(times)
+        print(f"  {len(jd) / 1000:4.1f} KB JD: per-phrase {timings['per-phrase']:8.1f} ms   "
+              f"automaton {timings['automaton']:6.1f} ms")
+
+
+def keyword_index(args, repeats=5):
+    from tests.test_keyword_index import SEARCH_JDS
+    app = load_app()
+    client = app.app.test_client()
+    with client.session_transaction() as sess:
+        sess["user_id"] = 1
+    df = app.ATTORNEYS_DF
+    index = app.ATTORNEY_KEYWORD_INDEX
+    print(f"{len(df):,} attorneys, index {len(index.bitmaps)} phrases, {index.nbytes / 2**20:.1f} MB")
+
+    # Keyword counting alone, over every row
+    texts = app._attorney_keyword_text(df)
+    positions = np.arange(len(df))
+    for jd in SEARCH_JDS:
+        kws = [k.lower() for k in app.extract_keywords(jd)]
+        t0 = time.perf_counter()
+        for kw in kws:
+            texts.str.contains(kw, regex=False, na=False)
+        t1 = time.perf_counter()
+        index.count(kws, positions)
+        t2 = time.perf_counter()
+        print(f"  {len(kws):2d} keywords x {len(df):,} rows: scan {(t1 - t0) * 1000:7.0f} ms   "
+              f"index {(t2 - t1) * 1000:5.0f} ms")
+
+    # Whole requests, alternating scan/index so both see the same conditions
+    times = {"scan": [], "index": []}
+    try:
+        for _ in range(repeats):
+            for jd in SEARCH_JDS:
+                for label in times:
+                    app.ATTORNEY_KEYWORD_INDEX = index if label == "index" else None
+                    t0 = time.perf_counter()
+                    client.post("/api/search", json={"jd": jd, "use_ai": False})
+                    times[label].append((time.perf_counter() - t0) * 1000)
+    finally:
+        app.ATTORNEY_KEYWORD_INDEX = index
+    for label, values in times.items():
+        p50, p95 = np.percentile(values, [50, 95])
+        print(f"  {label:<6} /api/search p50 {p50:7.0f} ms   p95 {p95:7.0f} ms   ({len(values)} requests)")
+
+
+def filter_index(args, repeats=3):
+    from tests.test_filter_index import fixture_jds, run_plans
+    app = load_app()
+    index = app.ATTORNEY_FILTER_INDEX
+    print(f"{len(app.ATTORNEYS_DF):,} attorneys, filter index {index.nbytes / 2**20:.1f} MB")
+    jds = fixture_jds(app)
+    try:
+        for label, idx in (("scan", None), ("index", index)):
+            app.ATTORNEY_FILTER_INDEX = idx
+            times = []
+            for _ in range(repeats):
+                times.extend(ms for _, _, ms in run_plans(app, jds))
+            p50, p95, top = np.percentile(times, [50, 95, 100])
+            print(f"  {label:<6} filter phase p50 {p50:8.2f} ms   p95 {p95:8.2f} ms   max {top:8.2f} ms")
+    finally:
+        app.ATTORNEY_FILTER_INDEX = index
+
+
+def top_k(args, repeats=5, k=25):
+    from tests.test_top_k import BROAD_JDS, plan_inputs
+    app = load_app()
+    frame = app.ATTORNEYS_DF
+    print(f"{len(frame):,} attorneys, shortlist of {k}")
+    for jd in BROAD_JDS:
+        positions, keywords, patterns, index = plan_inputs(app, jd)
+        timings = {}
+        for label, limit in (("full sort", None), ("top-k", k)):
+            times = []
+            for _ in range(repeats):
+                t0 = time.perf_counter()
+                scored, matched = app.score_attorneys_vectorized(frame, keywords, patterns, keyword_index=index,
+                                                                 positions=positions, limit=limit)
+                scored.head(k).to_dict("records")
+                times.append((time.perf_counter() - t0) * 1000)
+            timings[label] = np.median(times)
+        print(f"  {len(positions):7,d} filtered, {matched:7,d} matched: full sort {timings['full sort']:7.0f} ms   "
+              f"top-k {timings['top-k']:6.0f} ms")
+
+
+def parallel_scoring(args, repeats=3):
+    from tests.test_parallel_scoring import SEARCH_JDS, engine, largest_firms
+    cores = [int(c) for c in _option(args, "--cores", "1,2,4,8").split(",")]
+    app = load_app()
+    frame = app.ATTORNEYS_DF
+    print(f"{len(frame):,} attorneys, {os.cpu_count()} CPUs visible "
+          f"({len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else '?'} usable)")
+    plans = []
+    for jd in SEARCH_JDS:
+        plan = app.SearchPlan(jd)
+        plan.filter()
+        plans.append(plan)
+    firms = largest_firms(app)
+    live = app.SCORING_ENGINE
+    try:
+        for n in cores:
+            app.SCORING_ENGINE = pool = engine(app, n if n > 1 else 0)
+            pool.start()
+            try:
+                plans[0].score()
+                app.score_candidates_for_firm(firms[0])  # publish the table
+                search_ms, firm_ms = [], []
+                for _ in range(repeats):
+                    for plan in plans:
+                        t0 = time.perf_counter()
+                        plan.score()
+                        search_ms.append((time.perf_counter() - t0) * 1000)
+                    for firm in firms:
+                        t0 = time.perf_counter()
+                        app.score_candidates_for_firm(firm)
+                        firm_ms.append((time.perf_counter() - t0) * 1000)
+            finally:
+                pool.shutdown()
+            print(f"  {n} core{'s' if n > 1 else ' '}: search score p50 {np.median(search_ms):7.0f} ms   "
+                  f"firm DNA score p50 {np.median(firm_ms):7.0f} ms")
+    finally:
+        app.SCORING_ENGINE = live
+
+
+def practice_terms(args, repeats=5):
+    from tests.test_practice_terms import jd_terms, regex_counts
+    app = load_app()
+    df = app.ATTORNEYS_DF
+    matrix = app._practice_terms_for(df)
+    print(f"{len(df):,} attorneys, {len(matrix.vocabulary):,} tokens, {len(matrix.rows):,} entries, "
+          f"{matrix.nbytes / 2**20:.1f} MB")
+    texts = app._attorney_spec_text(df)
+    positions = np.arange(len(df))
+    for jd in app.JOBS_DF["Job Description"].iloc[::max(1, len(app.JOBS_DF) // 6)]:
+        _, terms = jd_terms(app, jd)
+        regex_ms, matrix_ms = [], []
+        for _ in range(repeats):
+            t0 = time.perf_counter()
+            regex_counts(texts, terms)
+            t1 = time.perf_counter()
+            matrix.count(terms, positions)
+            regex_ms.append((t1 - t0) * 1000)
+            matrix_ms.append((time.perf_counter() - t1) * 1000)
+        print(f"  {len(terms):2d} terms x {len(df):,} rows: regex {np.median(regex_ms):7.0f} ms   "
+              f"matrix {np.median(matrix_ms):6.1f} ms")
+
+
+def _long_jds(app, size=5000, n=20):
+    """n JDs of about size bytes, each built from consecutive job descriptions."""
+    texts = [t for t in app.JOBS_DF["Job Description"] if t.strip()]
+    jds, i = [], 0
+    while texts and len(jds) < n:
+        jd = ""
+        while len(jd.encode()) < size:
+            jd += texts[i % len(texts)] + "\n"
+            i += 1
+        jds.append(jd.encode()[:size].decode(errors="ignore"))
+    return jds
+
+
+def firm_index(args, repeats=3):
+    from tests.test_firm_index import ScanIndex, scan_fallback, windows
+    app = load_app()
+    index = app.FIRM_INDEX
+    scan = ScanIndex(index.firm_words)
+    jds = _long_jds(app)
+    print(f"{len(index):,} firms, {len(index.postings):,} words; {len(jds)} JDs of ~5 KB "
+          f"(~{np.mean([len(windows(jd)) for jd in jds]):,.0f} windows each)")
+    times = {"scan": [], "index": [], "index (memo warm)": []}
+    for _ in range(repeats):
+        for jd in jds:
+            t0 = time.perf_counter()
+            scan_fallback(app, scan, jd)
+            t1 = time.perf_counter()
+            index._memo.clear()
+            app._firm_window_fallback(jd)
+            t2 = time.perf_counter()
+            app._firm_window_fallback(jd)
+            t3 = time.perf_counter()
+            times["scan"].append((t1 - t0) * 1000)
+            times["index"].append((t2 - t1) * 1000)
+            times["index (memo warm)"].append((t3 - t2) * 1000)
+    for label, values in times.items():
+        p50, p95 = np.percentile(values, [50, 95])
+        print(f"  window fallback, {label:<18} p50 {p50:8.1f} ms   p95 {p95:8.1f} ms")
+    t0 = time.perf_counter()
+    for jd in jds:
+        app.extract_firm_name(jd)
+    print(f"  extract_firm_name (whole)          {(time.perf_counter() - t0) * 1000 / len(jds):8.1f} ms per JD")
+
+
+def dna_matrix(args, sample=10):
+    from tests.test_dna_matrix import firm_weights, pandas_top
+    app = load_app()
+    df = app.ATTORNEYS_DF
+    matrix = app._dna_matrix_for(df)
+    firms, weights = firm_weights(app)
+    limit = app.TOP_CANDIDATES_LIMIT
+    print(f"{len(df):,} attorneys, {len(firms)} firms, matrix {matrix.nbytes / 2**20:.1f} MB")
+    pandas_ms, matrix_ms = [], []
+    for firm, w in list(zip(firms, weights))[:sample]:
+        t0 = time.perf_counter()
+        pandas_top(app, firm, limit)
+        t1 = time.perf_counter()
+        matrix.top_rows([w], limit)
+        pandas_ms.append((t1 - t0) * 1000)
+        matrix_ms.append((time.perf_counter() - t1) * 1000)
+    print(f"  one firm:   pandas p50 {np.median(pandas_ms):8.0f} ms   matrix p50 {np.median(matrix_ms):7.0f} ms")
+    t0 = time.perf_counter()
+    matrix.top_rows(weights, limit)
+    batched = time.perf_counter() - t0
+    print(f"  all {len(firms)} firms: pandas ~{np.median(pandas_ms) * len(firms) / 1000:6.1f} s (est.)   "
+          f"batched {batched:6.2f} s")
+
+
+def precompute(args):
+    from tests.test_precompute import fresh_run, scheduler
+    counts = [int(n) for n in _option(args, "--workers", "0,1,2").split(",")]
+    app = load_app()
+    live, cache = app.PRECOMPUTE, app._top_candidates_cache
+    print(f"{len(app.ATTORNEYS_DF):,} attorneys, {len(app.HIRING_DNA)} firms")
+    try:
+        for n in counts:
+            sched = scheduler(app, n)
+            seconds, first = fresh_run(app, sched)
+            sched.shutdown()
+            print(f"  {n} workers: all firms {seconds:6.2f} s   first batch {first or 0:6.2f} s")
+    finally:
+        app.PRECOMPUTE, app._top_candidates_cache = live, cache
+
+
+BENCHES = {
+    "hiring_dna": hiring_dna,
+    "jd_matcher": jd_matcher,
+    "keyword_index": keyword_index,
+    "filter_index": filter_index,
+    "top_k": top_k,
+    "parallel_scoring": parallel_scoring,
+    "practice_terms": practice_terms,
+    "firm_index": firm_index,
+    "dna_matrix": dna_matrix,
+    "precompute": precompute,
+}
+
+
+if __name__ == "__main__":
+    name = sys.argv[1] if len(sys.argv) > 1 else ""
+    if name not in BENCHES:
+        print(__doc__)
+        sys.exit(2)
+    BENCHES[name](sys.argv[2:])
@@ -0,0 +1,44 @@
+"""
+Shared test setup: a small synthetic data directory (synthetic_data.py)
+that every test reads through JAIDE_DATA_DIR. Set JAIDE_DATA_DIR yourself
+to run the suite against other data instead.
+"""
+
+import os
+import shutil
+import tempfile
+
+import pytest
+
+_generated = []
+
+
+def pytest_configure(config):
+    # Before any test module imports data_snapshot, which reads JAIDE_DATA_DIR once
+    if os.environ.get("JAIDE_DATA_DIR"):
+        return
+    import synthetic_data
+    data_dir = tempfile.mkdtemp(prefix="jaide-tests-")
+    synthetic_data.generate(data_dir, attorneys=3000, jobs=40, firms=60)
+    os.environ["JAIDE_DATA_DIR"] = data_dir
+    _generated.append(data_dir)
+
+
+def pytest_unconfigure(config):
+    for data_dir in _generated:
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def hiring_history():
+    import data_snapshot
+    df = data_snapshot.read_dataset("hiring_history")
+    if df is None:
+        pytest.skip("no hiring history in JAIDE_DATA_DIR")
+    return df
+
+
+@pytest.fixture(scope="session")
+def app():
+    from tests.support import load_app
+    return load_app()
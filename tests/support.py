@@ -0,0 +1,13 @@
+"""
+Helpers shared by the tests and tests/bench.py.
+"""
+
+import os
+
+
+def load_app():
+    """Import app with every startup stage run in this thread (no background work)."""
+    os.environ["JAIDE_PRELOAD"] = "1"
+    os.environ.pop("ANTHROPIC_API_KEY", None)  # Quick Match only
+    import app
+    return app
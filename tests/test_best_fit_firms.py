@@ -0,0 +1,53 @@
+"""
+Best-fit firms: one attorney against every firm's Hiring DNA, against the
+pandas path per firm and the firms' own top candidates.
+"""
+
+import numpy as np
+
+
+def test_scores_match_pandas(app):
+    df, hiring_dna = app.ATTORNEYS_DF, app.HIRING_DNA
+    firms = list(hiring_dna)
+    for position in np.random.default_rng(1).choice(len(df), 5, replace=False):
+        row = df.iloc[[position]].reset_index(drop=True)
+        expected = {f: int(app._firm_dna_components(hiring_dna[f], f, row)["total"][0]) for f in firms}
+        got = app.best_fit_firms(df, hiring_dna, int(position), limit=len(firms))
+        order = sorted((-score, firms.index(f), f) for f, score in expected.items() if score > 0)
+        assert [g["firm_name"] for g in got] == [f for _, _, f in order]
+        assert all(g["match_score"] == expected[g["firm_name"]] for g in got)
+
+
+def test_consistent_with_top_candidates(app):
+    df, hiring_dna = app.ATTORNEYS_DF, app.HIRING_DNA
+    checked = 0
+    for firm in list(hiring_dna)[:5]:
+        for candidate in app.score_candidates_for_firm(firm)[:3]:
+            position = int(np.flatnonzero((df["id"] == candidate["id"]).to_numpy())[0])
+            fit = {f["firm_name"]: f for f in app.best_fit_firms(df, hiring_dna, position, limit=len(hiring_dna))}
+            assert fit[firm]["match_score"] == candidate["match_score"]
+            assert fit[firm]["match_reasons"] == candidate["match_reasons"]
+            assert fit[firm]["score_breakdown"] == candidate["score_breakdown"]
+            checked += 1
+    assert checked
+
+
+def test_scores_the_captured_frame(app, monkeypatch):
+    """A swap after the caller captured the frame does not change what is scored."""
+    df, hiring_dna = app.ATTORNEYS_DF, app.HIRING_DNA
+    expected = app.best_fit_firms(df, hiring_dna, 7)
+    monkeypatch.setattr(app, "ATTORNEYS_DF", df.iloc[::-1].reset_index(drop=True))
+    monkeypatch.setattr(app, "ATTORNEY_DNA_MATRIX", None)
+    monkeypatch.setattr(app, "HIRING_DNA", {})
+    assert app.best_fit_firms(df, hiring_dna, 7) == expected
+
+
+def test_endpoint(app):
+    client = app.app.test_client()
+    with client.session_transaction() as sess:
+        sess["user_id"] = 1
+    attorney_id = app.ATTORNEYS_DF["id"].iloc[0]
+    body = client.get(f"/api/attorneys/{attorney_id}/best-fit-firms?limit=5").get_json()
+    assert body["attorney_id"] == str(attorney_id) and len(body["firms"]) <= 5
+    assert body["firms_scored"] == len(app.HIRING_DNA)
+    assert client.get("/api/attorneys/nope/best-fit-firms").status_code == 404
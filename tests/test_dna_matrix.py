@@ -0,0 +1,51 @@
+"""
+DNA matrix: components, top rows and candidates against the pandas path
+(_firm_dna_components), for every firm.
+"""
+
+import numpy as np
+
+
+def pandas_top(app, firm, limit):
+    """(top row positions, their components) for firm from the pandas path."""
+    dna = app.HIRING_DNA[firm]
+    return app._firm_top_rows(app._firm_dna_components(dna, firm, app.ATTORNEYS_DF), limit)
+
+
+def firm_weights(app):
+    firms = list(app.HIRING_DNA)
+    return firms, [app._firm_dna_weights(app.HIRING_DNA[f], f) for f in firms]
+
+
+def test_matrix_covers_every_firm(app):
+    matrix = app._dna_matrix_for(app.ATTORNEYS_DF)
+    _, weights = firm_weights(app)
+    assert weights and all(matrix.covers(w) for w in weights)
+
+
+def test_components_match_pandas(app):
+    df = app.ATTORNEYS_DF
+    matrix = app._dna_matrix_for(df)
+    rows = np.arange(len(df))
+    for firm, w in zip(*firm_weights(app)):
+        expected = app._firm_dna_components(app.HIRING_DNA[firm], firm, df)
+        got = matrix.components(matrix.tables([w]), rows)
+        bad = [name for name in expected if not np.array_equal(expected[name], got[name][:, 0])]
+        assert not bad, firm
+
+
+def test_top_rows_match_pandas(app):
+    matrix = app._dna_matrix_for(app.ATTORNEYS_DF)
+    firms, weights = firm_weights(app)
+    limit = app.TOP_CANDIDATES_LIMIT
+    for firm, (positions, parts) in zip(firms, matrix.top_rows(weights, limit)):
+        top, expected = pandas_top(app, firm, limit)
+        assert np.array_equal(positions, top), firm
+        assert all(np.array_equal(parts[name], expected[name]) for name in expected), firm
+
+
+def test_candidates_match_pandas(app):
+    limit = app.TOP_CANDIDATES_LIMIT
+    for firm in app.HIRING_DNA:
+        expected = app._firm_candidates(app.HIRING_DNA[firm], app.ATTORNEYS_DF, *pandas_top(app, firm, limit))
+        assert app.score_candidates_for_firm(firm) == expected, firm
@@ -0,0 +1,49 @@
+"""
+Filter index: SearchPlan's filter phase with the index against the row scans.
+"""
+
+import numpy as np
+
+
+def fixture_jds(app):
+    """JDs from the jobs export plus a few that hit every filter."""
+    jobs = app.JOBS_DF
+    jds = [jobs.iloc[i]["Job Description"] for i in range(0, len(jobs), max(1, len(jobs) // 40))]
+    return jds + [
+        "Kirkland & Ellis is seeking a fund formation associate with 3-5 years of experience in Boston. "
+        "Harvard preferred.",
+        "Litigation associate, class of 2018-2021, Chicago, securities litigation, trial, deposition, Columbia Law.",
+        "Partner, real estate and tax, New York and Los Angeles, Georgetown, 10+ years of experience.",
+        "Senior counsel, intellectual property / patent, San Francisco or Austin, Stanford or Berkeley.",
+    ]
+
+
+def run_plans(app, jds):
+    """(positions, excluded count, filter ms) per JD, with the app's current filter index."""
+    results = []
+    for jd in jds:
+        plan = app.SearchPlan(jd, skip_patterns=False)
+        plan.run(25)
+        filter_ms = sum(s["ms"] for s in plan.steps if s["step"] not in ("parse", "hiring_patterns", "score", "shortlist"))
+        results.append((plan.positions, plan.excluded_count, filter_ms))
+    return results
+
+
+def test_index_filters_match_scan(app, monkeypatch):
+    jds = fixture_jds(app)
+    indexed = run_plans(app, jds)
+    monkeypatch.setattr(app, "ATTORNEY_FILTER_INDEX", None)
+    scan = run_plans(app, jds)
+    assert sum(len(r[0]) for r in scan), "no JD keeps any row"
+    bad = [jd[:60] for jd, a, b in zip(jds, scan, indexed) if not np.array_equal(a[0], b[0]) or a[1] != b[1]]
+    assert not bad
+
+
+def test_loaded_artifact_filters_like_the_built_index(app, monkeypatch):
+    jds = fixture_jds(app)
+    built = run_plans(app, jds)
+    # Saved by the filter_index stage; this reads it back from disk
+    assert app.artifacts.read_header("filter_index") is not None
+    monkeypatch.setattr(app, "ATTORNEY_FILTER_INDEX", app._load_filter_index(app.ATTORNEYS_DF))
+    loaded = run_plans(app, jds)
+    assert all(np.array_equal(a[0], b[0]) and a[1] == b[1] for a, b in zip(built, loaded))
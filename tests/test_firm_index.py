@@ -0,0 +1,74 @@
+"""
+Firm index: postings + memo matching against a scan of every firm, and
+extract_firm_name() with either.
+"""
+
+from firm_index import THRESHOLD, FirmIndex, _score
+
+
+class ScanIndex(FirmIndex):
+    """The previous matcher: scores every firm, no postings or memo."""
+
+    def match(self, query_words):
+        if not query_words:
+            return None, 0
+        best_firm, best_score = None, 0
+        for firm, words in self.firm_words.items():
+            if not words:
+                continue
+            score = _score(query_words, words)
+            if score > best_score:
+                best_score, best_firm = score, firm
+        if best_score >= THRESHOLD:
+            return best_firm, best_score
+        return None, 0
+
+
+def windows(text):
+    words = text.split()
+    return [" ".join(words[i:i + size]) for size in range(1, 5) for i in range(len(words) - size + 1)]
+
+
+def scan_fallback(app, scan, text):
+    """extract_firm_name()'s window fallback as it was: tokenize each window, scan every firm."""
+    words = text.split()
+    best_match, best_score, best_pos = None, 0, len(words)
+    for size in range(1, 5):
+        for i in range(len(words) - size + 1):
+            window = " ".join(words[i:i + size])
+            firm, score = scan.match(app._firm_words(window))
+            if firm and (score > best_score or (score == best_score and i < best_pos)):
+                best_score, best_match, best_pos = score, window, i
+    return best_match if best_match and best_score >= THRESHOLD else ""
+
+
+def test_ties_go_to_the_first_firm():
+    firms = {"Ropes & Gray LLP": {"ropes", "gray"}, "Gray Ropes LLP": {"gray", "ropes"},
+             "Gray Plant Mooty": {"gray", "plant", "mooty"}}
+    index, scan = FirmIndex(firms), ScanIndex(firms)
+    for query in ({"ropes", "gray"}, {"gray"}, {"plant", "gray"}, {"mooty", "ropes", "gray"}, {"kirkland"}, set()):
+        assert index.match(query) == scan.match(query), query
+        assert index.match(query) == scan.match(query), query  # from the memo
+    assert index.match({"ropes", "gray"})[0] == "Ropes & Gray LLP"
+
+
+def test_index_matches_scan(app):
+    index = app.FIRM_INDEX
+    scan = ScanIndex(index.firm_words)
+    jds = list(app.JOBS_DF["Job Description"])
+    queries = [app._firm_words(w) for jd in jds[::max(1, len(jds) // 50)] for w in windows(jd)]
+    queries += [app._firm_words(f) for f in index.firm_words]
+    queries += [app._firm_words(" ".join(f.split()[:1])) for f in index.firm_words]
+    bad = [q for q in queries if index.match(q) != scan.match(q)]
+    assert not bad
+
+
+def test_extract_firm_name_unchanged(app, monkeypatch):
+    index = app.FIRM_INDEX
+    scan = ScanIndex(index.firm_words)
+    jds = list(app.JOBS_DF["Job Description"])
+    new = [(app.extract_firm_name(jd), app._firm_window_fallback(jd)) for jd in jds]
+    monkeypatch.setattr(app, "FIRM_INDEX", scan)
+    old = [(app.extract_firm_name(jd), scan_fallback(app, scan, jd)) for jd in jds]
+    assert any(firm for firm, _ in new), "no JD names a firm"
+    assert new == old
@@ -0,0 +1,106 @@
+"""
+Hiring DNA: the grouped engine (hiring_dna.compute_all_hiring_dna) against
+the per-firm reference it replaced, byte for byte.
+"""
+
+import json
+
+import pandas as pd
+import pytest
+
+from hiring_dna import compute_all_hiring_dna
+
+
+# ---------------------------------------------------------------------------
+# Reference implementation (per-firm filtering)
+# ---------------------------------------------------------------------------
+
+def per_firm_hiring_dna(hiring_df, min_hires=5):
+    """The original O(firms × rows) implementation: re-filters the history for each firm."""
+    if hiring_df.empty:
+        return {}
+    firm_counts = hiring_df["Firm"].value_counts()
+    eligible = firm_counts[firm_counts >= min_hires].index.tolist()
+    dna = {}
+    for firm_name in eligible:
+        fh = hiring_df[hiring_df["Firm"] == firm_name]
+        total = len(fh)
+        schools = fh["Law School"].value_counts().head(15)
+        feeder_schools = [{"school": s, "hires": int(c), "pct": round(c / total, 3)}
+                          for s, c in schools.items() if s]
+        lf_hires = fh[fh["Previous Entity Type"] == "Law Firm"]
+        firms_from = lf_hires["Moved From"].value_counts().head(15)
+        feeder_firms = [{"firm": f, "hires": int(c), "pct": round(c / len(lf_hires) if len(lf_hires) else 0, 3)}
+                        for f, c in firms_from.items() if f]
+        pa_series = fh["Practice Areas New"].str.split(",").explode().str.strip()
+        pa_series = pa_series[pa_series != ""]
+        practice_areas = [{"area": a, "hires": int(c), "pct": round(c / total, 3)}
+                          for a, c in pa_series.value_counts().items()]
+        sp_series = fh["Specialties New"].str.split(",").explode().str.strip()
+        sp_series = sp_series[sp_series != ""]
+        specialties = [{"specialty": s, "hires": int(c)} for s, c in sp_series.value_counts().head(20).items()]
+        cy = pd.to_numeric(fh["Class Year"], errors="coerce").dropna()
+        if len(cy) >= 3:
+            cy_range = {"min": int(cy.quantile(0.1)), "max": int(cy.quantile(0.9)),
+                        "median": int(cy.median())}
+        elif len(cy) > 0:
+            cy_range = {"min": int(cy.min()), "max": int(cy.max()), "median": int(cy.median())}
+        else:
+            cy_range = {"min": 2010, "max": 2024, "median": 2018}
+        loc_groups = fh.groupby(["City", "State"]).size().sort_values(ascending=False)
+        hiring_locations = [{"location": city, "state": state, "hires": int(cnt)}
+                            for (city, state), cnt in loc_groups.head(15).items() if city]
+        title_dist = fh["Title"].value_counts().to_dict()
+        title_distribution = {k: int(v) for k, v in title_dist.items() if k}
+        dna[firm_name] = {
+            "firm_name": firm_name,
+            "total_hires": total,
+            "feeder_schools": feeder_schools,
+            "feeder_firms": feeder_firms,
+            "practice_areas": practice_areas,
+            "specialties": specialties,
+            "class_year_range": cy_range,
+            "hiring_locations": hiring_locations,
+            "title_distribution": title_distribution,
+        }
+    return dna
+
+
+def scaled_history(base, scale):
+    """The hiring history repeated `scale` times. Odd copies get renamed firms,
+    so both the rows per firm and the number of firms grow."""
+    if scale <= 1:
+        return base
+    copies = []
+    for k in range(scale):
+        part = base.copy()
+        if k % 2:
+            part["Firm"] = part["Firm"].where(part["Firm"] == "", part["Firm"] + f" ({k})")
+        copies.append(part)
+    return pd.concat(copies, ignore_index=True)
+
+
+def _dump(dna):
+    return json.dumps(dna, default=str).encode()
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("scale", [1, 3])
+def test_grouped_matches_per_firm_byte_for_byte(hiring_history, scale):
+    df = scaled_history(hiring_history, scale)
+    expected = per_firm_hiring_dna(df)
+    assert expected, "no firm has enough hires to get a Hiring DNA"
+    assert _dump(compute_all_hiring_dna(df)) == _dump(expected)
+
+
+def test_min_hires(hiring_history):
+    dna = compute_all_hiring_dna(hiring_history, min_hires=40)
+    assert _dump(dna) == _dump(per_firm_hiring_dna(hiring_history, min_hires=40))
+    assert all(d["total_hires"] >= 40 for d in dna.values())
+
+
+def test_empty_history():
+    assert compute_all_hiring_dna(pd.DataFrame()) == {}
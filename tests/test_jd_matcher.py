@@ -0,0 +1,99 @@
+"""
+JD matcher: the parsers on one Aho-Corasick scan against the per-phrase
+searches they replaced.
+"""
+
+import re
+
+import pandas as pd
+import pytest
+
+PARAGRAPHS = [
+    "Our Boston office is seeking a fund formation associate (class of 2018-2021) to advise "
+    "private equity and venture capital sponsors on fund structuring, LPA negotiation, side "
+    "letters, carried interest and GP commitment arrangements. Admitted in Massachusetts.",
+    "The litigation group in New York, NY handles securities litigation, white collar and "
+    "government investigation matters, class action defense and appellate work; Harvard, "
+    "Columbia or NYU Law preferred. Candidates must be members of the New York bar.",
+    "Real estate partners in Chicago and Dallas, TX work on commercial real estate, leasing, "
+    "zoning and land use, REIT transactions, real estate finance and CMBS for developers "
+    "and lenders; joint venture and mortgage loan experience a plus.",
+    "Technology transactions in San Francisco, California: licensing, data privacy, "
+    "cybersecurity, GDPR and CCPA compliance, SaaS and cloud agreements, intellectual "
+    "property and patent prosecution for life sciences and medical device clients.",
+    "Tax, ERISA and executive compensation in Washington, DC: tax planning, partnership tax, "
+    "state and local tax, employee benefits and equity incentive plans. Georgetown, "
+    "Washington & Lee or University of Virginia graduates encouraged to apply.",
+    "Restructuring counsel in Houston and Denver, CO: chapter 11, bankruptcy, distressed "
+    "debt, creditor and debtor representation, project finance, oil and gas, renewable "
+    "energy and leveraged finance; M&A and capital markets experience valued.",
+]
+
+
+def long_jds(sizes=(10_000, 15_000, 20_000)):
+    """Long JDs of roughly the given sizes, built from varied paragraphs."""
+    jds = []
+    for k, size in enumerate(sizes):
+        parts, n = [], 0
+        while n < size:
+            para = PARAGRAPHS[(k + len(parts)) % len(PARAGRAPHS)]
+            parts.append(para)
+            n += len(para) + 2
+        jds.append("\n\n".join(parts))
+    return jds
+
+
+def parse(app, jd):
+    return (app.extract_location(jd), app.extract_practice_area(jd), app.extract_bar(jd),
+            app.extract_keywords(jd), app.extract_law_school(jd))
+
+
+def parse_per_phrase(app, jd):
+    """The parsers as they were before the matcher: one search per phrase."""
+    text_lower = jd.lower()
+    practice = [area for area, kws in app._PRACTICE_AREA_KEYWORDS.items() if any(k in text_lower for k in kws)]
+    bars = [state for state, kws in app._BAR_KEYWORDS.items() if any(k in text_lower for k in kws)]
+    keywords = [kw for kw in app.JD_KEYWORD_PHRASES if kw.lower() in text_lower]
+    school = ""
+    text_and = text_lower.replace("&", "and")
+    text_amp = re.sub(r'\band\b', '&', text_lower)
+    for alias in app._LAW_SCHOOL_SORTED_KEYS:
+        pattern = r'\b' + re.escape(alias) + r'\b'
+        if re.search(pattern, text_lower) or re.search(pattern, text_and) or re.search(pattern, text_amp):
+            school = app._LAW_SCHOOL_ALIASES[alias]
+            break
+    return app._extract_location_regex(jd), practice, bars, keywords, school
+
+
+def use_synthetic_schools(app, n_schools):
+    """Swap in the alias map of n_schools made-up school names (real data has thousands)."""
+    syllables = ["ash", "bel", "cor", "dun", "el", "fair", "glen", "har", "ing", "kel", "lor", "mar",
+                 "nor", "ox", "pem", "quin", "ros", "sal", "thorn", "val", "wes", "york"]
+    names = []
+    for i in range(n_schools):
+        a, b, c = syllables[i % 22], syllables[(i // 22) % 22], syllables[(i // 484) % 22]
+        name = f"{a}{b}{c}".title()
+        names.append([f"{name} University", f"{name} Law School", f"University of {name}",
+                      f"{name} College"][i % 4])
+    aliases = app._build_school_alias_map(pd.DataFrame({"lawSchool": names}))
+    aliases.update(app._LAW_SCHOOL_ALIASES)
+    sorted_keys = sorted(aliases, key=len, reverse=True)
+    app._LAW_SCHOOL_ALIASES, app._LAW_SCHOOL_SORTED_KEYS = aliases, sorted_keys
+    app._JD_MATCHER = app._build_jd_matcher(aliases, sorted_keys)
+
+
+EDGE_JDS = ["Boston, New York, NY", "Seattle, Washington", "washington and lee law or boston college & harvard",
+            "M&A (LPA) — Tax/ERISA", "İstanbul and Boston MA"]
+
+
+@pytest.mark.parametrize("jd", [*long_jds(), *PARAGRAPHS, *EDGE_JDS])
+def test_parse_matches_per_phrase(app, jd):
+    assert parse(app, jd) == parse_per_phrase(app, jd)
+
+
+def test_many_schools(app, monkeypatch):
+    for name in ("_LAW_SCHOOL_ALIASES", "_LAW_SCHOOL_SORTED_KEYS", "_JD_MATCHER"):
+        monkeypatch.setattr(app, name, getattr(app, name))
+    use_synthetic_schools(app, 600)
+    for jd in [*PARAGRAPHS, *EDGE_JDS, "Graduates of the University of Ashbelash preferred"]:
+        assert parse(app, jd) == parse_per_phrase(app, jd)
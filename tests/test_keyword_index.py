@@ -0,0 +1,63 @@
+"""
+Keyword index: phrase bitmaps against str.contains, and keyword_score with
+and without the index.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import keyword_index
+
+SEARCH_JDS = [
+    "Litigation associate, class of 2016-2020, New York. Securities litigation, white collar, "
+    "internal investigations, SEC enforcement. Harvard or Columbia preferred.",
+    "Fund formation associate (3-6 years) for our Boston office: private equity and venture "
+    "capital funds, LPA negotiation, side letters, carried interest, GP commitment.",
+    "Real estate partner in Chicago with commercial real estate, leasing, zoning, REIT and "
+    "real estate finance experience; joint venture and mortgage loan work a plus.",
+    "M&A associate, San Francisco, technology transactions, licensing, data privacy, "
+    "cybersecurity, venture capital financings, IPO and capital markets.",
+    "Tax associate, Washington DC, class of 2018-2021: tax planning, partnership tax, "
+    "executive compensation, employee benefits, ERISA, fund structuring.",
+    "Bankruptcy and restructuring counsel, Houston or Dallas, energy, project finance, "
+    "credit facility, leveraged finance, distressed M&A.",
+]
+
+NO_PATTERNS = {"matched_firm": None, "feeder_firms": [], "feeder_schools": [], "top_specialties": []}
+
+
+def test_phrase_rows_skip_row_boundaries():
+    texts = pd.Series(["tax law", "ip", "tax", "", "private equity tax"], dtype="string[pyarrow]")
+    for phrase in ("tax", "ip", "x l", "lawip", "ipt", "equity tax", "missing"):
+        expected = texts.str.contains(phrase, regex=False).to_numpy(dtype=bool)
+        assert np.array_equal(keyword_index.build(texts, [phrase]).rows(phrase), expected), phrase
+
+
+def test_bitmaps_match_str_contains(app):
+    df = app.ATTORNEYS_DF
+    index = app._keyword_index_for(df)
+    texts = app._attorney_keyword_text(df)
+    bad = [p for p in index.bitmaps
+           if not np.array_equal(index.rows(p), texts.str.contains(p, regex=False, na=False).to_numpy())]
+    assert not bad
+
+
+@pytest.mark.parametrize("jd", SEARCH_JDS)
+def test_keyword_score_unchanged(app, jd):
+    df = app.ATTORNEYS_DF
+    keywords = app.extract_keywords(jd)
+    with_index, matched = app.score_attorneys_vectorized(df, keywords, NO_PATTERNS,
+                                                         keyword_index=app._keyword_index_for(df))
+    without, matched_scan = app.score_attorneys_vectorized(df, keywords, NO_PATTERNS)
+    assert matched == matched_scan
+    pd.testing.assert_frame_equal(with_index, without)
+
+
+@pytest.mark.parametrize("indexed", [True, False])
+def test_empty_pool(app, indexed):
+    df = app.ATTORNEYS_DF
+    index = app._keyword_index_for(df) if indexed else None
+    scored, matched = app.score_attorneys_vectorized(df, app.extract_keywords(SEARCH_JDS[0]), NO_PATTERNS,
+                                                     keyword_index=index, positions=[])
+    assert matched == 0 and scored.empty
@@ -0,0 +1,63 @@
+"""
+Parallel scoring: search and firm DNA scores on a worker pool against the
+in-process ones.
+"""
+
+import numpy as np
+
+SEARCH_JDS = [
+    "Experienced lawyer: litigation, corporate, tax, intellectual property, employment, "
+    "bankruptcy, antitrust.",
+    "Corporate associate — M&A, private equity, capital markets, securities, venture capital, "
+    "joint ventures and general corporate governance.",
+    "Litigation associate, class of 2016-2020, New York. Securities litigation, white collar, "
+    "internal investigations, SEC enforcement.",
+]
+
+
+def engine(app, workers, min_rows=0):
+    # The kernels are registered with the app's import of parallel_scoring
+    return app.parallel_scoring.ScoringEngine(workers, min_rows)
+
+
+def largest_firms(app, n=5):
+    """The firms with the most hires (largest DNA)."""
+    return sorted(app.HIRING_DNA, key=lambda f: -app.HIRING_DNA[f].get("total_hires", 0))[:n]
+
+
+def run_all(app):
+    """Search matches and shortlists for SEARCH_JDS, then the largest firms' top candidates."""
+    searches = []
+    for jd in SEARCH_JDS:
+        plan = app.SearchPlan(jd)
+        scored = plan.run(25)
+        searches.append((plan.matched, plan.match_scores, [e["id"] for e in scored]))
+    return searches, [app.score_candidates_for_firm(firm) for firm in largest_firms(app)]
+
+
+def test_parallel_matches_in_process(app, monkeypatch):
+    monkeypatch.setattr(app, "SCORING_ENGINE", engine(app, 0))
+    expected_searches, expected_firms = run_all(app)
+    pool = engine(app, 2)
+    pool.start()
+    monkeypatch.setattr(app, "SCORING_ENGINE", pool)
+    try:
+        searches, firms = run_all(app)
+        assert pool.stats()["shared_mb"]  # scored on the pool
+    finally:
+        pool.shutdown()
+    for (matched, scores, ids), (exp_matched, exp_scores, exp_ids) in zip(searches, expected_searches):
+        assert np.array_equal(matched, exp_matched)
+        assert ids == exp_ids
+        assert all(np.array_equal(scores[k], exp_scores[k]) for k in exp_scores)
+    assert firms == expected_firms
+
+
+def test_scores_in_process_until_started(app):
+    pool = engine(app, 2)
+    assert not pool.use_for(10**9)
+    pool.start()
+    try:
+        assert pool.use_for(10**9) and pool.stats()["pool_started"]
+    finally:
+        pool.shutdown()
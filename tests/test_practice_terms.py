@@ -0,0 +1,70 @@
+"""
+Practice-term matrix: token columns and counts against the practice-area
+regex, and practice_score with and without the matrix.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from practice_terms import build, term_pattern
+
+# Delimiter edge cases the regex and the tokenizer must agree on
+EDGE_TEXTS = [
+    "securities litigation", "securities,litigation", "securities/litigation;tax", "  securities  ",
+    "securities\xa0litigation", "securities\u2003litigation", "securities\x1clitigation",
+    "securities\nlitigation\n", "tax\tlitigation\x0bip", "securities-litigation", "m&a; private equity",
+    "ip/ patent ", "", "tax", "(tax)", "tax.", ",,,", "/", "litigation\u200blitigation",
+]
+EDGE_TERMS = ["securities", "litigation", "tax", "m&a", "ip", "patent", "private", "(tax)", "tax.",
+              "securities-litigation", "securities,litigation", "ip/", "a b", ""]
+
+
+def regex_counts(texts, terms):
+    counts = np.zeros(len(texts), dtype=np.int64)
+    for term in terms:
+        counts += texts.str.contains(term_pattern(term), regex=True, na=False).to_numpy(dtype=bool)
+    return counts
+
+
+def jd_terms(app, jd):
+    """The SearchPlan for jd and the practice terms its keywords and areas split into."""
+    plan = app.SearchPlan(jd)
+    terms = set()
+    for phrase in [*plan.keywords, *plan.practice_areas]:
+        terms.update(phrase.lower().split())
+    return plan, sorted(terms)
+
+
+@pytest.mark.parametrize("term", EDGE_TERMS)
+def test_edge_cases_match_regex(term):
+    texts = pd.Series(EDGE_TEXTS, dtype="string[pyarrow]")
+    counts, missing = build(texts).count([term], np.arange(len(texts)))
+    assert np.array_equal(counts + regex_counts(texts, missing), regex_counts(texts, [term]))
+
+
+def test_columns_match_regex(app):
+    df = app.ATTORNEYS_DF
+    matrix = app._practice_terms_for(df)
+    texts = app._attorney_spec_text(df)
+    rng = np.random.default_rng(5)
+    vocab = list(matrix.vocabulary)
+    terms = [vocab[i] for i in rng.choice(len(vocab), min(400, len(vocab)), replace=False)]
+    terms += sorted({w for name in app._PRACTICE_AREA_KEYWORDS for w in name.lower().split()})
+    bad = [t for t in terms if not np.array_equal(matrix.column(t), np.flatnonzero(regex_counts(texts, [t])))]
+    assert not bad
+
+
+def test_practice_score_unchanged(app):
+    df = app.ATTORNEYS_DF
+    matrix = app._practice_terms_for(df)
+    for jd in app.JOBS_DF["Job Description"].iloc[::max(1, len(app.JOBS_DF) // 20)]:
+        plan, _ = jd_terms(app, jd)
+        plan.filter()
+        args = (df, plan.keywords, dict(plan.patterns, _practice_areas=plan.practice_areas))
+        with_matrix, matched = app.score_attorneys_vectorized(*args, keyword_index=plan.keyword_index,
+                                                              positions=plan.positions, term_matrix=matrix)
+        without, matched_scan = app.score_attorneys_vectorized(*args, keyword_index=plan.keyword_index,
+                                                               positions=plan.positions)
+        assert matched == matched_scan
+        pd.testing.assert_frame_equal(with_matrix, without)
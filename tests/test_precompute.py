@@ -0,0 +1,152 @@
+"""
+Top-candidate precompute: the top_candidates artifact and the scheduler
+fill the cache with exactly what score_candidates_for_firm() returns, in
+priority order; the pool only scores the dataset version it was forked
+with, and the scheduler holds off while requests are in flight in any
+worker.
+"""
+
+import multiprocessing
+import time
+
+import pytest
+
+
+def scheduler(app, workers, **kwargs):
+    """A scheduler whose pool (if any) is forked now, for the app's current dataset version."""
+    # The batch task is registered with the app's import of precompute
+    sched = app.precompute.Scheduler(workers, **kwargs)
+    sched.fork_pool(app.DATASET_VERSION)
+    return sched
+
+
+def fresh_run(app, sched):
+    """Empty the top-candidate cache and precompute every firm with sched.
+
+    Returns (seconds, seconds to the first batch); the caller restores the
+    app's cache and PRECOMPUTE.
+    """
+    app._top_candidates_cache = {}
+    app.PRECOMPUTE = sched
+    t0 = time.perf_counter()
+    thread = app._precompute_top_candidates()
+    first = None
+    while thread.is_alive():
+        if first is None and sched.stats()["done"]:
+            first = time.perf_counter() - t0
+        time.sleep(0.005)
+    return time.perf_counter() - t0, first
+
+
+@pytest.fixture
+def isolated(app, monkeypatch):
+    monkeypatch.setattr(app, "_top_candidates_cache", {})
+    monkeypatch.setattr(app, "PRECOMPUTE", app.PRECOMPUTE)
+    return app
+
+
+def test_order_covers_every_firm(app):
+    assert sorted(app._precompute_order()) == sorted(app.HIRING_DNA)
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_cache_matches_scoring(isolated, workers):
+    app = isolated
+    sched = scheduler(app, workers, batch_size=7)
+    try:
+        fresh_run(app, sched)
+    finally:
+        sched.shutdown()
+    assert sched.stats()["state"] == "done"
+    cache = dict(app._top_candidates_cache)
+    app._top_candidates_cache = {}
+    assert sorted(cache) == sorted(app.HIRING_DNA)
+    assert all(cache[f] == app.score_candidates_for_firm(f) for f in app.HIRING_DNA)
+
+
+def test_waits_while_requests_are_in_flight(isolated):
+    app = isolated
+    sched = scheduler(app, 0, batch_size=1, max_active=1)
+    app.PRECOMPUTE = sched
+    try:
+        sched.request_started()
+        thread = app._precompute_top_candidates()
+        time.sleep(0.5)
+        held = sched.stats()
+        sched.request_finished()
+        thread.join(60)
+    finally:
+        sched.shutdown()
+    assert held["state"] == "waiting (load)" and held["done"] == 0
+    assert sched.stats()["done"] == len(app.HIRING_DNA)
+
+
+def test_counts_only_authenticated_api_requests(app):
+    counted = {}
+    for path, logged_in in [("/api/firms", True), ("/api/firms", False), ("/healthz", True),
+                            ("/readyz", True), ("/static/app.js", True), ("/", True)]:
+        with app.app.test_request_context(path):
+            if logged_in:
+                app.session["user_id"] = 1
+            counted[path, logged_in] = app._counts_as_load()
+    assert [key for key, value in counted.items() if value] == [("/api/firms", True)]
+
+
+def test_threshold_defaults_to_server_workers(app, monkeypatch):
+    monkeypatch.delenv("JAIDE_PRECOMPUTE_MAX_ACTIVE", raising=False)
+    assert app.precompute.from_env(server_workers=4).max_active == 4
+    assert app.precompute.from_env().max_active == 1
+
+
+def test_counts_requests_in_forked_processes(isolated):
+    app = isolated
+    sched = scheduler(app, 0, max_active=1)
+    ctx = multiprocessing.get_context("fork")
+    started, done = ctx.Event(), ctx.Event()
+
+    def worker():
+        sched.request_started()
+        started.set()
+        done.wait(10)  # exits mid-request
+
+    child = ctx.Process(target=worker)
+    child.start()
+    try:
+        assert started.wait(10)
+        assert sched.stats()["active_requests"] == 1 and sched._busy()
+        sched.request_started()
+        assert sched.stats()["active_requests"] == 2
+        sched.request_finished()
+    finally:
+        done.set()
+        child.join(10)
+    assert sched.stats()["active_requests"] == 0 and not sched._busy()
+
+
+def test_pool_only_scores_its_dataset_version(isolated, monkeypatch):
+    app = isolated
+    sched = scheduler(app, 2, batch_size=7)
+    calls = []
+    task = app.precompute._TASK["fn"]
+    # Seen on the scheduler thread only: the pool was forked with the plain task
+    monkeypatch.setitem(app.precompute._TASK, "fn", lambda version, firms: calls.append(firms) or task(version, firms))
+    try:
+        fresh_run(app, sched)
+        assert not calls and sorted(app._top_candidates_cache) == sorted(app.HIRING_DNA)
+        monkeypatch.setattr(app, "DATASET_VERSION", app.DATASET_VERSION + 1)
+        fresh_run(app, sched)
+    finally:
+        sched.shutdown()
+    assert sum(len(firms) for firms in calls) == len(app.HIRING_DNA)
+    assert sched.stats()["state"] == "done"
+
+
+def test_artifact_matches_scoring(app):
+    frame, hiring_dna = app.ATTORNEYS_DF, app.HIRING_DNA
+    # Written by the top_candidates stage (JAIDE_PRELOAD=1 builds it)
+    loaded = app._load_top_candidates(frame, hiring_dna, build=False)
+    assert sorted(loaded) == sorted(hiring_dna)
+    assert all(loaded[f] == app.score_candidates_for_firm(f) for f in hiring_dna)
+    # Other inputs: a server does not score them at startup
+    fewer = dict(list(hiring_dna.items())[1:])
+    assert app._load_top_candidates(frame, fewer, build=False) == {}
@@ -0,0 +1,106 @@
+"""
+Staged startup: preload() runs the leading shared stages and stops at a
+deferred one, leaving it and the rest to start(); a 503 tells loading
+stages (retry) from failed ones (no retry); a stage that failed at boot
+recovers once a hot reload swaps its data in.
+"""
+
+import importlib.util
+import os
+
+import pytest
+from flask import Flask
+
+
+class Stale(Exception):
+    pass
+
+
+@pytest.fixture
+def startup():
+    """A private copy of startup.py, so registered stages do not touch the app's."""
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "startup.py")
+    spec = importlib.util.spec_from_file_location("startup_under_test", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def register(startup, ran, name, shared=True, fail=None):
+    def fn():
+        if fail is not None:
+            raise fail
+        ran.append(name)
+    startup.stage(name, shared=shared)(fn)
+
+
+def test_preload_runs_leading_shared_stages(startup):
+    ran = []
+    register(startup, ran, "frames")
+    register(startup, ran, "index")
+    register(startup, ran, "derived", shared=False)
+    assert startup.preload(lambda: True) == ["frames", "index"]
+    assert ran == ["frames", "index"]
+    startup.run_all()
+    assert ran == ["frames", "index", "derived"] and startup.is_ready()
+
+
+def test_preload_defers_a_stale_stage(startup):
+    ran = []
+    register(startup, ran, "frames")
+    register(startup, ran, "index", fail=Stale("index artifact stale"))
+    register(startup, ran, "filters")
+    assert startup.preload(lambda: True, defer=Stale) == ["frames"]
+    assert [s["state"] for s in startup.readiness()["stages"]] == ["ready", "pending", "pending"]
+    # Outside preload the same exception is an ordinary stage failure
+    startup.run_all()
+    assert ran == ["frames", "filters"]
+    assert [s["state"] for s in startup.readiness()["stages"]] == ["ready", "failed", "ready"]
+
+
+def test_preload_skips_when_inputs_are_not_prebuilt(startup):
+    ran = []
+    register(startup, ran, "frames")
+    assert startup.preload(lambda: False) == []
+    assert ran == []
+
+
+def test_not_ready_response_reports_failures(startup):
+    register(startup, [], "frames", fail=ValueError("bad input"))
+    register(startup, [], "index")
+    with Flask(__name__).app_context():
+        loading = startup.not_ready_response(["index"])
+        assert loading.status_code == 503 and loading.headers["Retry-After"]
+        assert loading.get_json()["loading"] == ["index"]
+        startup.run_all()
+        startup._status["index"]["state"] = "running"
+        failed = startup.not_ready_response(None)
+    assert failed.status_code == 503 and "Retry-After" not in failed.headers
+    assert failed.get_json()["failed"] == [{"name": "frames", "error": "ValueError: bad input"}]
+    assert failed.get_json()["loading"] == ["index"]
+
+
+def test_mark_ready_recovers_a_failed_stage(startup):
+    ran = []
+    register(startup, ran, "frames")
+    register(startup, ran, "index", fail=ValueError("bad input"))
+    startup.run_all()
+    assert not startup.is_ready() and startup.is_ready("frames")
+    startup.mark_ready(["index"])
+    assert startup.is_ready() and startup.readiness()["stages"][1]["error"] is None
+
+
+def test_swap_marks_its_stages_ready(app, monkeypatch):
+    monkeypatch.setitem(app.startup._status["filter_index"], "state", "failed")
+    monkeypatch.setattr(app, "_precompute_top_candidates", lambda: None)
+    monkeypatch.setattr(app, "_top_candidates_cache", app._top_candidates_cache)
+    monkeypatch.setattr(app, "DATASET_VERSION", app.DATASET_VERSION)
+    client = app.app.test_client()
+    with client.session_transaction() as session:
+        session["user_id"] = 1
+    assert client.get("/readyz").status_code == 503
+    # The admin can still reach the recovery path
+    assert client.get("/api/admin/reload").status_code == 200
+    app._swap_dataset({"ATTORNEY_FILTER_INDEX": app.ATTORNEY_FILTER_INDEX})
+    assert app.startup.is_ready("filter_index")
+    assert client.get("/readyz").status_code == 200
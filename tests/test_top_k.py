@@ -0,0 +1,51 @@
+"""
+Top-K selection: select() against a stable full sort, and the limited
+search scorer against the head of the unlimited one.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from top_k import select
+
+# Few filters, common keywords: each matches a large share of the attorneys
+BROAD_JDS = [
+    "Associate with litigation experience: trial, discovery, depositions, motion practice, "
+    "appeals and commercial disputes.",
+    "Corporate associate — M&A, private equity, capital markets, securities, venture capital, "
+    "joint ventures and general corporate governance.",
+    "Attorney for transactional work: contracts, licensing, compliance, regulatory, finance "
+    "and real estate matters.",
+    "Experienced lawyer: litigation, corporate, tax, intellectual property, employment, "
+    "bankruptcy, antitrust.",
+]
+
+
+def plan_inputs(app, jd):
+    """The frame positions, keywords and patterns SearchPlan scores for jd."""
+    plan = app.SearchPlan(jd, skip_patterns=False)
+    plan.run(25)
+    return plan.positions, plan.keywords, plan.patterns, plan.keyword_index
+
+
+def test_select_matches_stable_sort():
+    rng = np.random.default_rng(3)
+    for _ in range(2000):
+        n = int(rng.integers(0, 300))
+        scores = rng.integers(0, int(rng.integers(1, 40)), n)
+        candidates = np.flatnonzero(rng.random(n) < 0.7)
+        k = int(rng.integers(0, n + 5))
+        full = candidates[np.argsort(-scores[candidates], kind="stable")]
+        assert np.array_equal(select(scores, k, candidates), full[:k])
+        assert np.array_equal(select(scores, None, candidates), full)
+
+
+@pytest.mark.parametrize("jd", BROAD_JDS)
+def test_limited_scorer_is_full_head(app, jd):
+    positions, keywords, patterns, index = plan_inputs(app, jd)
+    args = (app.ATTORNEYS_DF, keywords, patterns)
+    limited, matched = app.score_attorneys_vectorized(*args, keyword_index=index, positions=positions, limit=25)
+    full, matched_full = app.score_attorneys_vectorized(*args, keyword_index=index, positions=positions)
+    assert matched == matched_full
+    pd.testing.assert_frame_equal(limited, full.head(25))
@@ -0,0 +1,44 @@
+"""
+top_k.py — Top-K selection for the search shortlist
+
+score_attorneys_vectorized() (app.py) scores every filtered attorney, but a
+search only shows the best few dozen. Instead of copying every matching
+row into a new frame and sorting all of them, the scorer keeps the scores
+as NumPy arrays, picks the K best with a partition (linear in the number
+of matches) and sorts and materializes only those K rows.
+
+Order is fixed: score descending, equal scores in row order — the same as
+a stable full sort, so the shortlist does not depend on the sort algorithm
+or on how many rows are selected.
+
+Tests in tests/test_top_k.py; `python -m tests.bench top_k` times score +
+shortlist on broad JDs, full sort vs top-k.
+
+Usage:
+    top = top_k.select(scores, 25, candidates)   # indices into scores, best first
+"""
+
+import numpy as np
+
+
+def select(scores, k=None, candidates=None):
+    """Indices of the k highest scores, highest first — equal scores in index order.
+
+    candidates (ascending indices into scores) limits the choice; every
+    index when None. With k None every candidate is returned, sorted.
+    """
+    if candidates is None:
+        candidates = np.arange(len(scores))
+    values = scores[candidates]
+    if k is not None and k < len(candidates):
+        if k <= 0:
+            return candidates[:0]
+        # Everything above the k-th best score, then the earliest of its ties
+        cut = len(values) - k
+        kth = values[np.argpartition(values, cut)[cut]]
+        above = np.flatnonzero(values > kth)
+        ties = np.flatnonzero(values == kth)[:k - len(above)]
+        keep = np.concatenate([above, ties])
+        candidates, values = candidates[keep], values[keep]
+    return candidates[np.lexsort((candidates, -values))]
+